@@ -0,0 +1,33 @@
+from starlette.datastructures import Headers
+from starlette.middleware.gzip import GZipMiddleware, GZipResponder
+from starlette.types import Message, Receive, Scope, Send
+
+from app.api.ndjson import NDJSON_MEDIA_TYPE
+
+
+class CompressionMiddleware(GZipMiddleware):
+    """
+    Gzips responses of at least `minimum_size` bytes for clients that send
+    `Accept-Encoding: gzip`.
+
+    NDJSON streams are left alone: gzip holds output back until it has enough
+    to compress, which would stop records from going out as soon as they are
+    normalized.
+    """
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] == "http" and "gzip" in Headers(scope=scope).get("Accept-Encoding", ""):
+            responder = _StreamAwareResponder(self.app, self.minimum_size, compresslevel=self.compresslevel)
+            await responder(scope, receive, send)
+            return
+        await self.app(scope, receive, send)
+
+
+class _StreamAwareResponder(GZipResponder):
+    async def send_with_gzip(self, message: Message) -> None:
+        await super().send_with_gzip(message)
+        if message["type"] == "http.response.start":
+            media_type = Headers(raw=message["headers"]).get("Content-Type", "")
+            if media_type.startswith(NDJSON_MEDIA_TYPE):
+                # Passed through like a response that is already encoded.
+                self.content_encoding_set = True
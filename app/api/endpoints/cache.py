@@ -0,0 +1,19 @@
+from fastapi import APIRouter
+from app.core.cache import result_cache
+from app.schemas.cache import ResultCacheStatsResponse
+
+router = APIRouter()
+
+@router.get(
+    "/cache/stats",
+    response_model=ResultCacheStatsResponse,
+    summary="Result cache statistics",
+)
+def result_cache_stats():
+    """
+    Returns the hit rate, evictions and memory use of the whole-text result cache
+    of this server process, and its use of the shared cache behind it.
+    """
+    info = result_cache.info()
+    shared = None if info.shared is None else info.shared._asdict()
+    return ResultCacheStatsResponse(**{**info._asdict(), "shared": shared})
@@ -0,0 +1,23 @@
+from fastapi import APIRouter, Response, status
+from app.core.warmup import readiness
+from app.schemas.health import ReadinessResponse
+
+router = APIRouter()
+
+@router.get(
+    "/ready",
+    response_model=ReadinessResponse,
+    responses={503: {"model": ReadinessResponse, "description": "Still warming up, or warmup failed."}},
+    summary="Readiness probe",
+)
+def ready(response: Response):
+    """
+    Answers 200 once every strategy is built and warmed, and 503 until then, so
+    load balancers only route traffic to warm instances.
+    """
+    if readiness.ready:
+        return ReadinessResponse(status="ready", warmup_ms=readiness.warmup_ms)
+    response.status_code = status.HTTP_503_SERVICE_UNAVAILABLE
+    if readiness.error is not None:
+        return ReadinessResponse(status="failed", error=readiness.error)
+    return ReadinessResponse(status="warming_up")
@@ -0,0 +1,131 @@
+from typing import Dict, Iterable, List, Tuple
+
+from fastapi import APIRouter, Response
+
+from app.core.admission import admission
+from app.core.cache import result_cache
+from app.core.executor import get_executor
+from app.core.metrics import CONTENT_TYPE, MetricFamily, Sample, registry
+from app.normalizers.base import HandlerStats
+
+router = APIRouter()
+
+# Documentation of the handler counter for each HandlerStats field.
+HANDLER_METRICS = {
+    "applied": "Texts a handler was applied to.",
+    "skipped": "Texts a handler skipped because its trigger did not occur.",
+    "matches": "Replacements a handler made.",
+    "seconds": "Time spent applying a handler.",
+}
+
+
+def _ratio(hits: int, misses: int) -> float:
+    lookups = hits + misses
+    return hits / lookups if lookups else 0.0
+
+
+@registry.register
+def _result_cache_metrics() -> Iterable[MetricFamily]:
+    info = result_cache.info()
+    yield MetricFamily("normalizer_result_cache_hits_total", "counter", "Result cache hits.", [("", {}, info.hits)])
+    yield MetricFamily("normalizer_result_cache_misses_total", "counter", "Result cache misses.", [("", {}, info.misses)])
+    yield MetricFamily("normalizer_result_cache_evictions_total", "counter",
+                       "Result cache entries evicted to stay within the memory budget.", [("", {}, info.evictions)])
+    yield MetricFamily("normalizer_result_cache_expirations_total", "counter",
+                       "Result cache entries dropped after their TTL.", [("", {}, info.expirations)])
+    yield MetricFamily("normalizer_result_cache_hit_ratio", "gauge",
+                       "Result cache hits per lookup since startup.", [("", {}, info.hit_rate)])
+    yield MetricFamily("normalizer_result_cache_entries", "gauge", "Entries in the result cache.",
+                       [("", {}, info.entries)])
+    yield MetricFamily("normalizer_result_cache_bytes", "gauge", "Estimated memory use of the result cache.",
+                       [("", {}, info.bytes)])
+    if info.shared is not None:
+        shared = info.shared
+        yield MetricFamily("normalizer_shared_cache_hits_total", "counter",
+                           "Result cache misses answered from the shared cache.", [("", {}, shared.hits)])
+        yield MetricFamily("normalizer_shared_cache_misses_total", "counter", "Shared cache misses.",
+                           [("", {}, shared.misses)])
+        yield MetricFamily("normalizer_shared_cache_stores_total", "counter", "Results stored in the shared cache.",
+                           [("", {}, shared.stores)])
+        yield MetricFamily("normalizer_shared_cache_evictions_total", "counter",
+                           "Shared cache entries replaced in a full bucket.", [("", {}, shared.evictions)])
+        yield MetricFamily("normalizer_shared_cache_oversized_total", "counter",
+                           "Results too long for a shared cache slot.", [("", {}, shared.oversized)])
+        yield MetricFamily("normalizer_shared_cache_torn_reads_total", "counter",
+                           "Shared cache slots read while being written, treated as misses.",
+                           [("", {}, shared.torn_reads)])
+
+
+@registry.register
+def _normalizer_metrics() -> Iterable[MetricFamily]:
+    """Handler and number-words cache counters, summed over every process that normalizes."""
+    handlers: Dict[Tuple[str, str], List[float]] = {}
+    hits = misses = evictions = 0
+    for process in get_executor().stats():
+        for lang, stats in process.handlers.items():
+            for name, handler in stats.items():
+                totals = handlers.setdefault((lang, name), [0, 0, 0, 0.0])
+                for i, value in enumerate(handler):
+                    totals[i] += value
+        hits += process.number_words.hits
+        misses += process.number_words.misses
+        evictions += process.number_words.evictions
+
+    for index, field in enumerate(HandlerStats._fields):
+        samples: List[Sample] = [
+            ("", {"lang": lang, "handler": name}, totals[index])
+            for (lang, name), totals in sorted(handlers.items())
+        ]
+        yield MetricFamily(f"normalizer_handler_{field}_total", "counter", HANDLER_METRICS[field], samples)
+
+    yield MetricFamily("normalizer_number_words_cache_hits_total", "counter", "Number-to-words cache hits.",
+                       [("", {}, hits)])
+    yield MetricFamily("normalizer_number_words_cache_misses_total", "counter", "Number-to-words cache misses.",
+                       [("", {}, misses)])
+    yield MetricFamily("normalizer_number_words_cache_evictions_total", "counter",
+                       "Number-to-words cache entries evicted.", [("", {}, evictions)])
+    yield MetricFamily("normalizer_number_words_cache_hit_ratio", "gauge",
+                       "Number-to-words cache hits per lookup since startup.", [("", {}, _ratio(hits, misses))])
+
+
+@registry.register
+def _executor_metrics() -> Iterable[MetricFamily]:
+    executor = get_executor()
+    yield MetricFamily("normalizer_executor_in_flight", "gauge",
+                       "Normalization tasks submitted and not yet finished, running or queued.",
+                       [("", {}, executor.in_flight)])
+    yield MetricFamily("normalizer_executor_workers", "gauge", "Workers the executor normalizes in.",
+                       [("", {}, executor.workers)])
+
+
+
+@registry.register
+def _admission_metrics() -> Iterable[MetricFamily]:
+    info = admission.info()
+    yield MetricFamily("normalizer_admission_limit", "gauge",
+                       "Requests allowed to normalize at once; 0 means no limit.", [("", {}, info.limit)])
+    yield MetricFamily("normalizer_admission_active", "gauge", "Requests holding a normalization slot.",
+                       [("", {}, info.active)])
+    yield MetricFamily("normalizer_admission_queued", "gauge", "Requests waiting for a normalization slot.",
+                       [("", {}, info.queued)])
+    yield MetricFamily("normalizer_admission_admitted_total", "counter", "Requests given a normalization slot.",
+                       [("", {}, info.admitted)])
+    yield MetricFamily("normalizer_requests_shed_total", "counter",
+                       "Requests turned away by rate limits (429) or for overload (503).",
+                       [("", {"reason": reason}, count) for reason, count in info.shed.items()])
+    yield MetricFamily("normalizer_rate_limit_clients", "gauge", "Clients with rate-limit buckets.",
+                       [("", {}, info.clients)])
+
+
+@router.get(
+    "/metrics",
+    response_class=Response,
+    summary="Prometheus metrics",
+    responses={200: {"content": {CONTENT_TYPE: {}}}},
+)
+def metrics():
+    """
+    Returns this server process's request latencies, handler and cache counters,
+    executor load and admission counters in the Prometheus text exposition format.
+    """
+    return Response(registry.render(), media_type=CONTENT_TYPE)
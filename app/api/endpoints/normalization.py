@@ -1,17 +1,129 @@
-from fastapi import APIRouter, HTTPException, status, Path
-from app.core.exceptions import LanguageNotSupportedError
+import asyncio
+import math
+import time
+from contextlib import AsyncExitStack, asynccontextmanager
+from typing import Any, AsyncIterator, Dict, List, Optional, Tuple
+
+from fastapi import APIRouter, HTTPException, Query, Request, WebSocket, WebSocketDisconnect, status, Path
+from pydantic import TypeAdapter, ValidationError
+from starlette.requests import ClientDisconnect, HTTPConnection
+
+from app.api.ndjson import NDJSON_MEDIA_TYPE, NDJSONStreamingResponse, iter_line_batches
+from app.api.responses import FastJSONResponse, dumps
+from app.core.admission import admission
+from app.core.cache import canonicalize
+from app.core.config import settings
+from app.core.exceptions import LanguageNotSupportedError, RateLimitedError, RequestRejectedError
+from app.core.executor import Job, get_executor
+from app.core.metrics import request_duration, size_label
+from app.normalizers.base import HandlerTrace
+from app.normalizers.batch import normalize_batch
 from app.normalizers.factory import normalizer_factory
-from app.schemas.normalization import NormalizationRequest, NormalizationResponse
+from app.schemas.normalization import (
+    BatchNormalizationRequest,
+    BatchNormalizationResponse,
+    HandlerTiming,
+    NormalizationDebug,
+    NormalizationFragment,
+    NormalizationRequest,
+    NormalizationResponse,
+    NormalizedFragment,
+    StreamNormalizationRecord,
+)
 
 router = APIRouter()
 
+_stream_record = TypeAdapter(StreamNormalizationRecord)
+
+
+def _require_language(lang: str) -> None:
+    """Rejects unsupported languages before any work is handed to the executor."""
+    if not normalizer_factory.is_registered(lang):
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail=str(LanguageNotSupportedError(lang)),
+        )
+
+
+def _client(connection: HTTPConnection) -> str:
+    """Tells clients apart for their rate limits: by the configured header, else by address."""
+    header = settings.RATE_LIMIT_CLIENT_HEADER
+    key = connection.headers.get(header) if header else None
+    if key:
+        return key
+    return connection.client.host if connection.client else "unknown"
+
+
+@asynccontextmanager
+async def _admitted(connection: HTTPConnection, chars: int) -> AsyncIterator[None]:
+    """
+    Holds a normalization slot for the block (see `app/core/admission.py`). A
+    client over its rate gets a 429 and an overloaded service a 503, both with
+    a `Retry-After` header.
+    """
+    try:
+        async with admission.admit(_client(connection), chars):
+            yield
+    except RequestRejectedError as e:
+        code = status.HTTP_429_TOO_MANY_REQUESTS if isinstance(e, RateLimitedError) else status.HTTP_503_SERVICE_UNAVAILABLE
+        raise HTTPException(status_code=code, detail=str(e), headers={"Retry-After": str(math.ceil(e.retry_after))})
+
+
+async def _throttle(connection: HTTPConnection, chars: int) -> None:
+    """Keeps a stream of text to the client's character rate."""
+    pause = admission.limiter.throttle(_client(connection), chars)
+    if pause:
+        await asyncio.sleep(pause)
+
+
+def _server_timing(traces: List[HandlerTrace], seconds: float) -> str:
+    """Formats handler traces as a Server-Timing header value, one metric per handler."""
+    metrics = []
+    for trace in traces:
+        if trace.skipped:
+            metrics.append(f'{trace.handler};desc="skipped"')
+        else:
+            metrics.append(
+                f'{trace.handler};dur={trace.seconds * 1000:.3f};'
+                f'desc="{trace.matches} matches, {trace.growth:+d} chars, {trace.conversions} conversions"'
+            )
+    metrics.append(f"total;dur={seconds * 1000:.3f}")
+    return ", ".join(metrics)
+
+
+async def _normalize_traced(lang: str, text: str) -> FastJSONResponse:
+    start = time.perf_counter()
+    normalized_text, traces = await get_executor().normalize_traced(lang, text)
+    seconds = time.perf_counter() - start
+    body = NormalizationResponse(
+        normalized_text=normalized_text,
+        debug=NormalizationDebug(
+            duration_ms=seconds * 1000,
+            handlers=[
+                HandlerTiming(
+                    handler=trace.handler,
+                    skipped=trace.skipped,
+                    duration_ms=trace.seconds * 1000,
+                    matches=trace.matches,
+                    growth=trace.growth,
+                    conversions=trace.conversions,
+                )
+                for trace in traces
+            ],
+        ),
+    )
+    return FastJSONResponse(body.model_dump(), headers={"Server-Timing": _server_timing(traces, seconds)})
+
+
 @router.post(
     "/{lang}/normalize",
     response_model=NormalizationResponse,
+    response_class=FastJSONResponse,
     summary="Normalize text for a specific language",
 )
-def normalize_text(
+async def normalize_text(
     request: NormalizationRequest,
+    http_request: Request,
     lang: str = Path(
         ...,
         min_length=2,
@@ -20,22 +132,236 @@ def normalize_text(
         examples=["sr"],
         description="Two-letter lowercase language code (ISO 639-1)."
     ),
+    trace: bool = Query(
+        False,
+        description="Record each handler's time, matches and growth, returned in a `Server-Timing` header "
+                    "and the `debug` field. Slower, and bypasses the result cache."
+    ),
 ):
     """
     Normalizes the provided text according to the rules for the specified language.
 
     - **lang**: The language code for the normalization rules to apply.
+    - **trace**: Whether to report what each handler of the chain did.
     - **request body**: A JSON object containing the `text` to be normalized.
 
     Returns the normalized text. If the language is not supported,
-    a 404 error is returned.
+    a 404 error is returned; a client over its rate limits gets a 429 and an
+    overloaded service a 503, both with `Retry-After`.
     """
-    try:
-        strategy = normalizer_factory.get_strategy(lang)
-        normalized_text = strategy.normalize(request.text)
-        return NormalizationResponse(normalized_text=normalized_text)
-    except LanguageNotSupportedError as e:
-        raise HTTPException(
-            status_code=status.HTTP_404_NOT_FOUND,
-            detail=str(e),
-        )
\ No newline at end of file
+    _require_language(lang)
+    async with _admitted(http_request, len(request.text)):
+        if trace:
+            return await _normalize_traced(lang, request.text)
+        start = time.perf_counter()
+        normalized_text = await get_executor().normalize(lang, request.text)
+        request_duration.observe(("normalize", lang, size_label(len(request.text))), time.perf_counter() - start)
+    return FastJSONResponse({"normalized_text": normalized_text})
+
+
+@router.post(
+    "/{lang}/normalize/batch",
+    response_model=BatchNormalizationResponse,
+    response_class=FastJSONResponse,
+    summary="Normalize a batch of texts",
+)
+async def normalize_text_batch(
+    request: BatchNormalizationRequest,
+    http_request: Request,
+    lang: str = Path(
+        ...,
+        min_length=2,
+        max_length=2,
+        regex="^[a-z]{2}$",
+        examples=["sr"],
+        description="Default two-letter lowercase language code (ISO 639-1) for the items."
+    ),
+):
+    """
+    Normalizes a list of texts in one request.
+
+    - **lang**: The language code used for items that do not set their own `lang`.
+    - **request body**: A JSON object with `items`, each holding a `text` and an optional `lang`.
+
+    Returns one result per item, in input order. Identical items are normalized
+    only once. An item with an unsupported language gets an `error` instead of
+    failing the whole batch; an unsupported path language returns a 404 error.
+    """
+    _require_language(lang)
+
+    jobs = [(item.get("lang") or lang, item["text"]) for item in request["items"]]
+    chars = sum(len(text) for _, text in jobs)
+    async with _admitted(http_request, chars):
+        start = time.perf_counter()
+        outcomes = await normalize_batch(jobs)
+        request_duration.observe(("batch", lang, size_label(chars)), time.perf_counter() - start)
+    return FastJSONResponse({
+        "results": [
+            {"lang": job_lang, "normalized_text": text, "error": error}
+            for (job_lang, _), (text, error) in zip(jobs, outcomes)
+        ]
+    })
+
+
+async def _normalize_lines(lines: List[Optional[bytes]], default_lang: str) -> Tuple[bytes, int]:
+    """Normalizes the complete lines of one body chunk into NDJSON output, also returning the characters normalized."""
+    records: List[Dict[str, Any]] = []
+    jobs: List[Job] = []
+    pending: List[Dict[str, Any]] = []
+    chars = 0
+    for line in lines:
+        if line is None:
+            records.append({"error": f"Record exceeds {settings.STREAM_MAX_LINE_BYTES} bytes."})
+            continue
+        if not line.strip():
+            continue
+        try:
+            record = _stream_record.validate_json(line)
+        except ValidationError as e:
+            records.append({"error": f"Invalid record: {e.errors(include_url=False)[0]['msg']}"})
+            continue
+        result: Dict[str, Any] = {} if record.get("id") is None else {"id": record["id"]}
+        records.append(result)
+        jobs.append((record.get("lang") or default_lang, record["text"]))
+        pending.append(result)
+
+    if jobs:
+        start = time.perf_counter()
+        outcomes = await get_executor().normalize_many(jobs)
+        chars = sum(len(text) for _, text in jobs)
+        request_duration.observe(("stream", default_lang, size_label(chars)), time.perf_counter() - start)
+        for result, (text, error) in zip(pending, outcomes):
+            if error is None:
+                result["normalized_text"] = text
+            else:
+                result["error"] = error
+    return b"".join(dumps(r) + b"\n" for r in records), chars
+
+
+@router.post(
+    "/{lang}/normalize/stream",
+    response_class=NDJSONStreamingResponse,
+    summary="Normalize a stream of newline-delimited JSON records",
+    openapi_extra={
+        "requestBody": {
+            "required": True,
+            "content": {
+                NDJSON_MEDIA_TYPE: {
+                    "schema": _stream_record.json_schema(),
+                    "example": '{"id": 1, "text": "Cena je 1.500 €."}\n{"id": 2, "text": "5 km", "lang": "en"}\n',
+                }
+            },
+        }
+    },
+)
+async def normalize_text_stream(
+    request: Request,
+    lang: str = Path(
+        ...,
+        min_length=2,
+        max_length=2,
+        regex="^[a-z]{2}$",
+        examples=["sr"],
+        description="Default two-letter lowercase language code (ISO 639-1) for the records."
+    ),
+):
+    """
+    Normalizes newline-delimited JSON records as they arrive.
+
+    - **lang**: The language code used for records that do not set their own `lang`.
+    - **request body**: One JSON object per line with a `text` and optional `lang` and `id`.
+
+    Writes one output line per non-empty input line, in input order, holding
+    `normalized_text` or `error` and the record's `id` if it had one. Records
+    are normalized per received chunk and written before more of the body is
+    read, so memory stays bounded and a slow client slows down the upload.
+    The stream holds one normalization slot until it ends and is paced to the
+    client's character rate. An unsupported path language returns a 404
+    error; a rejected request a 429 or 503, as for single texts.
+    """
+    _require_language(lang)
+    slot = AsyncExitStack()
+    await slot.enter_async_context(_admitted(request, 0))
+
+    async def normalized_records():
+        try:
+            async for lines in iter_line_batches(request.stream(), settings.STREAM_MAX_LINE_BYTES):
+                payload, chars = await _normalize_lines(lines, lang)
+                if payload:
+                    yield payload
+                await _throttle(request, chars)
+        except ClientDisconnect:
+            return
+
+    # Released by the response, which runs even if the body is never iterated.
+    return NDJSONStreamingResponse(normalized_records(), on_close=slot.aclose)
+
+
+@router.websocket("/{lang}/normalize/ws")
+async def normalize_text_ws(
+    websocket: WebSocket,
+    lang: str = Path(
+        ...,
+        min_length=2,
+        max_length=2,
+        regex="^[a-z]{2}$",
+        description="Two-letter lowercase language code (ISO 639-1)."
+    ),
+):
+    """
+    Normalizes text that arrives a few words at a time, such as a language
+    model's output on its way to speech synthesis.
+
+    Each message is a JSON object with the next `text` fragment, and `final`
+    set on the last one of a text. The server replies with the normalized
+    text as soon as it can no longer change: only the end that could still
+    become part of a match ("1.500" before its currency, "2023." before
+    "godine", an unfinished word) is held back until more text arrives.
+    Replies concatenate to the normalization of the whole text. A `final`
+    fragment is always answered, with `final` set and everything held back
+    normalized; the connection then takes the next text.
+
+    A connection counts as one request against the client's request rate, and
+    its text is paced to the client's character rate.
+
+    An invalid message is answered with an `error` and ignored. An unsupported
+    language closes the connection with code 1008, a client over its request
+    rate with code 1013.
+    """
+    if not normalizer_factory.is_registered(lang):
+        await websocket.close(code=status.WS_1008_POLICY_VIOLATION, reason=str(LanguageNotSupportedError(lang)))
+        return
+    reason, _ = admission.limiter.check(_client(websocket), 0)
+    if reason is not None:
+        admission.shed[reason] += 1
+        await websocket.close(code=status.WS_1013_TRY_AGAIN_LATER, reason=str(RateLimitedError(reason, 0)))
+        return
+    await websocket.accept()
+    executor = get_executor()
+    pending = ""
+    while True:
+        try:
+            message = await websocket.receive_text()
+        except WebSocketDisconnect:
+            return
+        try:
+            fragment = NormalizationFragment.model_validate_json(message)
+        except ValidationError as e:
+            reply = NormalizedFragment(error=f"Invalid fragment: {e.errors(include_url=False)[0]['msg']}")
+            await websocket.send_text(reply.model_dump_json(exclude_none=True))
+            continue
+
+        start = time.perf_counter()
+        pending = canonicalize(pending + fragment.text)
+        if fragment.final or len(pending) > settings.STREAM_MAX_PENDING_CHARS:
+            cut = len(pending)
+        else:
+            cut = await executor.stable_cut(lang, pending)
+        stable, pending = pending[:cut], pending[cut:]
+        await _throttle(websocket, len(stable))
+        normalized_text = await executor.normalize(lang, stable) if stable else ""
+        request_duration.observe(("ws", lang, size_label(len(stable))), time.perf_counter() - start)
+
+        if normalized_text or fragment.final:
+            reply = NormalizedFragment(normalized_text=normalized_text, final=fragment.final or None)
+            await websocket.send_text(reply.model_dump_json(exclude_none=True))
@@ -0,0 +1,80 @@
+from typing import Any, AsyncIterator, Awaitable, Callable, List, Optional
+
+from starlette.responses import StreamingResponse
+from starlette.types import Receive, Scope, Send
+
+NDJSON_MEDIA_TYPE = "application/x-ndjson"
+
+
+class NDJSONStreamingResponse(StreamingResponse):
+    """
+    Chunked NDJSON response for endpoints that read the request body while
+    streaming the response.
+
+    StreamingResponse normally waits on `receive` for a disconnect in parallel
+    with streaming, which would steal body chunks from `request.stream()`.
+    Here a disconnect surfaces through the request stream instead, and `send`
+    applies the server's write backpressure to the producing generator.
+
+    `on_close` runs once the response is done with, whether the body was
+    streamed, failed, or never started because the client went away first.
+    """
+    media_type = NDJSON_MEDIA_TYPE
+
+    def __init__(self, content: Any, *args: Any, on_close: Optional[Callable[[], Awaitable[Any]]] = None, **kwargs: Any):
+        super().__init__(content, *args, **kwargs)
+        self.on_close = on_close
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        try:
+            await self.stream_response(send)
+        finally:
+            if self.on_close is not None:
+                await self.on_close()
+        if self.background is not None:
+            await self.background()
+
+
+async def iter_line_batches(
+    chunks: AsyncIterator[bytes], max_line_bytes: int
+) -> AsyncIterator[List[Optional[bytes]]]:
+    """
+    Splits a byte stream into lines, yielding the lines completed by each chunk.
+
+    Only the unfinished tail of the stream is buffered, so memory stays bounded
+    by the chunk size plus `max_line_bytes`. A line longer than `max_line_bytes`
+    is discarded up to its newline and yielded as None.
+
+    Args:
+        chunks: The incoming body chunks.
+        max_line_bytes: The longest accepted line, excluding the newline.
+
+    Returns:
+        An async iterator of line lists, without their trailing newlines.
+    """
+    buffer = bytearray()
+    overflow = False
+    async for chunk in chunks:
+        lines: List[Optional[bytes]] = []
+        start = 0
+        while (end := chunk.find(b"\n", start)) >= 0:
+            if overflow or len(buffer) + end - start > max_line_bytes:
+                lines.append(None)
+            else:
+                buffer += chunk[start:end]
+                lines.append(bytes(buffer))
+            buffer.clear()
+            overflow = False
+            start = end + 1
+        if not overflow:
+            if len(buffer) + len(chunk) - start > max_line_bytes:
+                buffer.clear()
+                overflow = True
+            else:
+                buffer += chunk[start:]
+        if lines:
+            yield lines
+    if overflow:
+        yield [None]
+    elif buffer:
+        yield [bytes(buffer)]
@@ -0,0 +1,32 @@
+"""
+Fast JSON encoding for the normalization endpoints.
+
+Endpoints on the hot path build plain dicts and return a `FastJSONResponse`
+directly, so FastAPI neither validates them against the response model again
+nor converts them through `jsonable_encoder`; the response models only
+document the output. orjson encodes them when it is installed, the standard
+library otherwise.
+"""
+import json
+from typing import Any
+
+from starlette.responses import JSONResponse
+
+try:
+    import orjson
+except ImportError:  # pragma: no cover
+    orjson = None
+
+
+def dumps(content: Any) -> bytes:
+    """Encodes plain JSON data (dicts, lists, strings, numbers, None) as compact UTF-8 JSON."""
+    if orjson is not None:
+        return orjson.dumps(content)
+    return json.dumps(content, ensure_ascii=False, separators=(",", ":")).encode("utf-8")
+
+
+class FastJSONResponse(JSONResponse):
+    """A JSON response encoded with `dumps`."""
+
+    def render(self, content: Any) -> bytes:
+        return dumps(content)
@@ -1,5 +1,6 @@
 from fastapi import APIRouter
-from app.api.endpoints import normalization
+from app.api.endpoints import cache, normalization
 
 api_router = APIRouter()
-api_router.include_router(normalization.router, tags=["Normalization"])
\ No newline at end of file
+api_router.include_router(normalization.router, tags=["Normalization"])
+api_router.include_router(cache.router, tags=["Cache"])
\ No newline at end of file
@@ -0,0 +1,332 @@
+"""
+Offline bulk normalization of large corpora, without the HTTP service.
+
+    normalize-corpus sr corpus.txt normalized.txt
+    normalize-corpus en data.jsonl out.jsonl --format jsonl --field title --field body
+    normalize-corpus de table.csv out.csv --format csv --field text --workers 8
+
+The input is memory-mapped and cut into batches of whole records by byte
+offset; workers map the file themselves, so only offsets and results cross
+process boundaries. Results are written in input order. After every batch the
+output is flushed and a checkpoint (`<output>.checkpoint`) records how far
+input and output got, so an interrupted job started again with the same
+arguments resumes where it stopped. The checkpoint is removed on success.
+"""
+import argparse
+import csv
+import io
+import json
+import logging
+import mmap
+import multiprocessing
+import os
+import sys
+import time
+from pathlib import Path
+from typing import Any, Dict, Iterator, List, NamedTuple, Optional, Tuple
+
+from app.core.cache import canonicalize
+from app.core.config import settings
+from app.normalizers.base import NormalizerStrategy
+from app.normalizers.factory import BUILTIN_STRATEGIES, normalizer_factory
+from app.normalizers.ruleset import lexicon_version, source_version
+FORMATS = ("txt", "jsonl", "csv")
+CHECKPOINT_SUFFIX = ".checkpoint"
+
+
+class Job(NamedTuple):
+    """What a worker needs to normalize batches of the input file."""
+    lang: str
+    engine: Optional[str]
+    input: str
+    format: str
+    fields: Tuple[str, ...]
+    # The CSV header row, which every batch's rows are read against.
+    header: Optional[Tuple[str, ...]]
+
+
+class BatchResult(NamedTuple):
+    # Input offset just past the batch.
+    end: int
+    output: bytes
+    records: int
+    # Records left as they were because they could not be parsed.
+    skipped: int
+
+
+# Set in each worker by its initializer.
+_job: Optional[Job] = None
+_strategy: Optional[NormalizerStrategy] = None
+_input: Optional[mmap.mmap] = None
+
+
+def _open_mmap(path: str) -> mmap.mmap:
+    with open(path, "rb") as f:
+        return mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+
+
+def _init_worker(job: Job) -> None:
+    global _job, _strategy, _input
+    # Handlers log every match they cannot convert, which would swamp the output.
+    logging.disable(logging.WARNING)
+    _job = job
+    normalizer_factory.register(job.lang, BUILTIN_STRATEGIES[job.lang])
+    _strategy = normalizer_factory.strategy_class(job.lang)(engine=job.engine)
+    _input = _open_mmap(job.input)
+
+
+def _normalize(text: str) -> str:
+    return _strategy.normalize(canonicalize(text))
+
+
+def _split_lines(data: str) -> Tuple[List[str], str]:
+    """Splits text at "\n" into lines (keeping any "\r") and the unterminated rest."""
+    lines = data.split("\n")
+    return lines[:-1], lines[-1]
+
+
+def _normalize_txt(data: str) -> Tuple[str, int, int]:
+    lines, rest = _split_lines(data)
+    out = []
+    for line in lines + [rest]:
+        cr = "\r" if line.endswith("\r") else ""
+        body = line[:-1] if cr else line
+        out.append(_normalize(body) + cr if body else line)
+    return "\n".join(out), len(lines) + bool(rest), 0
+
+
+def _normalize_jsonl(data: str) -> Tuple[str, int, int]:
+    lines, rest = _split_lines(data)
+    out = []
+    skipped = 0
+    for line in lines + [rest]:
+        if not line.strip():
+            out.append(line)
+            continue
+        try:
+            record = json.loads(line)
+        except json.JSONDecodeError:
+            out.append(line)
+            skipped += 1
+            continue
+        if isinstance(record, dict):
+            for field in _job.fields:
+                if isinstance(record.get(field), str):
+                    record[field] = _normalize(record[field])
+        out.append(json.dumps(record, ensure_ascii=False) + ("\r" if line.endswith("\r") else ""))
+    return "\n".join(out), len(lines) + bool(rest.strip()), skipped
+
+
+def _normalize_csv(data: str) -> Tuple[str, int, int]:
+    columns = [i for i, name in enumerate(_job.header) if name in _job.fields]
+    out = io.StringIO()
+    writer = csv.writer(out, lineterminator="\n")
+    records = 0
+    for row in csv.reader(io.StringIO(data, newline="")):
+        for i in columns:
+            if i < len(row):
+                row[i] = _normalize(row[i])
+        writer.writerow(row)
+        records += 1
+    return out.getvalue(), records, 0
+
+
+_NORMALIZERS = {"txt": _normalize_txt, "jsonl": _normalize_jsonl, "csv": _normalize_csv}
+
+
+def _normalize_batch(span: Tuple[int, int]) -> BatchResult:
+    start, end = span
+    text, records, skipped = _NORMALIZERS[_job.format](_input[start:end].decode("utf-8"))
+    return BatchResult(end, text.encode("utf-8"), records, skipped)
+
+
+def _record_end(data: mmap.mmap, start: int, pos: int, csv_quotes: bool) -> int:
+    """
+    The offset just past the first record boundary at or after `pos`, for
+    records starting at `start`. A CSV record only ends at a line break outside
+    quotes, i.e. after an even number of quote characters since `start`.
+    """
+    quotes = data[start:pos].count(b'"') if csv_quotes else 0
+    while True:
+        newline = data.find(b"\n", pos)
+        if newline < 0:
+            return len(data)
+        if csv_quotes:
+            quotes += data[pos:newline].count(b'"')
+            if quotes % 2:
+                pos = newline + 1
+                continue
+        return newline + 1
+
+
+def iter_batches(data: mmap.mmap, start: int, batch_bytes: int, csv_quotes: bool) -> Iterator[Tuple[int, int]]:
+    """Yields (start, end) byte spans of about `batch_bytes` that end on a record boundary."""
+    while start < len(data):
+        end = _record_end(data, start, min(start + batch_bytes, len(data)), csv_quotes)
+        yield start, end
+        start = end
+
+
+class Checkpoint(NamedTuple):
+    """How far a job got; only valid for the same job, input file and ruleset."""
+    fingerprint: Dict[str, Any]
+    input_offset: int
+    output_bytes: int
+    records: int
+    skipped: int
+
+    @classmethod
+    def load(cls, path: Path) -> Optional["Checkpoint"]:
+        try:
+            return cls(**json.loads(path.read_text(encoding="utf-8")))
+        except FileNotFoundError:
+            return None
+
+    def save(self, path: Path) -> None:
+        tmp = path.with_name(path.name + ".tmp")
+        tmp.write_text(json.dumps(self._asdict()), encoding="utf-8")
+        os.replace(tmp, path)
+
+
+def _fingerprint(job: Job) -> Dict[str, Any]:
+    stat = os.stat(job.input)
+    # Round-tripped through JSON so it compares equal to a loaded checkpoint's.
+    return json.loads(json.dumps({
+        **job._asdict(),
+        # What the workers run with when the job does not choose.
+        "engine": job.engine or settings.NORMALIZER_ENGINE,
+        "lexicon": lexicon_version(),
+        "input": os.path.abspath(job.input),
+        "input_size": stat.st_size,
+        "input_mtime_ns": stat.st_mtime_ns,
+        "ruleset": source_version(normalizer_factory.package_path(job.lang)),
+    }))
+
+
+def _read_header(data: mmap.mmap) -> Tuple[Tuple[str, ...], int]:
+    """Returns the CSV header row and the offset of the first data row."""
+    end = _record_end(data, 0, 0, csv_quotes=True)
+    header = next(csv.reader(io.StringIO(data[:end].decode("utf-8-sig"), newline="")), [])
+    return tuple(header), end
+
+
+def run(job: Job, output: Path, workers: int, batch_bytes: int, restart: bool = False) -> Checkpoint:
+    """
+    Normalizes the job's input into `output`, resuming from a matching checkpoint.
+
+    Returns:
+        The final counters.
+
+    Raises:
+        ValueError: If a checkpoint exists for a different job, input file or
+            ruleset, or a CSV field is not in the header.
+    """
+    checkpoint_path = output.with_name(output.name + CHECKPOINT_SUFFIX)
+    normalizer_factory.register(job.lang, BUILTIN_STRATEGIES[job.lang])
+    data = _open_mmap(job.input)
+    start = 0
+    header_bytes = b""
+    if job.format == "csv":
+        header, start = _read_header(data)
+        missing = set(job.fields) - set(header)
+        if missing:
+            raise ValueError(f"CSV header has no column {', '.join(sorted(missing))}.")
+        job = job._replace(header=header)
+        header_bytes = data[:start]
+
+    fingerprint = _fingerprint(job)
+    checkpoint = None if restart else Checkpoint.load(checkpoint_path)
+    if checkpoint is not None and checkpoint.fingerprint != fingerprint:
+        raise ValueError(
+            f"{checkpoint_path} belongs to a different job, input or ruleset; "
+            f"use --restart to discard it."
+        )
+    if checkpoint is None:
+        checkpoint = Checkpoint(fingerprint, start, 0, 0, 0)
+        with open(output, "wb") as f:
+            f.write(header_bytes)
+        checkpoint = checkpoint._replace(output_bytes=len(header_bytes))
+        checkpoint.save(checkpoint_path)
+    elif not output.exists():
+        raise ValueError(f"{output} is missing; use --restart to start over.")
+    elif checkpoint.input_offset > start:
+        print(f"Resuming at {checkpoint.input_offset / max(len(data), 1):.0%} of the input.", file=sys.stderr)
+
+    batches = iter_batches(data, checkpoint.input_offset, batch_bytes, job.format == "csv")
+    started = time.monotonic()
+    with open(output, "r+b") as out:
+        # Drop whatever was written after the last checkpoint.
+        out.truncate(checkpoint.output_bytes)
+        out.seek(checkpoint.output_bytes)
+        if workers > 1:
+            context = multiprocessing.get_context("spawn")
+            with context.Pool(workers, initializer=_init_worker, initargs=(job,)) as pool:
+                checkpoint = _write_results(
+                    pool.imap(_normalize_batch, batches), out, checkpoint, checkpoint_path, len(data), started
+                )
+        else:
+            _init_worker(job)
+            checkpoint = _write_results(
+                map(_normalize_batch, batches), out, checkpoint, checkpoint_path, len(data), started
+            )
+    checkpoint_path.unlink()
+    return checkpoint
+
+
+def _write_results(
+        results: Iterator[BatchResult],
+        out: Any,
+        checkpoint: Checkpoint,
+        checkpoint_path: Path,
+        total_bytes: int,
+        started: float,
+) -> Checkpoint:
+    for result in results:
+        out.write(result.output)
+        out.flush()
+        os.fsync(out.fileno())
+        checkpoint = checkpoint._replace(
+            input_offset=result.end,
+            output_bytes=out.tell(),
+            records=checkpoint.records + result.records,
+            skipped=checkpoint.skipped + result.skipped,
+        )
+        checkpoint.save(checkpoint_path)
+        elapsed = time.monotonic() - started
+        print(
+            f"\r{checkpoint.input_offset / max(total_bytes, 1):6.1%}  {checkpoint.records} records  {elapsed:.0f} s",
+            end="", file=sys.stderr,
+        )
+    print(file=sys.stderr)
+    return checkpoint
+
+
+def main(argv: Optional[List[str]] = None) -> None:
+    parser = argparse.ArgumentParser(description="Normalize a large corpus file offline.")
+    parser.add_argument("lang", choices=sorted(BUILTIN_STRATEGIES), help="Language of the corpus.")
+    parser.add_argument("input", type=Path, help="UTF-8 input file.")
+    parser.add_argument("output", type=Path, help="Where to write the normalized corpus.")
+    parser.add_argument("--format", choices=FORMATS, default="txt",
+                        help="txt: one text per line; jsonl: one JSON object per line; csv: with a header row.")
+    parser.add_argument("--field", action="append", dest="fields",
+                        help="JSONL key or CSV column to normalize (repeatable; default: text).")
+    parser.add_argument("--workers", type=int, default=os.cpu_count() or 1, help="Worker processes.")
+    parser.add_argument("--batch-bytes", type=int, default=1 << 20, help="Input bytes per batch.")
+    parser.add_argument("--engine", help="Normalizer engine; defaults to NORMALIZER_ENGINE.")
+    parser.add_argument("--restart", action="store_true", help="Ignore an existing checkpoint and start over.")
+    args = parser.parse_args(argv)
+
+    if args.input.stat().st_size == 0:
+        args.output.write_bytes(b"")
+        return
+    job = Job(args.lang, args.engine, str(args.input), args.format, tuple(args.fields or ["text"]), None)
+    try:
+        result = run(job, args.output, max(args.workers, 1), args.batch_bytes, args.restart)
+    except ValueError as e:
+        parser.exit(2, f"error: {e}\n")
+    print(f"Wrote {result.records} records to {args.output}"
+          f"{f' ({result.skipped} left unchanged: invalid JSON)' if result.skipped else ''}.", file=sys.stderr)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,247 @@
+"""
+Admission control in front of normalization.
+
+Each client has token buckets for requests and for characters, since one long
+text costs far more than a short one; a client over either rate gets a 429.
+Admitted requests then take one of a limited number of normalization slots,
+waiting in a bounded queue for at most a timeout; when the queue is full or
+the wait runs out, the request is shed with a 503 instead of piling up behind
+the executor until the client gives up and retries.
+
+Everything here runs on the event loop of one server process, so it is not
+locked, and with several server processes each one applies the limits itself.
+"""
+import asyncio
+import time
+from collections import OrderedDict, deque
+from contextlib import asynccontextmanager
+from typing import AsyncIterator, Deque, Dict, NamedTuple, Optional, Tuple
+
+from app.core.config import settings
+from app.core.exceptions import RateLimitedError, ServiceOverloadedError
+
+# Reasons a request is turned away, the `reason` label of the shed counter.
+SHED_REASONS = ("queue_full", "queue_timeout", "requests_rate", "chars_rate")
+
+
+class TokenBucket:
+    """Holds up to `capacity` tokens and gains `rate` tokens per second."""
+    __slots__ = ("rate", "capacity", "tokens", "updated")
+
+    def __init__(self, rate: float, capacity: float, now: float):
+        self.rate = rate
+        self.capacity = capacity
+        self.tokens = capacity
+        self.updated = now
+
+    def wait_time(self, cost: float, now: float) -> float:
+        """
+        Seconds until `cost` tokens are available, 0 if they are now. A cost
+        above the capacity counts as the capacity, so it passes on a full bucket.
+        """
+        self.tokens = min(self.capacity, self.tokens + (now - self.updated) * self.rate)
+        self.updated = now
+        missing = min(cost, self.capacity) - self.tokens
+        return missing / self.rate if missing > 0 else 0.0
+
+    def take(self, cost: float) -> None:
+        """Takes tokens, going into debt if there are not enough; call `wait_time` first."""
+        self.tokens -= min(cost, self.capacity)
+
+
+class RateLimiter:
+    """
+    Per-client request and character buckets; a rate of 0 disables that bucket.
+    The buckets of the least recently seen clients are dropped beyond
+    `max_clients`; a dropped client starts again with full buckets.
+    """
+
+    def __init__(
+        self,
+        requests_per_second: float = settings.RATE_LIMIT_REQUESTS_PER_SECOND,
+        requests_burst: int = settings.RATE_LIMIT_REQUESTS_BURST,
+        chars_per_second: float = settings.RATE_LIMIT_CHARS_PER_SECOND,
+        chars_burst: int = settings.RATE_LIMIT_CHARS_BURST,
+        max_clients: int = 10_000,
+    ):
+        self.requests_per_second = requests_per_second
+        self.requests_burst = requests_burst
+        self.chars_per_second = chars_per_second
+        self.chars_burst = chars_burst
+        self.max_clients = max_clients
+        self.enabled = requests_per_second > 0 or chars_per_second > 0
+        self._clients: "OrderedDict[str, Tuple[Optional[TokenBucket], Optional[TokenBucket]]]" = OrderedDict()
+
+    def _buckets(self, client: str, now: float) -> Tuple[Optional[TokenBucket], Optional[TokenBucket]]:
+        buckets = self._clients.get(client)
+        if buckets is None:
+            buckets = self._clients[client] = (
+                TokenBucket(self.requests_per_second, self.requests_burst, now) if self.requests_per_second > 0 else None,
+                TokenBucket(self.chars_per_second, self.chars_burst, now) if self.chars_per_second > 0 else None,
+            )
+            while len(self._clients) > self.max_clients:
+                self._clients.popitem(last=False)
+        else:
+            self._clients.move_to_end(client)
+        return buckets
+
+    def check(self, client: str, chars: int) -> Tuple[Optional[str], float]:
+        """
+        Charges one request of `chars` characters to the client if both its
+        buckets allow it, and charges nothing otherwise.
+
+        Returns:
+            None and 0, or the reason ("requests_rate" or "chars_rate") and the
+            seconds until the client may try again.
+        """
+        if not self.enabled:
+            return None, 0.0
+        now = time.monotonic()
+        requests, characters = self._buckets(client, now)
+        if requests is not None:
+            wait = requests.wait_time(1, now)
+            if wait:
+                return "requests_rate", wait
+        if characters is not None:
+            wait = characters.wait_time(chars, now)
+            if wait:
+                return "chars_rate", wait
+        if requests is not None:
+            requests.take(1)
+        if characters is not None:
+            characters.take(chars)
+        return None, 0.0
+
+    def throttle(self, client: str, chars: int) -> float:
+        """
+        Charges characters of a stream to the client whatever its balance, and
+        returns how long to pause so that the stream keeps to the client's rate.
+        """
+        if self.chars_per_second <= 0:
+            return 0.0
+        now = time.monotonic()
+        characters = self._buckets(client, now)[1]
+        characters.wait_time(0, now)
+        characters.take(chars)
+        return max(0.0, -characters.tokens / characters.rate)
+
+    def clients(self) -> int:
+        """The number of clients with buckets."""
+        return len(self._clients)
+
+
+class AdmissionInfo(NamedTuple):
+    """Load and shedding counters of the admission controller."""
+    limit: int
+    active: int
+    queued: int
+    admitted: int
+    shed: Dict[str, int]
+    clients: int
+
+
+class AdmissionController:
+    """
+    Lets at most `max_concurrent` requests normalize at once (0 means no limit).
+    Up to `max_queue` more wait for a slot in arrival order, each for at most
+    `queue_timeout` seconds; any others are shed at once.
+    """
+
+    def __init__(
+        self,
+        max_concurrent: int = settings.ADMISSION_MAX_CONCURRENT,
+        max_queue: int = settings.ADMISSION_MAX_QUEUE,
+        queue_timeout: float = settings.ADMISSION_QUEUE_TIMEOUT,
+        retry_after: float = settings.ADMISSION_RETRY_AFTER,
+        limiter: Optional[RateLimiter] = None,
+    ):
+        self.max_concurrent = max_concurrent
+        self.max_queue = max_queue
+        self.queue_timeout = queue_timeout
+        self.retry_after = retry_after
+        self.limiter = limiter or RateLimiter()
+        self.active = 0
+        self.admitted = 0
+        self.shed = dict.fromkeys(SHED_REASONS, 0)
+        self._waiters: Deque[asyncio.Future] = deque()
+
+    def _reject(self, reason: str) -> ServiceOverloadedError:
+        self.shed[reason] += 1
+        return ServiceOverloadedError(reason, self.retry_after)
+
+    async def acquire(self) -> None:
+        """
+        Takes a normalization slot, waiting in the queue if none is free.
+
+        Raises:
+            ServiceOverloadedError: If the queue is full or the wait timed out.
+        """
+        if not self.max_concurrent or (self.active < self.max_concurrent and not self._waiters):
+            self.active += 1
+            self.admitted += 1
+            return
+        if len(self._waiters) >= self.max_queue:
+            raise self._reject("queue_full")
+        waiter = asyncio.get_running_loop().create_future()
+        self._waiters.append(waiter)
+        try:
+            await asyncio.wait_for(waiter, self.queue_timeout)
+        except asyncio.TimeoutError:
+            raise self._reject("queue_timeout") from None
+        except asyncio.CancelledError:
+            # The slot may have been handed over just as the request was cancelled.
+            if waiter.done() and not waiter.cancelled():
+                self.release()
+            raise
+        finally:
+            if waiter in self._waiters:
+                self._waiters.remove(waiter)
+        # `release` handed its slot over without giving it up.
+        self.admitted += 1
+
+    def release(self) -> None:
+        """Gives a slot back, handing it to the longest waiting request if any."""
+        while self._waiters:
+            waiter = self._waiters.popleft()
+            if not waiter.done():
+                waiter.set_result(None)
+                return
+        self.active -= 1
+
+    @asynccontextmanager
+    async def admit(self, client: str, chars: int) -> AsyncIterator[None]:
+        """
+        Holds a normalization slot for the block, after charging the request
+        to the client's rate limits.
+
+        Args:
+            client: Tells the client apart for its rate limits.
+            chars: The characters the request asks to normalize.
+
+        Raises:
+            RateLimitedError: If the client is over its request or character rate.
+            ServiceOverloadedError: If no slot became free in time.
+        """
+        reason, wait = self.limiter.check(client, chars)
+        if reason is not None:
+            self.shed[reason] += 1
+            raise RateLimitedError(reason, wait)
+        await self.acquire()
+        try:
+            yield
+        finally:
+            self.release()
+
+    def info(self) -> AdmissionInfo:
+        """Returns the current load and the shedding counters."""
+        return AdmissionInfo(
+            limit=self.max_concurrent,
+            active=self.active,
+            queued=len(self._waiters),
+            admitted=self.admitted,
+            shed=dict(self.shed),
+            clients=self.limiter.clients(),
+        )
+
+
+admission = AdmissionController()
@@ -0,0 +1,153 @@
+import sys
+import threading
+import time
+import unicodedata
+from collections import OrderedDict
+from typing import NamedTuple, Optional, Tuple
+
+from app.core.config import settings
+from app.core.shared_cache import SharedCacheInfo, SharedResultCache
+from app.normalizers.ruleset import ruleset_version
+
+# Rough per-entry cost of the key tuple, the ordered-dict node and the bookkeeping.
+ENTRY_OVERHEAD_BYTES = 200
+
+CacheKey = Tuple[str, str, str]
+
+
+class ResultCacheInfo(NamedTuple):
+    """Counters and memory use of the result cache."""
+    enabled: bool
+    hits: int
+    misses: int
+    hit_rate: float
+    evictions: int
+    expirations: int
+    entries: int
+    bytes: int
+    max_bytes: int
+    shared: Optional[SharedCacheInfo] = None
+
+
+def canonicalize(text: str) -> str:
+    """
+    Brings text to the form it is normalized and cached in (Unicode NFC), so
+    composed and decomposed spellings of the same text share one entry.
+    """
+    return text if unicodedata.is_normalized("NFC", text) else unicodedata.normalize("NFC", text)
+
+
+class ResultCache:
+    """
+    In-process LRU cache of whole-text normalization results, bounded by the
+    estimated bytes of its entries and optionally expiring them after a TTL.
+    Keys are (lang, ruleset version, canonical text), so a changed ruleset never
+    serves results produced by the old one.
+
+    With a `shared` cache (see `app/core/shared_cache.py`), misses are looked
+    up there and results are stored in both, so processes on one host answer
+    each other's texts.
+    """
+
+    def __init__(
+        self,
+        max_bytes: int = settings.RESULT_CACHE_MAX_BYTES,
+        ttl: float = settings.RESULT_CACHE_TTL_SECONDS,
+        max_entry_bytes: int = settings.RESULT_CACHE_MAX_ENTRY_BYTES,
+        enabled: bool = settings.RESULT_CACHE_ENABLED,
+        shared: Optional[SharedResultCache] = None,
+    ):
+        self.max_bytes = max_bytes
+        self.ttl = ttl
+        self.max_entry_bytes = max_entry_bytes
+        self.enabled = enabled and max_bytes > 0
+        self.shared = shared
+        # key -> (result, size, expires_at)
+        self._entries: "OrderedDict[CacheKey, Tuple[str, int, float]]" = OrderedDict()
+        self._lock = threading.Lock()
+        self._bytes = 0
+        self._hits = 0
+        self._misses = 0
+        self._evictions = 0
+        self._expirations = 0
+
+    def _key(self, lang: str, text: str) -> CacheKey:
+        return lang, ruleset_version(lang), text
+
+    def get(self, lang: str, text: str) -> Optional[str]:
+        """Returns the cached result for canonical text, or None on a miss."""
+        if not self.enabled:
+            return None
+        key = self._key(lang, text)
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is not None and self.ttl > 0 and entry[2] <= time.monotonic():
+                self._discard(key)
+                self._expirations += 1
+                entry = None
+            if entry is not None:
+                self._entries.move_to_end(key)
+                self._hits += 1
+                return entry[0]
+            self._misses += 1
+        if self.shared is None:
+            return None
+        result = self.shared.get(SharedResultCache.key(*key))
+        if result is not None:
+            self._store(key, result)
+        return result
+
+    def put(self, lang: str, text: str, result: str) -> None:
+        """Stores a result, evicting least recently used entries to stay within budget."""
+        if not self.enabled:
+            return
+        key = self._key(lang, text)
+        self._store(key, result)
+        if self.shared is not None:
+            self.shared.put(SharedResultCache.key(*key), result)
+
+    def _store(self, key: CacheKey, result: str) -> None:
+        """Stores a result in this process only."""
+        size = sys.getsizeof(key[2]) + sys.getsizeof(result) + ENTRY_OVERHEAD_BYTES
+        if size > self.max_entry_bytes:
+            return
+        expires_at = time.monotonic() + self.ttl if self.ttl > 0 else 0.0
+        with self._lock:
+            if key in self._entries:
+                self._discard(key)
+            self._entries[key] = (result, size, expires_at)
+            self._bytes += size
+            while self._bytes > self.max_bytes:
+                self._discard(next(iter(self._entries)))
+                self._evictions += 1
+
+    def _discard(self, key: CacheKey) -> None:
+        _, size, _ = self._entries.pop(key)
+        self._bytes -= size
+
+    def clear(self) -> None:
+        """Drops all entries and resets the counters."""
+        with self._lock:
+            self._entries.clear()
+            self._bytes = 0
+            self._hits = self._misses = self._evictions = self._expirations = 0
+
+    def info(self) -> ResultCacheInfo:
+        """Returns the cache's counters and memory use."""
+        with self._lock:
+            lookups = self._hits + self._misses
+            return ResultCacheInfo(
+                enabled=self.enabled,
+                hits=self._hits,
+                misses=self._misses,
+                hit_rate=self._hits / lookups if lookups else 0.0,
+                evictions=self._evictions,
+                expirations=self._expirations,
+                entries=len(self._entries),
+                bytes=self._bytes,
+                max_bytes=self.max_bytes,
+                shared=None if self.shared is None else self.shared.info(),
+            )
+
+
+result_cache = ResultCache()
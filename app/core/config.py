@@ -1,3 +1,5 @@
+from typing import Optional
+
 from pydantic_settings import BaseSettings, SettingsConfigDict
 
 
@@ -6,6 +8,104 @@ class Settings(BaseSettings):
     APP_NAME: str = "Text Normalization Service"
     API_V1_PREFIX: str = "/api/v1"
 
+    # How strategies run their handler chain: "chain" (one pass per handler),
+    # "single_pass" (the chain, searching each shared trigger once) or "spans" (handlers
+    # claim spans of the original text, joined into the result once).
+    NORMALIZER_ENGINE: str = "chain"
+
+    # Upper bound on memoized number-to-words conversions, shared by all languages.
+    NUMBER_WORDS_CACHE_SIZE: int = 8192
+
+    # Where endpoints run normalization: "inline" (on the event loop), "thread"
+    # (Starlette's threadpool) or "process" (a pool of worker processes).
+    # EXECUTOR_WORKERS of 0 means one worker per CPU core; a positive
+    # EXECUTOR_MAX_TASKS_PER_CHILD recycles workers after that many tasks
+    # (Python 3.11+, not with the "fork" start method). "process" is opt-in:
+    # every pool worker loads the strategies again, and with "spawn" a script
+    # that starts the app needs an `if __name__ == "__main__"` guard.
+    EXECUTOR_BACKEND: str = "thread"
+    EXECUTOR_WORKERS: int = 0
+    EXECUTOR_MAX_TASKS_PER_CHILD: int = 0
+    EXECUTOR_START_METHOD: str = "spawn"
+
+    # Batch endpoint: maximum items per request, and the number of distinct
+    # items from which work is split across executor workers.
+    BATCH_MAX_ITEMS: int = 10000
+    BATCH_PARALLEL_MIN_ITEMS: int = 256
+
+    # Texts of at least CHUNK_MIN_CHARS characters are cut at safe sentence or
+    # paragraph breaks into chunks of at least CHUNK_TARGET_CHARS, normalized in
+    # parallel when the executor has more than one worker (0 disables it).
+    CHUNK_MIN_CHARS: int = 32_768
+    CHUNK_TARGET_CHARS: int = 8_192
+
+    # Whole-text result cache in front of the executor: total budget in bytes,
+    # entry lifetime in seconds (0 keeps entries until evicted) and the largest
+    # entry worth caching.
+    RESULT_CACHE_ENABLED: bool = True
+    RESULT_CACHE_MAX_BYTES: int = 64 * 1024 * 1024
+    RESULT_CACHE_TTL_SECONDS: float = 3600.0
+    RESULT_CACHE_MAX_ENTRY_BYTES: int = 64 * 1024
+
+    # Result cache shared by the server processes of a host, behind the
+    # in-process one (see app/core/shared_cache.py): SHARED_CACHE_MAX_BYTES of
+    # SHARED_CACHE_SLOT_BYTES slots (0 disables it), memory-mapped from
+    # SHARED_CACHE_PATH (e.g. under /dev/shm) by every process that sets it.
+    # Without a path, the workers of the preforking server share anonymous
+    # memory, and other servers have no shared cache.
+    SHARED_CACHE_MAX_BYTES: int = 128 * 1024 * 1024
+    SHARED_CACHE_SLOT_BYTES: int = 1024
+    SHARED_CACHE_PATH: Optional[str] = None
+
+    # Prebuilt brand gazetteer index to memory-map instead of loading
+    # sr/data/brands.json (see app/normalizers/gazetteer.py).
+    BRAND_GAZETTEER_PATH: Optional[str] = None
+
+    # Longest accepted NDJSON line on the streaming endpoint, in bytes.
+    STREAM_MAX_LINE_BYTES: int = 1_048_576
+
+    # Most characters the WebSocket endpoint holds back while waiting for the
+    # rest of a match; beyond that the held-back text is normalized as it is.
+    STREAM_MAX_PENDING_CHARS: int = 4096
+
+    # Admission control: at most ADMISSION_MAX_CONCURRENT requests normalize
+    # at once (0 disables it), up to ADMISSION_MAX_QUEUE more wait for at most
+    # ADMISSION_QUEUE_TIMEOUT seconds, and the rest get a 503 with a
+    # Retry-After of ADMISSION_RETRY_AFTER seconds.
+    ADMISSION_MAX_CONCURRENT: int = 64
+    ADMISSION_MAX_QUEUE: int = 256
+    ADMISSION_QUEUE_TIMEOUT: float = 5.0
+    ADMISSION_RETRY_AFTER: float = 1.0
+
+    # Per-client token buckets (a rate of 0 disables one): requests and input
+    # characters per second, with bursts of up to *_BURST. Clients are told
+    # apart by the RATE_LIMIT_CLIENT_HEADER request header (e.g. an API key),
+    # or by their address if it is unset or missing.
+    RATE_LIMIT_REQUESTS_PER_SECOND: float = 0.0
+    RATE_LIMIT_REQUESTS_BURST: int = 20
+    RATE_LIMIT_CHARS_PER_SECOND: float = 0.0
+    RATE_LIMIT_CHARS_BURST: int = 1_000_000
+    RATE_LIMIT_CLIENT_HEADER: Optional[str] = None
+
+    # Responses of at least COMPRESSION_MIN_BYTES bytes are gzipped at
+    # COMPRESSION_LEVEL (1-9) for clients that accept it (0 disables it).
+    COMPRESSION_MIN_BYTES: int = 1024
+    COMPRESSION_LEVEL: int = 6
+
+    # Preforking server (python -m app.server): the master builds every
+    # strategy and forks SERVER_WORKERS workers (0 means one per CPU core) that
+    # share it copy-on-write; SERVER_CPU_AFFINITY pins each worker to a core.
+    SERVER_HOST: str = "0.0.0.0"
+    SERVER_PORT: int = 8000
+    SERVER_WORKERS: int = 0
+    SERVER_CPU_AFFINITY: bool = False
+
+    # Build and warm every strategy at startup; /ready fails until done.
+    # WARMUP_PARALLEL warms the languages concurrently (thread/inline backends;
+    # process workers always start concurrently).
+    WARMUP_ENABLED: bool = True
+    WARMUP_PARALLEL: bool = True
+
     model_config = SettingsConfigDict(env_file=".env", env_file_encoding="utf-8")
 
 
@@ -2,4 +2,23 @@ class LanguageNotSupportedError(Exception):
     """Raised when a normalizer strategy for a given language is not found."""
     def __init__(self, lang_code: str):
         self.lang_code = lang_code
-        super().__init__(f"Language '{lang_code}' is not supported.")
\ No newline at end of file
+        super().__init__(f"Language '{lang_code}' is not supported.")
+
+class RequestRejectedError(Exception):
+    """Raised when admission control turns a request away."""
+    def __init__(self, reason: str, retry_after: float, message: str):
+        self.reason = reason
+        self.retry_after = retry_after
+        super().__init__(message)
+
+
+class RateLimitedError(RequestRejectedError):
+    """Raised when a client is over its request or character rate."""
+    def __init__(self, reason: str, retry_after: float):
+        super().__init__(reason, retry_after, f"Rate limit exceeded ({reason.replace('_', ' ')}).")
+
+
+class ServiceOverloadedError(RequestRejectedError):
+    """Raised when no normalization slot became free in time."""
+    def __init__(self, reason: str, retry_after: float):
+        super().__init__(reason, retry_after, "The service is overloaded; retry later.")
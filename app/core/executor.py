@@ -0,0 +1,381 @@
+import asyncio
+import logging
+import math
+import multiprocessing
+import os
+import queue
+import sys
+import threading
+import time
+from abc import ABC, abstractmethod
+from concurrent.futures import ProcessPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
+from typing import Any, Callable, Dict, List, NamedTuple, Optional, Sequence, Tuple, Type
+
+from fastapi.concurrency import run_in_threadpool
+
+from app.core.cache import canonicalize, result_cache
+from app.core.config import settings
+from app.core.exceptions import LanguageNotSupportedError
+from app.normalizers import chunking, number_words
+from app.normalizers.base import HandlerStats, HandlerTrace, NormalizerStrategy
+from app.normalizers.factory import StrategySpec, normalizer_factory
+
+logger = logging.getLogger(__name__)
+
+# (lang, text) in, (normalized_text, error) out; exactly one of the pair is set.
+Job = Tuple[str, str]
+Outcome = Tuple[Optional[str], Optional[str]]
+
+# How often process workers send their stats to the parent, in seconds.
+STATS_REPORT_INTERVAL = 1.0
+
+# Set in each process worker by its initializer.
+_worker_warmup: Dict[str, float] = {}
+
+
+class ProcessStats(NamedTuple):
+    """Cumulative counters of the normalizers in one process."""
+    handlers: Dict[str, Dict[str, HandlerStats]]
+    number_words: number_words.NumberWordsCacheInfo
+
+
+def _process_stats() -> ProcessStats:
+    return ProcessStats(
+        {lang_code: strategy.handler_stats() for lang_code, strategy in normalizer_factory.strategies().items()},
+        number_words.cache_info(),
+    )
+
+
+def _report_stats(stats_queue: Any) -> None:
+    """Runs in a daemon thread of each worker, sending its stats whenever they changed."""
+    stop = threading.Event()
+    last = None
+    while not stop.wait(STATS_REPORT_INTERVAL):
+        stats = _process_stats()
+        if stats != last:
+            stats_queue.put((os.getpid(), stats))
+            last = stats
+
+
+def _init_worker(registrations: Dict[str, StrategySpec], stats_queue: Any = None) -> None:
+    """Registers the parent's strategies in a new worker and warms them up front."""
+    for lang_code, strategy in registrations.items():
+        normalizer_factory.register(lang_code, strategy)
+    _worker_warmup.update(_warm_up(list(registrations)))
+    if stats_queue is not None:
+        threading.Thread(target=_report_stats, args=(stats_queue,), daemon=True).start()
+
+
+def _worker_warmup_timings() -> Dict[str, float]:
+    return _worker_warmup
+
+
+def _warm_up(lang_codes: Sequence[str]) -> Dict[str, float]:
+    """Builds and warms the strategies, returning the milliseconds spent per language."""
+    timings: Dict[str, float] = {}
+    for lang_code in lang_codes:
+        start = time.perf_counter()
+        normalizer_factory.get_strategy(lang_code).warm_up()
+        timings[lang_code] = (time.perf_counter() - start) * 1000
+    return timings
+
+
+def _normalize_text(lang: str, text: str) -> str:
+    return normalizer_factory.get_strategy(lang).normalize(text)
+
+
+def _split_points(lang: str, text: str, size: int) -> List[int]:
+    return chunking.split_points(text, normalizer_factory.get_strategy(lang).normalize, size)
+
+
+def _stable_cut(lang: str, text: str) -> int:
+    strategy = normalizer_factory.get_strategy(lang)
+    return chunking.stable_cut(text, strategy.normalize, strategy.open_tail)
+
+
+def _normalize_traced(lang: str, text: str) -> Tuple[str, List[HandlerTrace]]:
+    return normalizer_factory.get_strategy(lang).normalize_traced(text)
+
+
+def _normalize_one(lang: str, text: str) -> Outcome:
+    try:
+        return _normalize_text(lang, text), None
+    except LanguageNotSupportedError as e:
+        return None, str(e)
+    except Exception as e:
+        logger.warning(f"Failed to normalize item using '{lang}'. Error: {e}.")
+        return None, f"Normalization failed: {e}"
+
+
+def _normalize_chunk(jobs: Sequence[Job]) -> List[Outcome]:
+    return [_normalize_one(lang, text) for lang, text in jobs]
+
+
+class NormalizationExecutor(ABC):
+    """
+    Runs normalization work on behalf of the API so endpoints can await it.
+    Backends differ only in where `_submit` runs the work.
+    """
+    workers = 1
+    # Tasks submitted and not yet finished: running, or queued for a worker.
+    in_flight = 0
+
+    async def submit(self, fn: Callable[..., Any], *args: Any) -> Any:
+        """Runs a module-level function with the given arguments and returns its result."""
+        self.in_flight += 1
+        try:
+            return await self._submit(fn, *args)
+        finally:
+            self.in_flight -= 1
+
+    @abstractmethod
+    async def _submit(self, fn: Callable[..., Any], *args: Any) -> Any:
+        pass
+
+    def stats(self) -> List[ProcessStats]:
+        """The normalizer counters of every process this backend normalizes in."""
+        return [_process_stats()]
+
+    async def normalize(self, lang: str, text: str) -> str:
+        """
+        Normalizes a single text, answering from the result cache when possible.
+
+        Raises:
+            LanguageNotSupportedError: If no strategy is registered for the lang.
+        """
+        text = canonicalize(text)
+        cached = result_cache.get(lang, text)
+        if cached is not None:
+            return cached
+        if self.workers > 1 and 0 < settings.CHUNK_MIN_CHARS <= len(text):
+            result = await self._normalize_chunked(lang, text)
+        else:
+            result = await self.submit(_normalize_text, lang, text)
+        result_cache.put(lang, text, result)
+        return result
+
+    async def _normalize_chunked(self, lang: str, text: str) -> str:
+        """
+        Cuts a long text at safe boundaries (see `app.normalizers.chunking`),
+        normalizes the chunks in parallel and joins them in order, which gives
+        the same result as normalizing the text in one piece.
+        """
+        # A few chunks per worker, as for batches, but never tiny ones.
+        size = max(settings.CHUNK_TARGET_CHARS, math.ceil(len(text) / (self.workers * 4)))
+        points = await self.submit(_split_points, lang, text, size)
+        if not points:
+            return await self.submit(_normalize_text, lang, text)
+        chunks = chunking.split(text, points)
+        return "".join(await asyncio.gather(*(self.submit(_normalize_text, lang, chunk) for chunk in chunks)))
+
+    async def stable_cut(self, lang: str, text: str) -> int:
+        """
+        Finds how much of a text that is still arriving can be normalized
+        already (see `chunking.stable_cut`). The text must be canonical.
+
+        Raises:
+            LanguageNotSupportedError: If no strategy is registered for the lang.
+        """
+        return await self.submit(_stable_cut, lang, text)
+
+    async def normalize_traced(self, lang: str, text: str) -> Tuple[str, List[HandlerTrace]]:
+        """
+        Normalizes a single text, recording what each handler did. Bypasses the
+        result cache, since a cached result would not have run any handler.
+
+        Raises:
+            LanguageNotSupportedError: If no strategy is registered for the lang.
+        """
+        return await self.submit(_normalize_traced, lang, canonicalize(text))
+
+    async def normalize_many(self, jobs: Sequence[Job]) -> List[Outcome]:
+        """
+        Normalizes (lang, text) jobs, returning a (normalized_text, error) pair per job
+        in input order. Cached results are filled in directly and only the misses
+        are submitted.
+        """
+        outcomes: List[Optional[Outcome]] = []
+        misses: List[Job] = []
+        positions: List[int] = []
+        for lang, text in jobs:
+            text = canonicalize(text)
+            cached = result_cache.get(lang, text) if normalizer_factory.is_registered(lang) else None
+            if cached is None:
+                positions.append(len(outcomes))
+                misses.append((lang, text))
+            outcomes.append(None if cached is None else (cached, None))
+
+        if misses:
+            for position, job, outcome in zip(positions, misses, await self._run_chunks(misses)):
+                outcomes[position] = outcome
+                if outcome[1] is None:
+                    result_cache.put(job[0], job[1], outcome[0])
+        return outcomes
+
+    async def _run_chunks(self, jobs: List[Job]) -> List[Outcome]:
+        """
+        With more than one worker, lists of at least BATCH_PARALLEL_MIN_ITEMS jobs
+        are split into chunks that run in parallel.
+        """
+        if self.workers == 1 or len(jobs) < settings.BATCH_PARALLEL_MIN_ITEMS:
+            return await self.submit(_normalize_chunk, jobs)
+        # A few chunks per worker keeps the load balanced without paying
+        # inter-process overhead for every single item.
+        size = math.ceil(len(jobs) / (self.workers * 4))
+        chunks = [jobs[i:i + size] for i in range(0, len(jobs), size)]
+        results = await asyncio.gather(*(self.submit(_normalize_chunk, chunk) for chunk in chunks))
+        return [outcome for chunk in results for outcome in chunk]
+
+    async def warm_up(self, lang_codes: Sequence[str], parallel: bool = False) -> Dict[str, float]:
+        """
+        Builds and warms the strategies wherever this backend normalizes.
+
+        Args:
+            lang_codes: The languages to warm.
+            parallel: Warm each language as a separate, concurrent task.
+
+        Returns:
+            The milliseconds spent per language.
+        """
+        if parallel:
+            results = await asyncio.gather(*(self.submit(_warm_up, [lang_code]) for lang_code in lang_codes))
+        else:
+            results = [await self.submit(_warm_up, list(lang_codes))]
+        return {lang_code: ms for timings in results for lang_code, ms in timings.items()}
+
+    def shutdown(self) -> None:
+        """Releases the backend's resources."""
+        pass
+
+
+class InlineExecutor(NormalizationExecutor):
+    """Runs normalization directly on the event loop; only suited to tiny inputs and debugging."""
+
+    async def _submit(self, fn: Callable[..., Any], *args: Any) -> Any:
+        return fn(*args)
+
+
+class ThreadExecutor(NormalizationExecutor):
+    """Runs normalization in Starlette's shared threadpool, like a plain `def` endpoint."""
+
+    async def _submit(self, fn: Callable[..., Any], *args: Any) -> Any:
+        return await run_in_threadpool(fn, *args)
+
+
+class ProcessExecutor(NormalizationExecutor):
+    """
+    Runs normalization in a pool of worker processes, so one server process can
+    use every core. Workers register and build the parent's strategies when they
+    start. Each worker reports its normalizer stats through a queue, and the
+    latest report per worker is kept.
+    """
+
+    def __init__(self):
+        self.workers = settings.EXECUTOR_WORKERS or os.cpu_count() or 1
+        self._lock = threading.Lock()
+        self._context = multiprocessing.get_context(settings.EXECUTOR_START_METHOD)
+        self._stats_queue = self._context.Queue()
+        # Keyed by worker pid; reports of retired workers stay so counters never go back.
+        self._worker_stats: Dict[int, ProcessStats] = {}
+        self._pool = self._create_pool()
+
+    def _create_pool(self) -> ProcessPoolExecutor:
+        kwargs: Dict[str, Any] = {}
+        if settings.EXECUTOR_MAX_TASKS_PER_CHILD > 0:
+            if sys.version_info >= (3, 11):
+                kwargs["max_tasks_per_child"] = settings.EXECUTOR_MAX_TASKS_PER_CHILD
+            else:
+                logger.warning("EXECUTOR_MAX_TASKS_PER_CHILD requires Python 3.11+ and is ignored.")
+        return ProcessPoolExecutor(
+            max_workers=self.workers,
+            mp_context=self._context,
+            initializer=_init_worker,
+            initargs=(normalizer_factory.registrations(), self._stats_queue),
+            **kwargs,
+        )
+
+    async def _submit(self, fn: Callable[..., Any], *args: Any) -> Any:
+        loop = asyncio.get_running_loop()
+        pool = self._pool
+        try:
+            return await loop.run_in_executor(pool, fn, *args)
+        except BrokenProcessPool:
+            # A worker died (e.g. killed by the OOM killer); replace the pool once.
+            logger.warning("Normalization worker pool is broken; restarting it.")
+            with self._lock:
+                if self._pool is pool:
+                    self._pool = self._create_pool()
+                    pool.shutdown(wait=False, cancel_futures=True)
+            return await loop.run_in_executor(self._pool, fn, *args)
+
+    async def warm_up(self, lang_codes: Sequence[str], parallel: bool = False) -> Dict[str, float]:
+        """
+        Starts every worker; each one warms all registered strategies in its
+        initializer. Workers always start concurrently, so `parallel` has no
+        effect here. Reports the slowest worker's time per language.
+        """
+        # The pool spawns a new worker for each task submitted while none is idle,
+        # so one task per worker brings the whole pool up.
+        results = await asyncio.gather(*(self.submit(_worker_warmup_timings) for _ in range(self.workers)))
+        timings: Dict[str, float] = {}
+        for worker_timings in results:
+            for lang_code, ms in worker_timings.items():
+                timings[lang_code] = max(ms, timings.get(lang_code, 0.0))
+        return timings
+
+    def stats(self) -> List[ProcessStats]:
+        while True:
+            try:
+                pid, stats = self._stats_queue.get_nowait()
+            except queue.Empty:
+                break
+            self._worker_stats[pid] = stats
+        return list(self._worker_stats.values())
+
+    def shutdown(self) -> None:
+        self._pool.shutdown(cancel_futures=True)
+        self._stats_queue.close()
+
+
+EXECUTORS: Dict[str, Type[NormalizationExecutor]] = {
+    "inline": InlineExecutor,
+    "thread": ThreadExecutor,
+    "process": ProcessExecutor,
+}
+
+_executor: Optional[NormalizationExecutor] = None
+
+
+def start_executor(backend: Optional[str] = None) -> NormalizationExecutor:
+    """
+    Creates the service-wide executor. Call it after the strategies are registered,
+    since process workers receive the registrations at start.
+
+    Args:
+        backend: One of the keys of `EXECUTORS`. Defaults to `settings.EXECUTOR_BACKEND`.
+
+    Raises:
+        ValueError: If the backend is unknown.
+    """
+    global _executor
+    backend = backend or settings.EXECUTOR_BACKEND
+    executor_class = EXECUTORS.get(backend)
+    if executor_class is None:
+        raise ValueError(f"Unknown executor backend '{backend}'. Expected one of: {', '.join(EXECUTORS)}.")
+    shutdown_executor()
+    _executor = executor_class()
+    return _executor
+
+
+def get_executor() -> NormalizationExecutor:
+    """Returns the service-wide executor, starting the configured backend on first use."""
+    return _executor or start_executor()
+
+
+def shutdown_executor() -> None:
+    """Shuts down the service-wide executor, if one was started."""
+    global _executor
+    if _executor is not None:
+        _executor.shutdown()
+        _executor = None
@@ -0,0 +1,120 @@
+"""
+A minimal in-process metrics registry rendered in the Prometheus text format,
+so `/metrics` can be scraped without a client library or a collector.
+
+Hot-path instruments only update in-memory aggregates; everything else is
+read from its source (caches, executor, handler counters) when scraped.
+"""
+from bisect import bisect_left
+from typing import Callable, Dict, Iterable, List, NamedTuple, Sequence, Tuple
+
+CONTENT_TYPE = "text/plain; version=0.0.4; charset=utf-8"
+
+Labels = Dict[str, str]
+Sample = Tuple[str, Labels, float]
+"""A sample's name suffix (e.g. "_bucket", or "" for none), labels and value."""
+
+
+class MetricFamily(NamedTuple):
+    name: str
+    type: str  # "counter", "gauge" or "histogram"
+    documentation: str
+    samples: List[Sample]
+
+
+Collector = Callable[[], Iterable[MetricFamily]]
+
+
+def _escape(value: str) -> str:
+    return value.replace("\\", "\\\\").replace("\n", "\\n").replace('"', '\\"')
+
+
+def _format_value(value: float) -> str:
+    if value == float("inf"):
+        return "+Inf"
+    if float(value).is_integer():
+        return str(int(value))
+    return repr(float(value))
+
+
+class Registry:
+    """Collectors called at scrape time, rendered in registration order."""
+
+    def __init__(self):
+        self._collectors: List[Collector] = []
+
+    def register(self, collector: Collector) -> Collector:
+        """Adds a collector; usable as a decorator."""
+        self._collectors.append(collector)
+        return collector
+
+    def render(self) -> str:
+        lines: List[str] = []
+        for collector in self._collectors:
+            for family in collector():
+                lines.append(f"# HELP {family.name} {family.documentation}")
+                lines.append(f"# TYPE {family.name} {family.type}")
+                for suffix, labels, value in family.samples:
+                    label_text = ",".join(f'{key}="{_escape(str(val))}"' for key, val in labels.items())
+                    name = family.name + suffix
+                    if label_text:
+                        name += "{" + label_text + "}"
+                    lines.append(f"{name} {_format_value(value)}")
+        return "\n".join(lines) + "\n"
+
+
+class Histogram:
+    """
+    A labelled histogram. `observe` only bumps one bucket and the sum; buckets
+    are made cumulative when collected. Observations are expected from the
+    event loop, so they are not locked.
+    """
+
+    def __init__(self, name: str, documentation: str, labelnames: Sequence[str], buckets: Sequence[float]):
+        self.name = name
+        self.documentation = documentation
+        self._labelnames = tuple(labelnames)
+        self._buckets = tuple(sorted(buckets))
+        # Per label values: a count per bucket (the last one is +Inf), and the sum.
+        self._series: Dict[Tuple[str, ...], Tuple[List[int], List[float]]] = {}
+
+    def observe(self, labelvalues: Tuple[str, ...], value: float) -> None:
+        series = self._series.get(labelvalues)
+        if series is None:
+            series = self._series[labelvalues] = ([0] * (len(self._buckets) + 1), [0.0])
+        series[0][bisect_left(self._buckets, value)] += 1
+        series[1][0] += value
+
+    def collect(self) -> Iterable[MetricFamily]:
+        samples: List[Sample] = []
+        for labelvalues, (counts, total) in sorted(self._series.items()):
+            labels = dict(zip(self._labelnames, labelvalues))
+            cumulative = 0
+            for bound, count in zip(self._buckets + (float("inf"),), counts):
+                cumulative += count
+                samples.append(("_bucket", {**labels, "le": _format_value(bound)}, cumulative))
+            samples.append(("_sum", labels, total[0]))
+            samples.append(("_count", labels, cumulative))
+        yield MetricFamily(self.name, "histogram", self.documentation, samples)
+
+
+registry = Registry()
+
+
+# Upper bounds, in characters, of the input size label; larger inputs get the last label.
+SIZE_BOUNDS = (64, 256, 1024, 4096, 16384)
+SIZE_LABELS = ("0-64", "65-256", "257-1k", "1k-4k", "4k-16k", "16k+")
+LATENCY_BUCKETS = (0.0005, 0.001, 0.0025, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0)
+
+request_duration = Histogram(
+    "normalizer_request_duration_seconds",
+    "Time to normalize a request's text, by endpoint, language and input size in characters.",
+    ("endpoint", "lang", "size"),
+    LATENCY_BUCKETS,
+)
+registry.register(request_duration.collect)
+
+
+def size_label(chars: int) -> str:
+    """The `size` label of an input of this many characters."""
+    return SIZE_LABELS[bisect_left(SIZE_BOUNDS, chars)]
@@ -0,0 +1,263 @@
+"""
+A normalization result cache that every worker process on a host can see.
+
+The cache is a memory-mapped hash table of fixed-size slots: a file, such as
+one in /dev/shm, that any process can map, or anonymous shared memory that
+the preforking server (`app/server.py`) maps before it forks its workers. It
+sits behind the in-process `ResultCache`, which answers repeated texts without
+touching it.
+
+A key is a 128-bit hash of (lang, ruleset version, text); the text itself is
+not stored. The file header also records the ruleset versions of every
+registered language, and a process that finds other versions there, as after
+a deploy that changed rules, the engine or a lexicon, replaces the file
+instead of sharing entries no key of its own can reach.
+
+The hash picks a bucket of `WAYS` adjacent slots, and a new entry takes the
+slot of the same key, a free or expired one, or else the least recently used
+one in its bucket. Each slot holds:
+
+    key      16 bytes   blake2b of lang, ruleset version and text
+    expires  float64    time.time() after which the entry is stale; 0 never
+    used     uint64     time.time_ns() of the last hit, for eviction
+    length   uint32     bytes of the UTF-8 result
+    checksum 8 bytes    blake2b of key, expires, length and result
+    result   length bytes, up to the slot size minus the 44-byte header
+
+There are no locks: a process may read a slot while another one writes it,
+and two processes may write one slot at once. Readers copy a slot and check
+its checksum, so a torn or mixed slot reads as a miss and is never served;
+only `used` is outside the checksum, and it only steers eviction.
+"""
+import fcntl
+import hashlib
+import mmap
+import os
+import struct
+import time
+from typing import NamedTuple, Optional
+
+from app.core.config import settings
+from app.normalizers.factory import normalizer_factory
+from app.normalizers.ruleset import ruleset_version
+
+MAGIC = b"TNRCACHE"
+# Magic, format version, slot size, slot count and rulesets fingerprint at the
+# start of the mapping.
+FILE_HEADER = struct.Struct("<8sIIQ16s")
+FORMAT_VERSION = 2
+# The table starts at a page boundary after the file header.
+TABLE_OFFSET = mmap.PAGESIZE
+# key, expires, used, length, checksum
+SLOT_HEADER = struct.Struct("<16sdQI8s")
+USED = struct.Struct("<Q")
+USED_OFFSET = 24
+WAYS = 4
+
+
+class SharedCacheInfo(NamedTuple):
+    """Counters of this process's use of the shared cache, and its geometry."""
+    hits: int
+    misses: int
+    stores: int
+    evictions: int
+    # Results too long for a slot, left to the in-process cache.
+    oversized: int
+    # Slots whose checksum did not match, read while being written.
+    torn_reads: int
+    slots: int
+    slot_bytes: int
+    path: Optional[str]
+
+
+def rulesets_fingerprint() -> bytes:
+    """Hashes the ruleset version of every registered language, for the file header."""
+    digest = hashlib.blake2b(digest_size=16)
+    for lang_code in sorted(normalizer_factory.registrations()):
+        digest.update(f"{lang_code}={ruleset_version(lang_code)}\0".encode("utf-8"))
+    return digest.digest()
+
+
+def _checksum(key: bytes, expires: float, payload: bytes) -> bytes:
+    digest = hashlib.blake2b(key, digest_size=8)
+    digest.update(struct.pack("<dI", expires, len(payload)))
+    digest.update(payload)
+    return digest.digest()
+
+
+class SharedResultCache:
+    """
+    Results of whole-text normalization in a memory-mapped table shared
+    between processes, bounded by `max_bytes` of `slot_bytes` slots.
+
+    Args:
+        path: The file to map, created if missing; None maps anonymous shared
+            memory, which only processes forked from this one see.
+        max_bytes: Size of the table.
+        slot_bytes: Size of each slot; longer results are not stored.
+        ttl: Seconds an entry stays valid; 0 keeps it until evicted.
+        fingerprint: Identifies the rulesets the entries were made with;
+            defaults to `rulesets_fingerprint()`, so register the strategies
+            first.
+    """
+
+    def __init__(
+        self,
+        path: Optional[str] = settings.SHARED_CACHE_PATH,
+        max_bytes: int = settings.SHARED_CACHE_MAX_BYTES,
+        slot_bytes: int = settings.SHARED_CACHE_SLOT_BYTES,
+        ttl: float = settings.RESULT_CACHE_TTL_SECONDS,
+        fingerprint: Optional[bytes] = None,
+    ):
+        if slot_bytes <= SLOT_HEADER.size:
+            raise ValueError(f"SHARED_CACHE_SLOT_BYTES must exceed the {SLOT_HEADER.size}-byte slot header.")
+        self.path = path
+        self.slot_bytes = slot_bytes
+        self.capacity = slot_bytes - SLOT_HEADER.size
+        self.buckets = max(max_bytes // (slot_bytes * WAYS), 1)
+        self.slots = self.buckets * WAYS
+        self.ttl = ttl
+        self.fingerprint = rulesets_fingerprint() if fingerprint is None else fingerprint
+        size = TABLE_OFFSET + self.slots * slot_bytes
+        self._map = self._open_anonymous(size) if path is None else self._open_file(path, size)
+        self._hits = self._misses = self._stores = self._evictions = self._oversized = self._torn_reads = 0
+
+    def _header(self) -> bytes:
+        return FILE_HEADER.pack(MAGIC, FORMAT_VERSION, self.slot_bytes, self.slots, self.fingerprint)
+
+    def _open_anonymous(self, size: int) -> mmap.mmap:
+        mapping = mmap.mmap(-1, size)
+        mapping[:FILE_HEADER.size] = self._header()
+        return mapping
+
+    def _open_file(self, path: str, size: int) -> mmap.mmap:
+        """
+        Maps the file, creating it if it is missing. A file laid out for another
+        slot size or count, or written under other rulesets, is replaced by a
+        new one rather than resized or cleared, since processes that still map
+        the old file would fault on truncated pages.
+        """
+        fd = self._open_locked(path)
+        try:
+            if os.fstat(fd).st_size == 0:
+                self._initialize(fd, size)
+            elif os.pread(fd, FILE_HEADER.size, 0) != self._header() or os.fstat(fd).st_size != size:
+                replacement = f"{path}.{os.getpid()}.tmp"
+                new_fd = os.open(replacement, os.O_RDWR | os.O_CREAT | os.O_TRUNC, 0o600)
+                self._initialize(new_fd, size)
+                os.replace(replacement, path)
+                os.close(fd)
+                fd = new_fd
+            return mmap.mmap(fd, size)
+        finally:
+            os.close(fd)
+
+    @staticmethod
+    def _open_locked(path: str) -> int:
+        """
+        Opens the file and locks it. If another process replaced the file while
+        this one waited for the lock, the lock is on a file no one else opens
+        any more, so the new one is opened and locked instead.
+        """
+        while True:
+            fd = os.open(path, os.O_RDWR | os.O_CREAT, 0o600)
+            fcntl.flock(fd, fcntl.LOCK_EX)
+            try:
+                current = os.stat(path)
+            except FileNotFoundError:
+                current = None
+            locked = os.fstat(fd)
+            if current is not None and (current.st_dev, current.st_ino) == (locked.st_dev, locked.st_ino):
+                return fd
+            os.close(fd)
+
+    def _initialize(self, fd: int, size: int) -> None:
+        os.ftruncate(fd, size)
+        os.pwrite(fd, self._header(), 0)
+
+    @staticmethod
+    def key(lang: str, version: str, text: str) -> bytes:
+        """The 128-bit key of a text of a language under a ruleset version."""
+        digest = hashlib.blake2b(f"{lang}\0{version}\0".encode(), digest_size=16)
+        digest.update(text.encode("utf-8", "surrogatepass"))
+        return digest.digest()
+
+    def _bucket(self, key: bytes) -> int:
+        """The offset of the key's first slot."""
+        return TABLE_OFFSET + int.from_bytes(key[:8], "little") % self.buckets * WAYS * self.slot_bytes
+
+    def _read(self, offset: int, key: bytes) -> Optional[str]:
+        """The result in the slot if it holds this key, is intact and has not expired."""
+        mapping = self._map
+        if mapping[offset:offset + 16] != key:
+            return None
+        header = mapping[offset:offset + SLOT_HEADER.size]
+        slot_key, expires, _, length, checksum = SLOT_HEADER.unpack(header)
+        if length > self.capacity:
+            self._torn_reads += 1
+            return None
+        start = offset + SLOT_HEADER.size
+        payload = mapping[start:start + length]
+        if _checksum(slot_key, expires, payload) != checksum or slot_key != key:
+            self._torn_reads += 1
+            return None
+        if expires and expires <= time.time():
+            return None
+        mapping[offset + USED_OFFSET:offset + USED_OFFSET + USED.size] = USED.pack(time.time_ns())
+        return payload.decode("utf-8", "surrogatepass")
+
+    def get(self, key: bytes) -> Optional[str]:
+        """Returns the cached result for the key, or None on a miss."""
+        first = self._bucket(key)
+        for way in range(WAYS):
+            result = self._read(first + way * self.slot_bytes, key)
+            if result is not None:
+                self._hits += 1
+                return result
+        self._misses += 1
+        return None
+
+    def put(self, key: bytes, result: str) -> None:
+        """Stores a result in the key's bucket, replacing the least recently used entry if it is full."""
+        payload = result.encode("utf-8", "surrogatepass")
+        if len(payload) > self.capacity:
+            self._oversized += 1
+            return
+        mapping = self._map
+        first = self._bucket(key)
+        now = time.time()
+        target = None
+        oldest = None
+        for way in range(WAYS):
+            offset = first + way * self.slot_bytes
+            slot_key, expires, used, length, _ = SLOT_HEADER.unpack(mapping[offset:offset + SLOT_HEADER.size])
+            if slot_key == key or not used or (expires and expires <= now):
+                target = offset
+                break
+            if oldest is None or used < oldest[0]:
+                oldest = (used, offset)
+        if target is None:
+            target = oldest[1]
+            self._evictions += 1
+        expires = now + self.ttl if self.ttl > 0 else 0.0
+        start = target + SLOT_HEADER.size
+        mapping[start:start + len(payload)] = payload
+        mapping[target:start] = SLOT_HEADER.pack(key, expires, time.time_ns(), len(payload), _checksum(key, expires, payload))
+        self._stores += 1
+
+    def info(self) -> SharedCacheInfo:
+        """Returns this process's counters and the table's geometry."""
+        return SharedCacheInfo(
+            hits=self._hits,
+            misses=self._misses,
+            stores=self._stores,
+            evictions=self._evictions,
+            oversized=self._oversized,
+            torn_reads=self._torn_reads,
+            slots=self.slots,
+            slot_bytes=self.slot_bytes,
+            path=self.path,
+        )
+
+    def close(self) -> None:
+        self._map.close()
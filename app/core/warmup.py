@@ -0,0 +1,53 @@
+import logging
+import time
+from typing import Dict, Optional
+
+from app.core.config import settings
+from app.core.executor import get_executor
+from app.normalizers.factory import normalizer_factory
+from app.normalizers.ruleset import ruleset_version
+
+logger = logging.getLogger(__name__)
+
+
+class Readiness:
+    """Startup warmup progress of this server process, as reported by `/ready`."""
+
+    def __init__(self):
+        self.reset()
+
+    def reset(self) -> None:
+        self.ready = False
+        self.error: Optional[str] = None
+        self.warmup_ms: Dict[str, float] = {}
+
+    def mark_ready(self, warmup_ms: Dict[str, float]) -> None:
+        self.warmup_ms = warmup_ms
+        self.ready = True
+
+    def mark_failed(self, error: str) -> None:
+        self.error = error
+
+
+readiness = Readiness()
+
+
+async def run_warmup() -> None:
+    """
+    Builds every registered strategy and runs its warmup texts wherever the
+    executor normalizes, then marks the process ready. A failure is logged and
+    leaves it not ready, so the load balancer keeps traffic away.
+    """
+    lang_codes = list(normalizer_factory.registrations())
+    start = time.perf_counter()
+    try:
+        for lang_code in lang_codes:
+            # Result cache keys include the ruleset version; hash the rule files now.
+            ruleset_version(lang_code)
+        timings = await get_executor().warm_up(lang_codes, parallel=settings.WARMUP_PARALLEL)
+    except Exception as e:
+        logger.error(f"Strategy warmup failed: {e}")
+        readiness.mark_failed(str(e))
+        return
+    readiness.mark_ready(timings)
+    logger.info(f"Warmed up {', '.join(lang_codes)} in {(time.perf_counter() - start) * 1000:.0f} ms.")
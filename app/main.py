@@ -1,22 +1,45 @@
+import asyncio
 from contextlib import asynccontextmanager
 from fastapi import FastAPI
 from app.core.config import settings
+from app.api.compression import CompressionMiddleware
 from app.api.v1 import api_router
-from app.normalizers.factory import normalizer_factory
-from app.normalizers.sr.strategy import SerbianNormalizerStrategy
-from app.normalizers.en.strategy import EnglishNormalizerStrategy
-from app.normalizers.de.strategy import GermanNormalizerStrategy
+from app.api.endpoints import health, metrics
+from app.core.cache import result_cache
+from app.core.executor import shutdown_executor, start_executor
+from app.core.shared_cache import SharedResultCache
+from app.core.warmup import readiness, run_warmup
+from app.normalizers.factory import BUILTIN_STRATEGIES, normalizer_factory
 
 
 @asynccontextmanager
 async def lifespan(app: FastAPI):
-    print("Registering normalizer strategies...")
-    normalizer_factory.register("sr", SerbianNormalizerStrategy)
-    normalizer_factory.register("en", EnglishNormalizerStrategy)
-    normalizer_factory.register("de", GermanNormalizerStrategy)
-    print("Registration complete.")
+    # Workers of the preforking server (app/server.py) inherit the strategies
+    # the master built; registering them again would drop them.
+    if not normalizer_factory.registrations():
+        print("Registering normalizer strategies...")
+        for lang_code, strategy in BUILTIN_STRATEGIES.items():
+            normalizer_factory.register(lang_code, strategy)
+        # Languages contributed by installed packages.
+        normalizer_factory.register_entry_points()
+        print("Registration complete.")
+    # The preforking server attaches the shared cache before it forks.
+    if result_cache.shared is None and settings.SHARED_CACHE_PATH and settings.SHARED_CACHE_MAX_BYTES > 0:
+        result_cache.shared = SharedResultCache()
+    start_executor()
+    # Warm up in the background so the server answers probes meanwhile;
+    # /ready reports 503 until it finishes.
+    readiness.reset()
+    warmup = None
+    if settings.WARMUP_ENABLED:
+        warmup = asyncio.create_task(run_warmup())
+    else:
+        readiness.mark_ready({})
     yield
     print("Shutting down.")
+    if warmup is not None:
+        warmup.cancel()
+    shutdown_executor()
 
 
 app = FastAPI(
@@ -24,7 +47,16 @@ app = FastAPI(
     lifespan=lifespan
 )
 
+if settings.COMPRESSION_MIN_BYTES > 0:
+    app.add_middleware(
+        CompressionMiddleware,
+        minimum_size=settings.COMPRESSION_MIN_BYTES,
+        compresslevel=settings.COMPRESSION_LEVEL,
+    )
+
 app.include_router(api_router, prefix=settings.API_V1_PREFIX)
+app.include_router(health.router, tags=["Health"])
+app.include_router(metrics.router, tags=["Metrics"])
 
 @app.get("/")
 def read_root():
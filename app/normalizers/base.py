@@ -1,5 +1,51 @@
+import re
+import time
 from abc import ABC, abstractmethod
-from typing import Optional
+from functools import partial
+from typing import Callable, Dict, Iterator, List, Match, NamedTuple, Optional, Tuple
+
+from app.normalizers.spans import Edit, OffsetMap, is_free, join, mask, regions
+
+Rule = Tuple[re.Pattern, Callable[[Match], str]]
+"""A compiled pattern and the replacement function applied to each of its matches."""
+
+EditFinder = Callable[[str, List[Edit]], List[Edit]]
+"""
+Finds the edits a pass of a handler makes in the masked text (see
+`app/normalizers/spans.py`), given the edits made so far, sorted by start.
+"""
+
+HAS_DIGIT = re.compile(r"\d")
+"""Trigger for handlers whose every match contains a digit."""
+
+WORD = re.compile(r"\S+")
+"""A word, as `NormalizationHandler.open_tail` counts them."""
+
+
+class HandlerStats(NamedTuple):
+    """
+    How often a handler ran, how often its trigger let it be skipped, how many
+    matches its rule replaced and the time it spent.
+    """
+    applied: int
+    skipped: int
+    matches: int
+    seconds: float
+
+
+class HandlerTrace(NamedTuple):
+    """
+    What one handler did to one text: whether its trigger skipped it, its time,
+    its matches, how many characters it added (negative if it shortened the text)
+    and how many numbers it had to spell out because the number-words cache
+    missed them.
+    """
+    handler: str
+    skipped: bool
+    seconds: float
+    matches: int
+    growth: int
+    conversions: int
 
 
 class NormalizationHandler(ABC):
@@ -9,6 +55,22 @@ class NormalizationHandler(ABC):
     """
     _next_handler: Optional["NormalizationHandler"] = None
 
+    # A cheap pattern that is found in every text the handler could change (and
+    # in the output of the handlers before it that could make it fire), so the
+    # handler is skipped when the pattern is absent. None means always run.
+    trigger: Optional[re.Pattern] = None
+    # The most words after the one it begins in that a match can take in, which
+    # bounds how much of a streamed text `open_tail` holds back.
+    reach = 2
+    # Matches every character a match of the handler can begin with, so that
+    # `open_tail` holds back only the words a match could begin in. None means
+    # a match can begin with any character.
+    opener: Optional[re.Pattern] = None
+    applied = 0
+    skipped = 0
+    matches = 0
+    seconds = 0.0
+
     def set_next(self, handler: "NormalizationHandler") -> "NormalizationHandler":
         """
         Sets the next handler in the chain.
@@ -23,6 +85,78 @@ class NormalizationHandler(ABC):
         return handler
 
     @abstractmethod
+    def apply(self, text: str) -> str:
+        """
+        Applies only this handler's normalization rule, without touching the rest of the chain.
+
+        Args:
+            text: The input text to normalize.
+
+        Returns:
+            The text with this handler's rule applied.
+        """
+
+    def can_match(self, text: str) -> bool:
+        """Checks the handler's trigger; False means applying it would leave the text unchanged."""
+        return self.trigger is None or self.trigger.search(text) is not None
+
+    def apply_triggered(self, text: str) -> str:
+        """
+        Applies the handler's rule unless its trigger rules out a match, counting either outcome.
+
+        Args:
+            text: The input text to normalize.
+
+        Returns:
+            The text with this handler's rule applied.
+        """
+        if not self.can_match(text):
+            self.skipped += 1
+            return text
+        return self._apply_counted(text)
+
+    def _apply_counted(self, text: str) -> str:
+        """Applies the handler's rule, counting it as run and adding its time."""
+        self.applied += 1
+        start = time.perf_counter()
+        text = self.apply(text)
+        self.seconds += time.perf_counter() - start
+        return text
+
+    def apply_traced(self, text: str) -> Tuple[str, HandlerTrace]:
+        """
+        `apply_triggered`, also returning what the handler did. Match counts are
+        taken from the handler's counters, so with concurrent threads they may
+        include other texts normalized at the same time.
+        """
+        from app.normalizers import number_words
+        name = type(self).__name__
+        if not self.can_match(text):
+            self.skipped += 1
+            return text, HandlerTrace(name, True, 0.0, 0, 0, 0)
+        self.applied += 1
+        matches = self.matches
+        misses = number_words.cache_info().misses
+        start = time.perf_counter()
+        result = self.apply(text)
+        seconds = time.perf_counter() - start
+        self.seconds += seconds
+        trace = HandlerTrace(
+            name, False, seconds, self.matches - matches, len(result) - len(text),
+            number_words.cache_info().misses - misses,
+        )
+        return result, trace
+
+    def _sub(self, pattern: re.Pattern, replace: Callable[[Match], str], text: str) -> str:
+        """`pattern.sub`, counting the matches into the handler's stats."""
+        text, count = pattern.subn(replace, text)
+        self.matches += count
+        return text
+
+    def stats(self) -> HandlerStats:
+        """Returns the handler's counters."""
+        return HandlerStats(self.applied, self.skipped, self.matches, self.seconds)
+
     def handle(self, text: str) -> str:
         """
         Applies the handler's normalization rule and passes the text to the next handler.
@@ -33,16 +167,306 @@ class NormalizationHandler(ABC):
         Returns:
             The normalized text.
         """
+        text = self.apply_triggered(text)
         if self._next_handler:
             return self._next_handler.handle(text)
         return text
 
+    def rules(self) -> List[Rule]:
+        """
+        Describes the handler as an ordered list of regex rules, so that the span
+        engine can run each of them as a pass of its own.
+
+        Returns:
+            The rules in the order `apply` runs them, or an empty list if the handler
+            does something a plain (pattern, replacement) pair cannot express.
+        """
+        return []
+
+    def edit_passes(self) -> List[EditFinder]:
+        """
+        Describes the handler as passes over the masked original text, for the
+        span engine. Each rule is its own pass, and a match that overlaps a span
+        claimed before is dropped. A handler without rules is applied to each
+        unclaimed region, and a region it changes becomes a single edit.
+
+        Returns:
+            The passes in the order `apply` runs them.
+        """
+        handler_rules = self.rules()
+        if handler_rules:
+            return [partial(self._rule_edits, pattern, replace) for pattern, replace in handler_rules]
+        return [self._region_edits]
+
+    def _rule_edits(
+            self, pattern: re.Pattern, replace: Callable[[Match], str], masked: str, claimed: List[Edit]
+    ) -> List[Edit]:
+        starts = [edit.start for edit in claimed]
+        edits: List[Edit] = []
+        for match in pattern.finditer(masked):
+            start, end = match.span()
+            if start == end or not is_free(claimed, starts, start, end):
+                continue
+            replacement = replace(match)
+            if replacement != match.group(0):
+                edits.append(Edit(start, end, replacement))
+        self.matches += len(edits)
+        return edits
+
+    def _region_edits(self, masked: str, claimed: List[Edit]) -> List[Edit]:
+        edits: List[Edit] = []
+        for start, end in regions(masked, claimed):
+            original = masked[start:end]
+            result = self.apply(original)
+            if result != original:
+                edits.append(Edit(start, end, result))
+        return edits
+
+    def open_tail(self, text: str) -> int:
+        """
+        Finds the end of a text that is still growing which a match of this
+        handler could take in once more text arrives, such as "1.500" before
+        its currency code.
+
+        Args:
+            text: The text received so far.
+
+        Returns:
+            The start of the first of the last `reach` + 1 words that a match
+            could begin in, or len(text) if there is none.
+        """
+        for word in list(WORD.finditer(text))[-(self.reach + 1):]:
+            if self.opener is None or self.opener.search(word.group()):
+                return word.start()
+        return len(text)
+
+    def iter_chain(self) -> Iterator["NormalizationHandler"]:
+        """Yields this handler followed by every handler linked after it."""
+        handler: Optional[NormalizationHandler] = self
+        while handler is not None:
+            yield handler
+            handler = handler._next_handler
+
+
+class NormalizationEngine(ABC):
+    """
+    Abstract Base Class for the way a strategy runs its chain of handlers.
+    Every engine must produce the same output as walking the chain in order,
+    except for the documented differences of `SpanEngine`.
+    """
+    def __init__(self, chain_head: NormalizationHandler):
+        self._chain_head = chain_head
+
+    @abstractmethod
+    def run(self, text: str) -> str:
+        """
+        Normalizes the text with the handlers of the chain.
+
+        Args:
+            text: The text to normalize.
+
+        Returns:
+            The normalized text.
+        """
+
+    def run_mapped(self, text: str) -> Tuple[str, Optional[OffsetMap]]:
+        """
+        Normalizes the text, also returning how offsets of the text map to
+        offsets of the result, or None if the engine does not track them.
+        """
+        return self.run(text), None
+
+    def open_tail(self, text: str) -> int:
+        """The start of the end of a growing text that any handler of the chain could still take in."""
+        return min(handler.open_tail(text) for handler in self._chain_head.iter_chain())
+
+    def handler_stats(self) -> Dict[str, HandlerStats]:
+        """Returns the counters of every handler, in chain order."""
+        return {type(handler).__name__: handler.stats() for handler in self._chain_head.iter_chain()}
+
+    def trace(self, text: str) -> Tuple[str, List[HandlerTrace]]:
+        """
+        Normalizes the text by walking the chain handler by handler, whatever the
+        engine, so the cost of each handler can be told apart.
+
+        Returns:
+            The normalized text and a trace per handler, in chain order.
+        """
+        traces: List[HandlerTrace] = []
+        for handler in self._chain_head.iter_chain():
+            text, handler_trace = handler.apply_traced(text)
+            traces.append(handler_trace)
+        return text, traces
+
+
+class ChainEngine(NormalizationEngine):
+    """Runs every handler over the whole text, one after another."""
+
+    def run(self, text: str) -> str:
+        return self._chain_head.handle(text)
+
+
+class SinglePassEngine(NormalizationEngine):
+    """
+    Walks the chain like `ChainEngine`, but searches the text for each distinct
+    trigger only once, however many handlers share it (most share `HAS_DIGIT`).
+    The answers hold until a handler changes the text; the handlers after it
+    check their triggers against the new text. Every handler is run or
+    skipped exactly as in the chain, so the output is the chain's.
+    """
+    def __init__(self, chain_head: NormalizationHandler):
+        super().__init__(chain_head)
+        self._handlers = list(chain_head.iter_chain())
+
+    def run(self, text: str) -> str:
+        # Whether each trigger searched for so far occurs in the current text.
+        found: Dict[re.Pattern, bool] = {}
+        for handler in self._handlers:
+            trigger = handler.trigger
+            if trigger is not None:
+                hit = found.get(trigger)
+                if hit is None:
+                    hit = found[trigger] = trigger.search(text) is not None
+                if not hit:
+                    handler.skipped += 1
+                    continue
+            result = handler._apply_counted(text)
+            if result != text:
+                text = result
+                found.clear()
+        return text
+
+
+class SpanEngine(NormalizationEngine):
+    """
+    Runs the handlers against the original text without rewriting it. Each
+    handler's replacements are claimed spans of the original; later handlers
+    scan the original with the claimed spans masked out (see
+    `app/normalizers/spans.py`), and the normalized text is joined once at the
+    end. No handler rescans the words another wrote, and the edits double as
+    an offset map.
+
+    Unlike the chain, a handler cannot rewrite an earlier handler's output or
+    match across it. Each rule of a handler is a pass of its own, and triggers
+    are checked against the masked text.
+    """
+    def __init__(self, chain_head: NormalizationHandler):
+        super().__init__(chain_head)
+        self._passes = [(handler, handler.edit_passes()) for handler in chain_head.iter_chain()]
+
+    def edits(self, text: str) -> List[Edit]:
+        """Returns the replacements the handlers make in the text, sorted by position."""
+        edits: List[Edit] = []
+        masked = text
+        for handler, passes in self._passes:
+            if not handler.can_match(masked):
+                handler.skipped += 1
+                continue
+            handler.applied += 1
+            start = time.perf_counter()
+            for find in passes:
+                found = find(masked, edits)
+                if found:
+                    edits = sorted(edits + found)
+                    masked = mask(masked, found)
+            handler.seconds += time.perf_counter() - start
+        return edits
+
+    def run(self, text: str) -> str:
+        return join(text, self.edits(text))
+
+    def run_mapped(self, text: str) -> Tuple[str, Optional[OffsetMap]]:
+        edits = self.edits(text)
+        return join(text, edits), OffsetMap(edits)
+
+
+ENGINES = {
+    "chain": ChainEngine,
+    "single_pass": SinglePassEngine,
+    "spans": SpanEngine,
+}
+
+
+def build_engine(chain_head: NormalizationHandler, mode: Optional[str] = None) -> NormalizationEngine:
+    """
+    Creates the engine that runs a strategy's chain.
+
+    Args:
+        chain_head: The first handler of the chain.
+        mode: One of the keys of `ENGINES`. Defaults to `settings.NORMALIZER_ENGINE`.
+
+    Returns:
+        The engine instance.
+
+    Raises:
+        ValueError: If the mode is unknown.
+    """
+    if mode is None:
+        from app.core.config import settings
+        mode = settings.NORMALIZER_ENGINE
+    engine_class = ENGINES.get(mode)
+    if engine_class is None:
+        raise ValueError(f"Unknown normalizer engine '{mode}'. Expected one of: {', '.join(ENGINES)}.")
+    return engine_class(chain_head)
+
 
 class NormalizerStrategy(ABC):
     """
     Abstract Base Class for a language-specific normalization strategy.
     This class encapsulates the entire normalization algorithm for one language.
     """
+    # A few representative sentences that exercise every handler; run at startup
+    # so the first real request does not pay for lazily filled caches.
+    warmup_texts: Tuple[str, ...] = ()
+
+    def warm_up(self) -> None:
+        """Normalizes the warmup texts, discarding the results."""
+        for text in self.warmup_texts:
+            self.normalize(text)
+
+    def handler_stats(self) -> Dict[str, HandlerStats]:
+        """
+        Reports, per handler, how often it ran, how often its trigger let it be
+        skipped, its matches and its time.
+
+        Returns:
+            The counters keyed by handler class name, or an empty dict if the
+            strategy does not track them.
+        """
+        return {}
+
+    def normalize_traced(self, text: str) -> Tuple[str, List[HandlerTrace]]:
+        """
+        Normalizes the text, recording what each handler did. Slower than
+        `normalize`; meant for looking into single slow requests.
+
+        Returns:
+            The normalized text and a trace per handler, or no traces if the
+            strategy does not record them.
+        """
+        return self.normalize(text), []
+
+    def normalize_mapped(self, text: str) -> Tuple[str, Optional[OffsetMap]]:
+        """
+        Normalizes the text, also mapping offsets between the text and the result.
+
+        Returns:
+            The normalized text and its offset map, or None if the strategy's
+            engine does not track offsets (only the `spans` engine does).
+        """
+        return self.normalize(text), None
+
+    def open_tail(self, text: str) -> int:
+        """
+        Finds where the end of a text that is still growing starts which more
+        text could change the normalization of (see `app/normalizers/chunking.py`).
+
+        Returns:
+            The offset of that end, or 0 if the strategy cannot tell, which
+            holds back all of the text.
+        """
+        return 0
+
     @abstractmethod
     def normalize(self, text: str) -> str:
         """
@@ -54,4 +478,4 @@ class NormalizerStrategy(ABC):
         Returns:
             The fully normalized text.
         """
-        pass
\ No newline at end of file
+        pass
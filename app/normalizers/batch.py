@@ -0,0 +1,25 @@
+from typing import Dict, List, Sequence
+
+from app.core.executor import Job, Outcome, get_executor
+
+
+async def normalize_batch(jobs: Sequence[Job]) -> List[Outcome]:
+    """
+    Normalizes a batch of (lang, text) items, returning outcomes in input order.
+
+    Identical items are normalized only once; the distinct ones are handed to
+    the service executor, which spreads large batches over its workers.
+
+    Args:
+        jobs: The (language code, text) pairs to normalize.
+
+    Returns:
+        A (normalized_text, error) pair per job; an unsupported language or a
+        failing item only sets the error of that item.
+    """
+    unique: Dict[Job, int] = {}
+    for job in jobs:
+        unique.setdefault(job, len(unique))
+
+    outcomes = await get_executor().normalize_many(list(unique))
+    return [outcomes[unique[job]] for job in jobs]
@@ -0,0 +1,193 @@
+"""
+Precompiled language data bundles.
+
+A bundle packs a language's data directory, every JSON file already parsed,
+together with the structures handlers derive from it (unit patterns, folded
+brand indexes, ordinal and year tables) into a single pickle next to the
+directory. Building a strategy then takes one read instead of parsing and
+deriving everything per handler. Bundles are build artifacts:
+
+    python -m app.normalizers.bundle build            # every language
+    python -m app.normalizers.bundle build sr en
+
+A bundle is only used if its format is current and its version equals the
+language's source version (`ruleset.source_version`). That version is the
+hash of the package's code and data, so a stale bundle is ignored and the
+handlers read the JSON files as before.
+"""
+import argparse
+import importlib
+import json
+import logging
+import pickle
+from pathlib import Path
+from typing import Any, Callable, Dict, List, NamedTuple, Optional, Tuple, Type, TypeVar
+
+from app.normalizers.base import NormalizerStrategy
+from app.normalizers.ruleset import NORMALIZERS_PATH, source_version
+
+logger = logging.getLogger(__name__)
+
+BUNDLE_FORMAT = 1
+BUNDLE_NAME = "data.bundle"
+
+T = TypeVar("T")
+
+
+class DataBundle(NamedTuple):
+    format: int
+    version: str
+    files: Dict[str, Any]
+    derived: Dict[str, Any]
+
+
+# Loaded bundles (or None when absent or stale), by data directory.
+_bundles: Dict[Path, Optional[DataBundle]] = {}
+# While a bundle is being built: the derived values computed per data directory.
+_recording: Optional[Dict[Path, Dict[str, Any]]] = None
+
+
+def bundle_path(data_dir: Path) -> Path:
+    """Where the bundle for a data directory lives: next to it, in the language package."""
+    return data_dir.parent / BUNDLE_NAME
+
+
+def bundle_version(data_dir: Path) -> str:
+    """The version a bundle for this data directory must carry to be used."""
+    return source_version(data_dir.parent)
+
+
+def load_bundle(data_dir: Path) -> Optional[DataBundle]:
+    """Returns the data directory's bundle, or None if there is no current one."""
+    if _recording is not None:
+        return None
+    if data_dir not in _bundles:
+        _bundles[data_dir] = _read_bundle(data_dir)
+    return _bundles[data_dir]
+
+
+def _read_bundle(data_dir: Path) -> Optional[DataBundle]:
+    path = bundle_path(data_dir)
+    try:
+        with open(path, "rb") as f:
+            bundle = pickle.load(f)
+    except FileNotFoundError:
+        return None
+    except Exception as e:
+        logger.warning(f"Ignoring unreadable data bundle {path}: {e}")
+        return None
+    if not isinstance(bundle, DataBundle) or bundle.format != BUNDLE_FORMAT:
+        logger.warning(f"Ignoring data bundle {path} in an outdated format; rebuild it.")
+        return None
+    if bundle.version != bundle_version(data_dir):
+        logger.warning(f"Ignoring stale data bundle {path}; rebuild it.")
+        return None
+    return bundle
+
+
+def load_data(data_dir: Path, filename: str) -> Any:
+    """
+    Returns a parsed JSON data file, from the bundle if there is one.
+
+    Raises:
+        FileNotFoundError, json.JSONDecodeError: Without a bundle, as reading the file would.
+    """
+    bundle = load_bundle(data_dir)
+    if bundle is not None and filename in bundle.files:
+        return bundle.files[filename]
+    with open(data_dir / filename, "r", encoding="utf-8") as f:
+        return json.load(f)
+
+
+def derived(data_dir: Path, key: str, compute: Callable[[], T]) -> T:
+    """
+    Returns a structure derived from a language's data, from the bundle if
+    there is one, otherwise by calling `compute`.
+
+    Args:
+        data_dir: The language's data directory.
+        key: Names the structure; unique within the language.
+        compute: Builds the structure from the JSON data. Its result must be picklable.
+    """
+    bundle = load_bundle(data_dir)
+    if bundle is not None and key in bundle.derived:
+        return bundle.derived[key]
+    value = compute()
+    if _recording is not None:
+        _recording.setdefault(data_dir, {})[key] = value
+    return value
+
+
+def _strategy_class(lang_code: str) -> Tuple[Type[NormalizerStrategy], Path]:
+    module = importlib.import_module(f"app.normalizers.{lang_code}.strategy")
+    for obj in vars(module).values():
+        if isinstance(obj, type) and issubclass(obj, NormalizerStrategy) and obj.__module__ == module.__name__:
+            return obj, Path(module.__file__).parent / "data"
+    raise ValueError(f"No normalizer strategy found for '{lang_code}'.")
+
+
+def build_bundle(lang_code: str) -> Path:
+    """
+    Builds and writes a language's bundle. The strategy is constructed from the
+    JSON files while its derived structures are recorded, then again from the
+    new bundle; both must normalize the strategy's warmup texts identically.
+
+    Returns:
+        The path of the written bundle.
+
+    Raises:
+        ValueError: If a data file is invalid, or the bundle changes the output.
+    """
+    global _recording
+    strategy_class, data_dir = _strategy_class(lang_code)
+    path = bundle_path(data_dir)
+    _bundles.pop(data_dir, None)
+
+    _recording = {}
+    try:
+        strategy = strategy_class()
+        recorded = _recording.get(data_dir, {})
+    finally:
+        _recording = None
+    expected = [strategy.normalize(text) for text in strategy_class.warmup_texts]
+
+    files: Dict[str, Any] = {}
+    for json_path in sorted(data_dir.glob("*.json")):
+        with open(json_path, "r", encoding="utf-8") as f:
+            try:
+                files[json_path.name] = json.load(f)
+            except json.JSONDecodeError as e:
+                raise ValueError(f"Invalid data file {json_path}: {e}") from e
+
+    bundle = DataBundle(BUNDLE_FORMAT, bundle_version(data_dir), files, recorded)
+    path.write_bytes(pickle.dumps(bundle, protocol=pickle.HIGHEST_PROTOCOL))
+
+    _bundles.pop(data_dir, None)
+    strategy = strategy_class()
+    if load_bundle(data_dir) is None or [strategy.normalize(text) for text in strategy_class.warmup_texts] != expected:
+        path.unlink()
+        _bundles.pop(data_dir, None)
+        raise ValueError(f"The bundle for '{lang_code}' does not reproduce the JSON data's output.")
+    return path
+
+
+def _languages() -> List[str]:
+    return sorted(p.parent.name for p in NORMALIZERS_PATH.glob("*/strategy.py"))
+
+
+def main(argv: Optional[List[str]] = None) -> None:
+    parser = argparse.ArgumentParser(description="Build precompiled language data bundles.")
+    commands = parser.add_subparsers(dest="command", required=True)
+    build = commands.add_parser("build", help="Build bundles.")
+    build.add_argument("languages", nargs="*", help="Language codes; all languages by default.")
+    args = parser.parse_args(argv)
+
+    for lang_code in args.languages or _languages():
+        path = build_bundle(lang_code)
+        print(f"Wrote {path} ({path.stat().st_size} bytes).")
+
+
+if __name__ == "__main__":
+    # Handlers record into the imported module, not into this `__main__` copy.
+    from app.normalizers import bundle
+    bundle.main()
@@ -0,0 +1,101 @@
+"""
+Splitting long texts into chunks that normalize independently.
+
+Handler patterns reach across whitespace ("2023. godine", "1.500 RSD", "5 km"),
+and some allow line breaks in that whitespace, so a sentence or paragraph
+break is only a candidate cut. A candidate is accepted if normalizing the
+text around it gives the same result as normalizing both sides separately,
+i.e. no handler match of the whole chain spans it. Normalizing the chunks and
+concatenating them then gives the same output as normalizing the whole text.
+
+Text that is still arriving (`stable_cut`) is cut after any word instead,
+holding back the end that more text could still change.
+"""
+import re
+from typing import Callable, List
+
+# A run of whitespace after sentence-ending punctuation, or one holding a blank
+# line. Chunks are cut at its end, so the whitespace stays with the left chunk.
+CANDIDATE = re.compile(r"(?<=[.!?…])\s+|\n[^\S\n]*\n\s*")
+
+# A run of whitespace; a growing text is cut at its end, so a last word that
+# may still be unfinished is never cut off.
+WORD_BREAK = re.compile(r"\s+")
+
+# Characters on each side of a cut that are normalized to verify it; far more
+# than any single handler match spans.
+CONTEXT = 256
+
+
+def is_safe_cut(text: str, pos: int, normalize: Callable[[str], str], context: int = CONTEXT) -> bool:
+    """Whether normalizing text[:pos] and text[pos:] separately agrees with normalizing them together."""
+    left = text[max(0, pos - context):pos]
+    right = text[pos:pos + context]
+    return normalize(left + right) == normalize(left) + normalize(right)
+
+
+def split_points(text: str, normalize: Callable[[str], str], size: int) -> List[int]:
+    """
+    Finds where to cut a text into chunks of roughly `size` characters.
+
+    Each chunk ends at the first safe cut at least `size` characters after its
+    start; if there is none, the rest of the text stays one chunk.
+
+    Args:
+        text: The text to split.
+        normalize: The strategy's normalize function, used to verify cuts.
+        size: The minimum chunk length in characters.
+
+    Returns:
+        The cut positions in ascending order, excluding 0 and len(text).
+    """
+    points: List[int] = []
+    start = 0
+    while len(text) - start > size:
+        for candidate in CANDIDATE.finditer(text, start + size):
+            pos = candidate.end()
+            if pos < len(text) and is_safe_cut(text, pos, normalize):
+                points.append(pos)
+                start = pos
+                break
+        else:
+            break
+    return points
+
+
+def stable_cut(
+        text: str, normalize: Callable[[str], str], open_tail: Callable[[str], int], attempts: int = 8
+) -> int:
+    """
+    Finds how much of a text that is still growing can be normalized already.
+
+    The words a handler match could still take in are held back (see
+    `NormalizerStrategy.open_tail`), and so is the last word unless the text
+    ends in whitespace. The text is cut at the last word break before them
+    that is also a safe cut.
+
+    Args:
+        text: The text received so far.
+        normalize: The strategy's normalize function, used to verify cuts.
+        open_tail: The strategy's open_tail function.
+        attempts: How many word breaks to try, from the last one back.
+
+    Returns:
+        The cut position, or 0 if all of the text is held back.
+    """
+    breaks = [match.end() for match in WORD_BREAK.finditer(text)]
+    limit = open_tail(text)
+    candidates = [i for i, pos in enumerate(breaks) if pos <= limit]
+    for i in reversed(candidates[-attempts:]):
+        # The last word may still change into anything, so a cut is verified
+        # against the complete words after it, and against every shorter run of
+        # them, since a later word can change how the ones before it match.
+        if all(is_safe_cut(text[:end], breaks[i], normalize) for end in breaks[i + 1:]):
+            return breaks[i]
+    return 0
+
+
+def split(text: str, points: List[int]) -> List[str]:
+    """Cuts a text at the given positions."""
+    bounds = [0, *points, len(text)]
+    return [text[a:b] for a, b in zip(bounds, bounds[1:])]
@@ -1,18 +1,26 @@
 import re
-from num2words import num2words
+from app.normalizers.regex_trie import trie_pattern
 from .base_handler import GermanBaseHandler, safe_replacement
 
+# Tokens the pattern recognizes; codes only count as a whole word.
+CURRENCY_SYMBOLS = ("€", "$", "£", "¥", "₹", "₿")
+CURRENCY_CODES = ("USD", "EUR", "GBP", "JPY", "CHF", "BTC")
+
 
 class GermanCurrencyHandler(GermanBaseHandler):
     """Normalizes currency formats like €1.234,56, $11.230,00, 1.234,56€, or 500 EUR."""
 
+    trigger = re.compile(trie_pattern(CURRENCY_SYMBOLS + CURRENCY_CODES))
+    # Codes only follow an amount; a match begins with the amount or a symbol.
+    opener = re.compile(rf"\d|{trie_pattern(CURRENCY_SYMBOLS)}")
+    reach = 1
     # Universal currency pattern - matches ANY number format with currency context
     pattern = re.compile(
-        r"(?P<prefix_symbol>€|\$|£|¥|₹|₿)[\u00A0\s]*"
+        rf"(?P<prefix_symbol>{trie_pattern(CURRENCY_SYMBOLS)})[\u00A0\s]*"
         r"(?P<prefix_amount>\d{1,3}(?:[.,]\d{3})*(?:[.,]\d{1,2})?|\d+(?:[.,]\d{1,2})?)\b"
         r"|"
         r"(?P<suffix_amount>\d{1,3}(?:[.,]\d{3})*(?:[.,]\d{1,2})?|\d+(?:[.,]\d{1,2})?)[\u00A0\s]*"
-        r"(?P<suffix_code>USD\b|EUR\b|GBP\b|JPY\b|CHF\b|BTC\b|[€$£¥₹₿])"
+        rf"(?P<suffix_code>{trie_pattern(CURRENCY_CODES)}\b|{trie_pattern(CURRENCY_SYMBOLS)})"
     )
 
     def __init__(self):
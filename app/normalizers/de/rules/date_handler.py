@@ -1,16 +1,26 @@
 import re
-from num2words import num2words
+from app.normalizers.number_words import number_to_words
+from app.normalizers.base import HAS_DIGIT
+from app.normalizers.tables import FIRST_YEAR, LAST_YEAR, IntTable
 from .base_handler import GermanBaseHandler, safe_replacement
 
 
 class GermanDateHandler(GermanBaseHandler):
     """Normalizes dates in DD.MM.YYYY. format (EU standard)."""
 
+    trigger = HAS_DIGIT
+    opener = HAS_DIGIT
+    reach = 0
     pattern = re.compile(r"\b(\d{1,2})\.(\d{1,2})\.(\d{4})\.?\b")
 
     def __init__(self):
-        self._months = self._load_json_data("months.json")
-        self._ordinals = self._load_json_data("ordinals.json")
+        self._months = self._derived(
+            "date.months", lambda: IntTable.from_mapping(self._load_json_data("months.json"))
+        )
+        self._ordinals = self._derived(
+            "date.ordinals", lambda: IntTable.from_mapping(self._load_json_data("ordinals.json"))
+        )
+        self._years = self._derived("date.years", lambda: IntTable.build(FIRST_YEAR, LAST_YEAR + 1, self._to_year))
 
     @safe_replacement
     def _replace(self, day_str: str, month_str: str, year_str: str) -> str:
@@ -21,13 +31,18 @@ class GermanDateHandler(GermanBaseHandler):
             raise ValueError(f"Invalid date: D={d}, M={m}")
 
         # Get ordinal form (e.g., "1." → "ersten", "12." → "zwölften")
-        day_text = self._ordinals.get(str(d))
-        month_text = self._months.get(str(m))
+        day_text = self._ordinals.get(d)
+        month_text = self._months.get(m)
 
         if day_text is None or month_text is None:
             raise ValueError(f"Day '{d}' or month '{m}' out of range for lookup.")
 
         # Convert year to German words
-        year_text = num2words(y, lang="de")
+        year_text = self._years.get(y)
+        if year_text is None:
+            year_text = self._to_year(y)
 
-        return f"{day_text} {month_text} {year_text}"
\ No newline at end of file
+        return f"{day_text} {month_text} {year_text}"
+
+    def _to_year(self, y: int) -> str:
+        return number_to_words(y, "de")
@@ -1,6 +1,7 @@
 import re
 from typing import Dict
-from num2words import num2words
+from app.normalizers.regex_trie import trie_pattern
+from app.normalizers.base import HAS_DIGIT
 from .base_handler import GermanBaseHandler, safe_replacement
 
 
@@ -13,6 +14,9 @@ class GermanMeasurementHandler(GermanBaseHandler):
     - 25°C → fünfundzwanzig Grad Celsius
     """
 
+    trigger = HAS_DIGIT
+    opener = HAS_DIGIT
+    reach = 1
     pattern = re.compile("")
 
     def __init__(self) -> None:
@@ -20,9 +24,8 @@ class GermanMeasurementHandler(GermanBaseHandler):
         self._units_map: Dict[str, str] = data.get("units", {})
 
         if self._units_map:
-            # Sort by length (longest first) to match compound units like "km/h" before "km"
-            sorted_units = sorted(self._units_map.keys(), key=len, reverse=True)
-            unit_pattern = "|".join(re.escape(unit) for unit in sorted_units)
+            # Prefix-factored, so compound units like "km/h" are still tried before "km"
+            unit_pattern = self._derived("measurements.unit_pattern", lambda: trie_pattern(self._units_map))
 
             # Build regex: number (with German format) + optional space + unit
             self.pattern = re.compile(
@@ -59,6 +62,3 @@ class GermanMeasurementHandler(GermanBaseHandler):
                 return f"{dec_text} {normalized_unit}"
 
         return normalized_unit
-
-    def _to_cardinal(self, n: int) -> str:
-        return num2words(n, lang="de", to="cardinal")
\ No newline at end of file
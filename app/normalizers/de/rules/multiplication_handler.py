@@ -1,5 +1,5 @@
 import re
-from num2words import num2words
+from app.normalizers.base import HAS_DIGIT
 from .base_handler import GermanBaseHandler, safe_replacement
 
 
@@ -15,6 +15,8 @@ class GermanMultiplicationHandler(GermanBaseHandler):
     - Optional spaces: 2556 × 1179
     """
 
+    trigger = HAS_DIGIT
+    opener = HAS_DIGIT
     # Match: number + (x or × or *) + number, with optional spaces
     pattern = re.compile(r"\b(\d+)\s*[x×*]\s*(\d+)\b", re.IGNORECASE)
 
@@ -27,7 +29,3 @@ class GermanMultiplicationHandler(GermanBaseHandler):
         second_text = self._to_cardinal(second_num)
 
         return f"{first_text} mal {second_text}"
-
-    def _to_cardinal(self, n: int) -> str:
-        """Convert number to German cardinal."""
-        return num2words(n, lang="de", to="cardinal")
\ No newline at end of file
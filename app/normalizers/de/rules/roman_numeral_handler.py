@@ -1,5 +1,5 @@
 import re
-from num2words import num2words
+from app.normalizers.number_words import number_to_words
 from .base_handler import GermanBaseHandler, safe_replacement
 
 
@@ -16,6 +16,9 @@ class GermanRomanNumeralHandler(GermanBaseHandler):
     - M → eintausend
     """
 
+    trigger = re.compile(r"[IVXLCDM]", re.IGNORECASE)
+    opener = trigger
+    reach = 0
     # Strict pattern: word boundary + valid Roman numeral + word boundary
     # This prevents matching empty strings or partial Roman numerals
     pattern = re.compile(
@@ -38,4 +41,4 @@ class GermanRomanNumeralHandler(GermanBaseHandler):
             # Not a valid Roman numeral, return original
             raise ValueError(f"'{roman_str}' is not a supported Roman numeral.")
 
-        return num2words(num, lang="de", to="cardinal")
\ No newline at end of file
+        return number_to_words(num, "de")
\ No newline at end of file
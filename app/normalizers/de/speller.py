@@ -0,0 +1,75 @@
+"""
+German number speller composing words from a precomputed table of every
+three-digit group.
+
+It spells exactly what num2words' `lang_DE` does ("einhunderteinstausend",
+"eine Million eins", see `benchmarks/spellers.py`), at a fraction of the cost
+per number.
+"""
+from typing import Callable, Dict, Tuple
+
+# Numbers spelled here are below this in absolute value; num2words spells the rest.
+LIMIT = 10 ** 21
+
+LOW = ("null", "eins", "zwei", "drei", "vier", "fünf", "sechs", "sieben", "acht", "neun", "zehn",
+       "elf", "zwölf", "dreizehn", "vierzehn", "fünfzehn", "sechzehn", "siebzehn", "achtzehn", "neunzehn")
+TENS = ("", "", "zwanzig", "dreißig", "vierzig", "fünfzig", "sechzig", "siebzig", "achtzig", "neunzig")
+# Scale words from a million up, singular and plural; lower scales are compounded.
+SCALES = (
+    ("Million", "Millionen"),
+    ("Milliarde", "Milliarden"),
+    ("Billion", "Billionen"),
+    ("Billiarde", "Billiarden"),
+    ("Trillion", "Trillionen"),
+)
+
+
+def _below_hundred(n: int) -> str:
+    if n < 20:
+        return LOW[n]
+    tens, unit = divmod(n, 10)
+    if not unit:
+        return TENS[tens]
+    return f"{'ein' if unit == 1 else LOW[unit]}und{TENS[tens]}"
+
+
+def _group(n: int) -> str:
+    hundreds, rest = divmod(n, 100)
+    if not hundreds:
+        return _below_hundred(rest)
+    prefix = "ein" if hundreds == 1 else LOW[hundreds]
+    return f"{prefix}hundert{_below_hundred(rest) if rest else ''}"
+
+
+GROUPS: Tuple[str, ...] = tuple(_group(n) for n in range(1000))
+# Thousands are compounded with the group before them: "eintausend", "zweiundzwanzigtausend".
+THOUSANDS: Tuple[str, ...] = ("",) + tuple("eintausend" if n == 1 else f"{GROUPS[n]}tausend" for n in range(1, 1000))
+
+
+def cardinal(n: int) -> str:
+    if n < 0:
+        return "minus " + cardinal(-n)
+    if n < 1000:
+        return GROUPS[n]
+    n, units = divmod(n, 1000)
+    n, thousands = divmod(n, 1000)
+    # Below a million, groups are written as one word.
+    low = THOUSANDS[thousands] + (GROUPS[units] if units else "")
+    parts = []
+    scale = 0
+    while n:
+        n, group = divmod(n, 1000)
+        if group == 1:
+            parts.append(f"eine {SCALES[scale][0]}")
+        elif group:
+            parts.append(f"{GROUPS[group]} {SCALES[scale][1]}")
+        scale += 1
+    parts.reverse()
+    if low:
+        parts.append(low)
+    return " ".join(parts)
+
+
+SPELLERS: Dict[str, Callable[[int], str]] = {
+    "cardinal": cardinal,
+}
@@ -1,4 +1,7 @@
-from app.normalizers.base import NormalizerStrategy, NormalizationHandler
+from typing import Dict, List, Optional, Tuple
+
+from app.normalizers.base import HandlerStats, HandlerTrace, NormalizationEngine, NormalizationHandler, NormalizerStrategy, build_engine
+from app.normalizers.spans import OffsetMap
 
 from .rules.date_handler import GermanDateHandler
 from .rules.currency_handler import GermanCurrencyHandler
@@ -13,9 +16,15 @@ class GermanNormalizerStrategy(NormalizerStrategy):
     The concrete strategy for normalizing German text.
     It constructs and executes a chain of normalization handlers.
     """
+    warmup_texts = (
+        "Wir kauften ein Haus am 12.05.2023. für $150.000 und ein Auto für €25.000.",
+        "Formel I Wagen aus 2024 fährt 350 km/h mit 1000 kg Gewicht.",
+        "Lautsprecher 5×100 W, 6,1 Zoll Bildschirm und 85 m² für 2.500 EUR.",
+    )
 
-    def __init__(self):
+    def __init__(self, engine: Optional[str] = None):
         self._chain_head: NormalizationHandler = self._build_chain()
+        self._engine: NormalizationEngine = build_engine(self._chain_head, engine)
 
     def _build_chain(self) -> NormalizationHandler:
         """
@@ -47,4 +56,28 @@ class GermanNormalizerStrategy(NormalizerStrategy):
         """
         Executes the normalization chain on the input text.
         """
-        return self._chain_head.handle(text)
\ No newline at end of file
+        return self._engine.run(text)
+
+    def handler_stats(self) -> Dict[str, HandlerStats]:
+        """
+        Reports how often each handler of the chain ran and was skipped, its matches and its time.
+        """
+        return self._engine.handler_stats()
+
+    def normalize_traced(self, text: str) -> Tuple[str, List[HandlerTrace]]:
+        """
+        Runs the chain handler by handler, recording each handler's time, matches and growth.
+        """
+        return self._engine.trace(text)
+
+    def normalize_mapped(self, text: str) -> Tuple[str, Optional[OffsetMap]]:
+        """
+        Normalizes the text and, with the span engine, maps offsets between the text and the result.
+        """
+        return self._engine.run_mapped(text)
+
+    def open_tail(self, text: str) -> int:
+        """
+        Finds the end of a growing text that a handler of the chain could still take in.
+        """
+        return self._engine.open_tail(text)
\ No newline at end of file
@@ -3,14 +3,18 @@ import json
 import logging
 import re
 from pathlib import Path
-from typing import Any, Callable, Match
+from typing import Any, Callable, Match, TypeVar
 
-from app.normalizers.base import NormalizationHandler
+from app.normalizers import bundle
+from app.normalizers.base import NormalizationHandler, Rule
+from app.normalizers.number_words import number_to_words
 
 logger = logging.getLogger(__name__)
 
 EN_DATA_PATH = Path(__file__).parent.parent / "data"
 
+T = TypeVar("T")
+
 
 def safe_replacement(func: Callable[..., str]) -> Callable[..., str]:
     """
@@ -44,21 +48,30 @@ class EnglishBaseHandler(NormalizationHandler):
 
     @staticmethod
     def _load_json_data(filename: str) -> Any:
-        """Loads data from a JSON file in the English data directory."""
+        """Loads data from a JSON file in the English data directory, or from its bundle."""
         try:
-            with open(EN_DATA_PATH / filename, "r", encoding="utf-8") as f:
-                return json.load(f)
+            return bundle.load_data(EN_DATA_PATH, filename)
         except (FileNotFoundError, json.JSONDecodeError) as e:
             logger.error(f"Failed to load data from {filename}: {e}")
             return {}
 
-    def handle(self, text: str) -> str:
+    @staticmethod
+    def _derived(key: str, compute: Callable[[], T]) -> T:
+        """Returns a structure derived from the English data, from the bundle if one is current."""
+        return bundle.derived(EN_DATA_PATH, key, compute)
+
+    def apply(self, text: str) -> str:
+        """
+        Applies the handler's regex substitution to the text.
+        """
+        return self._sub(self.pattern, self._replace, text)
+
+    def rules(self) -> list[Rule]:
         """
-        Applies the handler's regex substitution and passes the result
-        to the next handler in the chain.
+        Exposes the handler's pattern and replacement so they can be merged
+        into a single-pass scan.
         """
-        normalized_text = self.pattern.sub(self._replace, text)
-        return super().handle(normalized_text)
+        return [(self.pattern, self._replace)]
 
     def _replace(self, match: Match) -> str:
         """
@@ -158,5 +171,4 @@ class EnglishBaseHandler(NormalizationHandler):
 
     def _to_cardinal(self, n: int) -> str:
         """Convert number to English words (e.g., 123 → 'one hundred twenty-three')"""
-        from num2words import num2words
-        return num2words(n, lang="en")
\ No newline at end of file
+        return number_to_words(n, "en")
\ No newline at end of file
@@ -1,5 +1,5 @@
 import re
-from num2words import num2words
+from app.normalizers.base import HAS_DIGIT
 from .base_handler import EnglishBaseHandler, safe_replacement
 
 
@@ -15,6 +15,8 @@ class EnglishMultiplicationHandler(EnglishBaseHandler):
     - Optional spaces: 2556 × 1179
     """
 
+    trigger = HAS_DIGIT
+    opener = HAS_DIGIT
     # Match: number + (x or × or *) + number, with optional spaces
     pattern = re.compile(r"\b(\d+)\s*[x×*]\s*(\d+)\b", re.IGNORECASE)
 
@@ -27,7 +29,3 @@ class EnglishMultiplicationHandler(EnglishBaseHandler):
         second_text = self._to_cardinal(second_num)
 
         return f"{first_text} times {second_text}"
-
-    def _to_cardinal(self, n: int) -> str:
-        """Convert number to English cardinal."""
-        return num2words(n, lang="en", to="cardinal")
\ No newline at end of file
@@ -1,5 +1,5 @@
 import re
-from num2words import num2words
+from app.normalizers.base import HAS_DIGIT
 from .base_handler import EnglishBaseHandler, safe_replacement
 
 
@@ -10,6 +10,9 @@ class EnglishNumberHandler(EnglishBaseHandler):
     Handles both US format (1,234.50) and simple formats (1000, 1000.50)
     """
 
+    trigger = HAS_DIGIT
+    opener = HAS_DIGIT
+    reach = 0
     pattern = re.compile(r"\b(\d+(?:[.,]\d+)?)\b")
 
     @safe_replacement
@@ -26,6 +29,3 @@ class EnglishNumberHandler(EnglishBaseHandler):
             return f"{whole_text} point {dec_text}"
         else:
             return self._to_cardinal(whole_val)
-
-    def _to_cardinal(self, n: int) -> str:
-        return num2words(n, lang="en", to="cardinal")
\ No newline at end of file
@@ -1,9 +1,12 @@
 import re
-from num2words import num2words
+from app.normalizers.number_words import number_to_words
 from .base_handler import EnglishBaseHandler, safe_replacement
 
 class EnglishRomanNumeralHandler(EnglishBaseHandler):
     """Normalizes Roman numerals from I to XX."""
+    trigger = re.compile(r"[IVX]")
+    opener = trigger
+    reach = 0
     pattern = re.compile(
         r"\b((?:X{1,2}|IX|IV|V|X|I{1,3}|VI{0,3}|XI{1,2}|XIV|XV|XVI{0,3}|XIX|XX))\b"
     )
@@ -16,4 +19,4 @@ class EnglishRomanNumeralHandler(EnglishBaseHandler):
         num = self._roman_to_num.get(roman_str)
         if num is None:
             raise ValueError(f"'{roman_str}' is not a supported Roman numeral.")
-        return num2words(num, lang="en", to="cardinal")
+        return number_to_words(num, "en")
@@ -1,25 +1,126 @@
-from typing import Dict, Type
+import importlib
+import importlib.util
+from importlib import metadata
+from pathlib import Path
+from typing import Dict, List, Tuple, Type, Union
 from app.core.exceptions import LanguageNotSupportedError
 from app.normalizers.base import NormalizerStrategy
 
+# Entry point group through which installed packages contribute strategies.
+ENTRY_POINT_GROUP = "text_normalizer.strategies"
+
+# A strategy class, or where to import it from as "package.module:ClassName".
+StrategySpec = Union[Type[NormalizerStrategy], str]
+
+# The languages shipped with the service, by import path, so a language's
+# handlers and number speller are only imported where and when it is first used.
+BUILTIN_STRATEGIES: Dict[str, str] = {
+    "sr": "app.normalizers.sr.strategy:SerbianNormalizerStrategy",
+    "en": "app.normalizers.en.strategy:EnglishNormalizerStrategy",
+    "de": "app.normalizers.de.strategy:GermanNormalizerStrategy",
+}
+
+
+def _split_spec(spec: str) -> Tuple[str, str]:
+    module_name, _, class_name = spec.partition(":")
+    if not module_name or not class_name:
+        raise ValueError(f"Invalid strategy '{spec}'; expected 'package.module:ClassName'.")
+    return module_name, class_name
+
 
 class NormalizerFactory:
     """
     Factory for creating and managing language-specific normalizer strategies.
     This class follows the Singleton pattern to ensure a single registry.
+
+    A strategy can be registered by import path instead of by class, in which
+    case its module (and every handler it imports) is only imported when the
+    strategy is first needed.
     """
     _instance = None
     
     def __new__(cls):
         if cls._instance is None:
             cls._instance = super(NormalizerFactory, cls).__new__(cls)
-            cls._instance._strategies: Dict[str, Type[NormalizerStrategy]] = {}
+            cls._instance._strategies: Dict[str, StrategySpec] = {}
+            cls._instance._classes: Dict[str, Type[NormalizerStrategy]] = {}
             cls._instance._cache: Dict[str, NormalizerStrategy] = {}
         return cls._instance
 
-    def register(self, lang_code: str, strategy_class: Type[NormalizerStrategy]) -> None:
-        """Registers a new normalizer strategy class for a given language code."""
-        self._strategies[lang_code] = strategy_class
+    def register(self, lang_code: str, strategy: StrategySpec) -> None:
+        """
+        Registers a normalizer strategy for a given language code.
+
+        Args:
+            lang_code: The two-letter language code (e.g., 'sr').
+            strategy: The strategy class, or its import path as "package.module:ClassName".
+
+        Raises:
+            ValueError: If an import path is malformed.
+        """
+        if isinstance(strategy, str):
+            _split_spec(strategy)
+        self._strategies[lang_code] = strategy
+        self._classes.pop(lang_code, None)
+        self._cache.pop(lang_code, None)
+
+    def register_entry_points(self, group: str = ENTRY_POINT_GROUP) -> List[str]:
+        """
+        Registers the strategies installed packages declare as entry points,
+        named by language code, without importing them.
+
+        Returns:
+            The registered language codes.
+        """
+        lang_codes = []
+        for entry_point in metadata.entry_points(group=group):
+            self.register(entry_point.name, entry_point.value)
+            lang_codes.append(entry_point.name)
+        return lang_codes
+
+    def is_registered(self, lang_code: str) -> bool:
+        """Checks whether a strategy is registered for the language code."""
+        return lang_code in self._strategies
+
+    def registrations(self) -> Dict[str, StrategySpec]:
+        """Returns a copy of the registered language codes and their strategies, as registered."""
+        return dict(self._strategies)
+
+    def strategy_class(self, lang_code: str) -> Type[NormalizerStrategy]:
+        """
+        Returns the strategy class for the language code, importing it on first use.
+
+        Raises:
+            LanguageNotSupportedError: If no strategy is registered for the lang_code.
+        """
+        strategy_class = self._classes.get(lang_code)
+        if strategy_class is None:
+            spec = self._strategies.get(lang_code)
+            if spec is None:
+                raise LanguageNotSupportedError(lang_code)
+            if isinstance(spec, str):
+                module_name, class_name = _split_spec(spec)
+                spec = getattr(importlib.import_module(module_name), class_name)
+            strategy_class = self._classes[lang_code] = spec
+        return strategy_class
+
+    def package_path(self, lang_code: str) -> Path:
+        """
+        Returns the directory of the package the language's strategy lives in,
+        without importing the strategy.
+
+        Raises:
+            LanguageNotSupportedError: If no strategy is registered for the lang_code.
+        """
+        spec = self._strategies.get(lang_code)
+        if spec is None:
+            raise LanguageNotSupportedError(lang_code)
+        module_name = _split_spec(spec)[0] if isinstance(spec, str) else spec.__module__
+        return Path(importlib.util.find_spec(module_name).origin).parent
+
+    def strategies(self) -> Dict[str, NormalizerStrategy]:
+        """Returns the strategies built so far, by language code."""
+        return dict(self._cache)
 
     def get_strategy(self, lang_code: str) -> NormalizerStrategy:
         """
@@ -38,11 +139,7 @@ class NormalizerFactory:
         if lang_code in self._cache:
             return self._cache[lang_code]
 
-        strategy_class = self._strategies.get(lang_code)
-        if not strategy_class:
-            raise LanguageNotSupportedError(lang_code)
-        
-        instance = strategy_class()
+        instance = self.strategy_class(lang_code)()
         self._cache[lang_code] = instance
         return instance
 
@@ -0,0 +1,270 @@
+"""
+Gazetteer matching for large phrase lexicons (brands, products, names).
+
+Keys are casefolded phrases that start and end with a word character. Text is
+scanned one `\\w+` run at a time: a run that begins some key is extended over
+the following runs, and the longest phrase that is a key wins. Each step is a
+hash lookup, so the cost per word depends on the longest key (in words), not on
+the number of keys. Matches respect word boundaries exactly like
+`\\b(?:key1|key2|...)\\b` with `re.IGNORECASE`, longest key first.
+
+Two interchangeable indexes are provided: `DictGazetteer` keeps the lexicon in
+Python dicts, while `MappedGazetteer` reads a compact, prebuilt index file
+through `mmap`, so every worker process shares one copy through the page cache.
+
+Build an index file with:
+
+    python -m app.normalizers.gazetteer build app/normalizers/sr/data/brands.json brands.gzt --section brands
+"""
+import argparse
+import json
+import mmap
+import re
+import struct
+import zlib
+from abc import ABC, abstractmethod
+from pathlib import Path
+from typing import Dict, Iterator, List, Mapping, Optional, Tuple, Union
+
+WORD_RUN = re.compile(r"\w+")
+
+# Index file layout: header, open-addressing slot table, then a blob of UTF-8 strings.
+MAGIC = b"GZT1"
+HEADER = struct.Struct("<4sIII")  # magic, slot count (power of two), max words per key, entry count
+SLOT = struct.Struct("<IIIIB3x")  # key offset, key length, value offset, value length, flags
+
+IS_KEY = 1  # the slot holds a full key and its value
+STARTS_KEY = 2  # the slot's string is the first word of at least one key
+
+
+def fold(text: str) -> str:
+    """
+    Casefolds text without changing its length, so offsets in the folded text
+    are offsets in the original. Characters that casefold to several characters
+    (e.g. "ß") fall back to `lower()`, or stay unchanged.
+    """
+    folded = text.casefold()
+    if len(folded) == len(text):
+        return folded
+    return "".join(_fold_char(c) for c in text)
+
+
+def _fold_char(c: str) -> str:
+    for candidate in (c.casefold(), c.lower()):
+        if len(candidate) == 1:
+            return candidate
+    return c
+
+
+# Folded key -> value, folded first words of keys, and the most words in a key.
+PreparedLexicon = Tuple[Dict[str, str], Dict[str, int], int]
+
+
+def prepare(lexicon: Mapping[str, str]) -> PreparedLexicon:
+    """
+    Folds and validates keys; the first spelling of a key wins, as in the lexicon order.
+
+    Raises:
+        ValueError: If a key does not start and end with a word character.
+    """
+    entries: Dict[str, str] = {}
+    first_words: Dict[str, int] = {}
+    max_words = 0
+    for key, value in lexicon.items():
+        folded = fold(key)
+        runs = WORD_RUN.findall(folded)
+        if not runs or not folded.startswith(runs[0]) or not folded.endswith(runs[-1]):
+            raise ValueError(f"Gazetteer key '{key}' must start and end with a word character.")
+        entries.setdefault(folded, value)
+        first_words[runs[0]] = 1
+        max_words = max(max_words, len(runs))
+    return entries, first_words, max_words
+
+
+class Gazetteer(ABC):
+    """Longest-match phrase replacement over a casefolded lexicon."""
+    max_words = 0
+
+    @abstractmethod
+    def get(self, folded: str) -> Optional[str]:
+        """Returns the value of a folded key, or None."""
+        pass
+
+    @abstractmethod
+    def starts_key(self, folded_word: str) -> bool:
+        """Checks whether some key begins with this folded word."""
+        pass
+
+    def finditer(self, text: str) -> Iterator[Tuple[int, int, str]]:
+        """Yields (start, end, value) of non-overlapping matches, left to right."""
+        if not self.max_words:
+            return
+        folded = fold(text)
+        runs = [m.span() for m in WORD_RUN.finditer(folded)]
+        i = 0
+        while i < len(runs):
+            start, end = runs[i]
+            if self.starts_key(folded[start:end]):
+                for last in range(min(i + self.max_words, len(runs)) - 1, i - 1, -1):
+                    stop = runs[last][1]
+                    value = self.get(folded[start:stop])
+                    if value is not None:
+                        yield start, stop, value
+                        i = last
+                        break
+            i += 1
+
+    def sub(self, text: str) -> str:
+        """Replaces every matched phrase in text with its value."""
+        return self.subn(text)[0]
+
+    def subn(self, text: str) -> Tuple[str, int]:
+        """Like `sub`, also returning the number of replaced phrases."""
+        parts: List[str] = []
+        pos = 0
+        for start, end, value in self.finditer(text):
+            parts.append(text[pos:start])
+            parts.append(value)
+            pos = end
+        if not parts:
+            return text, 0
+        parts.append(text[pos:])
+        return "".join(parts), len(parts) // 2
+
+
+class DictGazetteer(Gazetteer):
+    """Gazetteer backed by in-memory dicts; simplest for small and medium lexicons."""
+
+    def __init__(self, lexicon: Mapping[str, str]):
+        self._entries, self._first_words, self.max_words = prepare(lexicon)
+
+    @classmethod
+    def from_prepared(cls, prepared: PreparedLexicon) -> "DictGazetteer":
+        """Wraps a lexicon already run through `prepare`, e.g. one loaded from a data bundle."""
+        gazetteer = cls.__new__(cls)
+        gazetteer._entries, gazetteer._first_words, gazetteer.max_words = prepared
+        return gazetteer
+
+    def get(self, folded: str) -> Optional[str]:
+        return self._entries.get(folded)
+
+    def starts_key(self, folded_word: str) -> bool:
+        return folded_word in self._first_words
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+
+class MappedGazetteer(Gazetteer):
+    """
+    Gazetteer backed by a prebuilt index file (see `build_index`), read through
+    mmap. Lookups hash the UTF-8 key with CRC-32 and probe a fixed slot table,
+    so nothing is deserialized at load time.
+    """
+
+    def __init__(self, buffer: Union[bytes, mmap.mmap]):
+        magic, self._slot_count, self.max_words, self._count = HEADER.unpack_from(buffer, 0)
+        if magic != MAGIC:
+            raise ValueError("Not a gazetteer index file.")
+        self._buffer = buffer
+        self._mask = self._slot_count - 1
+        self._blob = HEADER.size + self._slot_count * SLOT.size
+
+    @classmethod
+    def open(cls, path: Union[str, Path]) -> "MappedGazetteer":
+        """Memory-maps an index file read-only."""
+        with open(path, "rb") as f:
+            return cls(mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ))
+
+    def _find(self, folded: str) -> Optional[Tuple[int, int, int]]:
+        data = folded.encode("utf-8")
+        buffer, blob = self._buffer, self._blob
+        i = zlib.crc32(data) & self._mask
+        while True:
+            key_off, key_len, value_off, value_len, flags = SLOT.unpack_from(buffer, HEADER.size + i * SLOT.size)
+            if not flags:
+                return None
+            if key_len == len(data) and buffer[blob + key_off:blob + key_off + key_len] == data:
+                return flags, value_off, value_len
+            i = (i + 1) & self._mask
+
+    def get(self, folded: str) -> Optional[str]:
+        found = self._find(folded)
+        if found is None or not found[0] & IS_KEY:
+            return None
+        _, value_off, value_len = found
+        start = self._blob + value_off
+        return self._buffer[start:start + value_len].decode("utf-8")
+
+    def starts_key(self, folded_word: str) -> bool:
+        found = self._find(folded_word)
+        return found is not None and bool(found[0] & STARTS_KEY)
+
+    def __len__(self) -> int:
+        return self._count
+
+
+def build_index(lexicon: Mapping[str, str]) -> bytes:
+    """
+    Serializes a lexicon into the index format read by `MappedGazetteer`.
+
+    Raises:
+        ValueError: If a key does not start and end with a word character.
+    """
+    entries, first_words, max_words = prepare(lexicon)
+    strings: Dict[str, Tuple[int, int]] = {}
+    blob = bytearray()
+
+    def intern(s: str) -> Tuple[int, int]:
+        if s not in strings:
+            data = s.encode("utf-8")
+            strings[s] = (len(blob), len(data))
+            blob.extend(data)
+        return strings[s]
+
+    records: Dict[str, List[int]] = {}
+    for key, value in entries.items():
+        records[key] = [*intern(key), *intern(value), IS_KEY]
+    for word in first_words:
+        if word in records:
+            records[word][4] |= STARTS_KEY
+        else:
+            records[word] = [*intern(word), 0, 0, STARTS_KEY]
+
+    slot_count = 1
+    while slot_count < 2 * len(records):
+        slot_count *= 2
+    slots = bytearray(slot_count * SLOT.size)
+    used = bytearray(slot_count)
+    for key, record in records.items():
+        i = zlib.crc32(key.encode("utf-8")) & (slot_count - 1)
+        while used[i]:
+            i = (i + 1) & (slot_count - 1)
+        used[i] = 1
+        SLOT.pack_into(slots, i * SLOT.size, *record)
+
+    return HEADER.pack(MAGIC, slot_count, max_words, len(entries)) + bytes(slots) + bytes(blob)
+
+
+def _load_lexicon(path: Path, section: Optional[str]) -> Dict[str, str]:
+    with open(path, "r", encoding="utf-8") as f:
+        data = json.load(f)
+    return data[section] if section else data
+
+
+def main(argv: Optional[List[str]] = None) -> None:
+    parser = argparse.ArgumentParser(description="Build a memory-mappable gazetteer index from a JSON lexicon.")
+    commands = parser.add_subparsers(dest="command", required=True)
+    build = commands.add_parser("build", help="Build an index file.")
+    build.add_argument("source", type=Path, help="JSON object mapping phrases to replacements.")
+    build.add_argument("output", type=Path, help="Where to write the index.")
+    build.add_argument("--section", help="Read the lexicon from this top-level key of the JSON file.")
+    args = parser.parse_args(argv)
+
+    lexicon = _load_lexicon(args.source, args.section)
+    args.output.write_bytes(build_index(lexicon))
+    print(f"Wrote {len(lexicon)} entries to {args.output}.")
+
+
+if __name__ == "__main__":
+    main()
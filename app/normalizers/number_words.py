@@ -0,0 +1,152 @@
+import importlib
+import importlib.util
+import sys
+import threading
+from functools import lru_cache
+from types import ModuleType
+from typing import Any, Callable, Dict, NamedTuple, Optional, Tuple
+
+from app.core.config import settings
+
+
+class NumberWordsCacheInfo(NamedTuple):
+    """Counters of the shared number-to-words cache."""
+    hits: int
+    misses: int
+    evictions: int
+    maxsize: int
+    currsize: int
+
+
+def _sr_thousand(text: str) -> str:
+    # Fix for "jedna hiljada" → "hiljadu" (accusative case)
+    if text.startswith("jedna hiljada"):
+        return text.replace("jedna hiljada", "hiljadu", 1)
+    return text
+
+
+# Language-specific corrections applied to the num2words output before it is cached.
+# The native spellers have them built in.
+_FIXUPS: Dict[Tuple[str, str], Callable[[str], str]] = {
+    ("sr", "cardinal"): _sr_thousand,
+    ("sr", "year"): _sr_thousand,
+}
+
+# Conversions that raised; lru_cache counts them as misses but stores nothing.
+_failures = 0
+
+# Native spellers by language, loaded on first use: each language package's
+# `speller` module, whose SPELLERS map conversion modes to functions that
+# spell ints below its LIMIT. None if the language has no speller.
+_spellers: Dict[str, Optional[ModuleType]] = {}
+
+# num2words converter instances, by language, loaded on first use.
+_converters: Dict[str, Any] = {}
+_converters_lock = threading.Lock()
+
+# The num2words package directory, loaded under this name without running its
+# __init__, so converter modules can be imported one at a time.
+_PRIVATE_PACKAGE = "_app_num2words"
+
+
+def _private_package() -> str:
+    """
+    Registers the num2words directory as a package of its own name, leaving
+    `num2words` itself untouched; its modules import each other relatively,
+    so they load under that name as they would under `num2words`.
+    """
+    if _PRIVATE_PACKAGE not in sys.modules:
+        spec = importlib.util.find_spec("num2words")
+        package = importlib.util.spec_from_file_location(
+            _PRIVATE_PACKAGE, spec.origin, submodule_search_locations=list(spec.submodule_search_locations)
+        )
+        sys.modules[_PRIVATE_PACKAGE] = importlib.util.module_from_spec(package)
+    return _PRIVATE_PACKAGE
+
+
+def _converter(lang: str) -> Any:
+    """
+    Returns the num2words converter for a language. Unless something else
+    already imported `num2words`, only the language's own module is loaded,
+    under a private package name: the `num2words` package imports and
+    instantiates the converters of all its languages on import, which costs
+    more than the handlers do.
+    """
+    converter = _converters.get(lang)
+    if converter is not None:
+        return converter
+    with _converters_lock:
+        if lang not in _converters:
+            package = "num2words" if "num2words" in sys.modules else _private_package()
+            module = importlib.import_module(f"{package}.lang_{lang.upper()}")
+            _converters[lang] = getattr(module, f"Num2Word_{lang.upper()}")()
+        return _converters[lang]
+
+
+def _speller(lang: str) -> Optional[ModuleType]:
+    """Returns the native speller module of a language, or None if it has none."""
+    try:
+        return _spellers[lang]
+    except KeyError:
+        pass
+    module_name = f"app.normalizers.{lang}.speller"
+    try:
+        module: Optional[ModuleType] = importlib.import_module(module_name)
+    except ModuleNotFoundError as e:
+        if not module_name.startswith(str(e.name)):
+            raise
+        module = None
+    _spellers[lang] = module
+    return module
+
+
+def _num2words(lang: str, to: str, n: int) -> str:
+    """Converts with num2words and applies the language's fixup."""
+    text = getattr(_converter(lang), f"to_{to}")(n)
+    fixup = _FIXUPS.get((lang, to))
+    return fixup(text) if fixup else text
+
+
+@lru_cache(maxsize=settings.NUMBER_WORDS_CACHE_SIZE)
+def _convert(lang: str, to: str, n: int) -> str:
+    global _failures
+    speller = _speller(lang)
+    if speller is not None and to in speller.SPELLERS and type(n) is int and -speller.LIMIT < n < speller.LIMIT:
+        return speller.SPELLERS[to](n)
+    try:
+        return _num2words(lang, to, n)
+    except Exception:
+        _failures += 1
+        raise
+
+
+def number_to_words(n: int, lang: str, to: str = "cardinal") -> str:
+    """
+    Converts a number to words through a bounded LRU cache shared by all handlers.
+
+    Ints are spelled by the language's native speller (`app/normalizers/<lang>/speller.py`)
+    where it has one for the mode; anything else is converted by num2words.
+
+    Args:
+        n: The number to convert.
+        lang: The language code (e.g., 'sr').
+        to: The num2words conversion mode ('cardinal', 'ordinal', 'year').
+
+    Returns:
+        The number spelled out, with language-specific fixups already applied.
+    """
+    return _convert(lang, to, n)
+
+
+def cache_info() -> NumberWordsCacheInfo:
+    """Returns the hit, miss and eviction counters of the number-to-words cache."""
+    info = _convert.cache_info()
+    evictions = max(info.misses - _failures - info.currsize, 0)
+    return NumberWordsCacheInfo(info.hits, info.misses, evictions, info.maxsize, info.currsize)
+
+
+def cache_clear() -> None:
+    """Empties the number-to-words cache and resets its counters."""
+    global _failures
+    _convert.cache_clear()
+    _failures = 0
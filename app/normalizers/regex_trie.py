@@ -0,0 +1,67 @@
+import re
+from typing import Dict, Iterable, List
+
+# Marks the end of a word in the trie; never a character of the input.
+_END = ""
+
+_Trie = Dict[str, "_Trie"]
+
+
+def trie_pattern(words: Iterable[str]) -> str:
+    """
+    Builds a prefix-factored regex source that matches any of the given literal words.
+
+    `["km", "km/h", "kg"]` becomes `k(?:m(?:/h)?|g)` instead of `km/h|km|kg`:
+    after a number, the engine then steps through the shared prefixes once
+    instead of retrying every word at the same position. Branches of a node
+    start with different characters and optional tails are greedy, so among the
+    words that match at a position the longest is tried first, and shorter ones
+    are tried on backtracking, exactly like a flat alternation sorted
+    longest-first.
+
+    Args:
+        words: The literal words; duplicates are ignored.
+
+    Returns:
+        A regex source without capturing groups, or a never-matching
+        pattern if there are no words.
+    """
+    trie: _Trie = {}
+    for word in words:
+        node = trie
+        for char in word:
+            node = node.setdefault(char, {})
+        node[_END] = {}
+    if not trie:
+        return r"(?!x)x"
+    return _node_pattern(trie)
+
+
+def _node_pattern(node: _Trie) -> str:
+    leaves: List[str] = []
+    branches: List[str] = []
+    for char, child in node.items():
+        if char == _END:
+            continue
+        if list(child) == [_END]:
+            leaves.append(char)
+        else:
+            branches.append(re.escape(char) + _node_pattern(child))
+
+    # Words that end one character after this node collapse into a character class.
+    if len(leaves) == 1:
+        branches.append(re.escape(leaves[0]))
+    elif leaves:
+        branches.append("[" + "".join(re.escape(char) for char in leaves) + "]")
+
+    if len(branches) == 1:
+        body = branches[0]
+        # A lone leaf or class can take a quantifier as is; a longer chain needs a group.
+        atomic = bool(leaves)
+    else:
+        body = "(?:" + "|".join(branches) + ")"
+        atomic = True
+
+    if _END in node:
+        return body + "?" if atomic else f"(?:{body})?"
+    return body
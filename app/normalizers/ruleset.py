@@ -0,0 +1,82 @@
+import hashlib
+from functools import lru_cache
+from importlib import metadata
+from pathlib import Path
+from typing import Optional
+
+from app.core.config import settings
+from app.normalizers.factory import normalizer_factory
+
+NORMALIZERS_PATH = Path(__file__).parent
+
+# Modules outside the language packages whose changes alter every ruleset.
+SHARED_SOURCES = ("base.py", "number_words.py", "gazetteer.py", "regex_trie.py", "tables.py", "bundle.py", "spans.py")
+
+
+def _num2words_version() -> str:
+    try:
+        return metadata.version("num2words")
+    except metadata.PackageNotFoundError:
+        return "unknown"
+
+
+@lru_cache(maxsize=None)
+def source_version(package_path: Path) -> str:
+    """
+    Hashes a language package's source and data files, the shared normalizer
+    modules and the num2words version into a short hex digest.
+
+    Args:
+        package_path: The language package directory (e.g., `app/normalizers/sr`).
+    """
+    files = sorted(p for p in package_path.rglob("*") if p.suffix in (".py", ".json"))
+    files += [NORMALIZERS_PATH / name for name in SHARED_SOURCES]
+
+    digest = hashlib.sha256()
+    for path in files:
+        digest.update(path.name.encode("utf-8"))
+        digest.update(path.read_bytes())
+    digest.update(_num2words_version().encode("utf-8"))
+    return digest.hexdigest()[:16]
+
+
+@lru_cache(maxsize=None)
+def _file_digest(path: str) -> str:
+    """Hashes a file's content, such as a prebuilt gazetteer index."""
+    digest = hashlib.sha256()
+    with open(path, "rb") as f:
+        for block in iter(lambda: f.read(1 << 20), b""):
+            digest.update(block)
+    return digest.hexdigest()
+
+
+def lexicon_version() -> Optional[str]:
+    """The content hash of the brand gazetteer index, when one is configured."""
+    return _file_digest(settings.BRAND_GAZETTEER_PATH) if settings.BRAND_GAZETTEER_PATH else None
+
+
+@lru_cache(maxsize=None)
+def ruleset_version(lang_code: str) -> str:
+    """
+    Fingerprints how a language is normalized in this process: its source
+    version (see `source_version`), the configured engine, whose output can
+    differ, and the content of a prebuilt gazetteer index loaded instead of the
+    package data. Cached results keyed by this version go stale on their own
+    when any of them changes. The language's data bundle (see
+    `app/normalizers/bundle.py`) is versioned by the source version alone.
+
+    Args:
+        lang_code: A registered language code (e.g., 'sr').
+
+    Returns:
+        A short hex digest.
+
+    Raises:
+        LanguageNotSupportedError: If no strategy is registered for the lang_code.
+    """
+    digest = hashlib.sha256(source_version(normalizer_factory.package_path(lang_code)).encode("utf-8"))
+    digest.update(f"\0engine={settings.NORMALIZER_ENGINE}".encode("utf-8"))
+    lexicon = lexicon_version()
+    if lexicon is not None:
+        digest.update(f"\0lexicon={lexicon}".encode("utf-8"))
+    return digest.hexdigest()[:16]
@@ -0,0 +1,117 @@
+"""
+Edits of an original text as claimed spans and their replacements.
+
+The span engine (`SpanEngine` in `app/normalizers/base.py`) collects every
+handler's edits against the original text and builds the normalized text once.
+Handlers scan a masked copy of the original in which claimed spans are
+overwritten, so offsets never shift and no handler rewrites another's output. The
+same edits map offsets between the original and the normalized text.
+"""
+from bisect import bisect_left, bisect_right
+from typing import List, NamedTuple, Tuple
+
+
+class Edit(NamedTuple):
+    """text[start:end] of the original text is replaced by `replacement`."""
+    start: int
+    end: int
+    replacement: str
+
+
+# Stands in for the letters and digits of claimed spans in the masked text the
+# handlers scan. It is a letter, so word boundaries next to a claimed span are
+# what the chain would see, but no rule matches it.
+MASK = "\u01c2"
+
+
+def _edge(char: str) -> str:
+    return MASK if char.isalnum() else char
+
+
+def _masked(length: int, replacement: str) -> str:
+    """A claimed span of this length whose ends look like the replacement's ends."""
+    if not replacement:
+        return MASK * length
+    if length == 1:
+        return _edge(replacement[0]) if replacement[0] == replacement[-1] else MASK
+    return _edge(replacement[0]) + MASK * (length - 2) + _edge(replacement[-1])
+
+
+def mask(text: str, edits: List[Edit]) -> str:
+    """
+    Overwrites the spans of the edits, keeping every offset. A span becomes
+    MASK characters, except that punctuation or whitespace at either end of its
+    replacement is kept there, for the lookarounds of rules next to it.
+    """
+    return join(text, [Edit(start, end, _masked(end - start, replacement)) for start, end, replacement in edits])
+
+
+def is_free(edits: List[Edit], starts: List[int], start: int, end: int) -> bool:
+    """Whether text[start:end] overlaps none of the edits, given edits sorted by start and their starts."""
+    i = bisect_left(starts, end) - 1
+    return i < 0 or edits[i].end <= start
+
+
+def regions(text: str, edits: List[Edit]) -> List[Tuple[int, int]]:
+    """Returns the non-empty (start, end) regions that no edit claims, given edits sorted by start."""
+    found: List[Tuple[int, int]] = []
+    pos = 0
+    for edit in edits:
+        if edit.start > pos:
+            found.append((pos, edit.start))
+        pos = edit.end
+    if len(text) > pos:
+        found.append((pos, len(text)))
+    return found
+
+
+def join(text: str, edits: List[Edit]) -> str:
+    """Builds the edited text, given non-overlapping edits sorted by start."""
+    if not edits:
+        return text
+    parts: List[str] = []
+    pos = 0
+    for start, end, replacement in edits:
+        parts.append(text[pos:start])
+        parts.append(replacement)
+        pos = end
+    parts.append(text[pos:])
+    return "".join(parts)
+
+
+class OffsetMap:
+    """
+    Maps offsets between an original text and its normalized text. Offsets in
+    unedited text map one to one; an offset inside an edited span maps to the
+    start of the other side's span.
+    """
+    __slots__ = ("edits", "_original", "_normalized")
+
+    def __init__(self, edits: List[Edit]):
+        self.edits = edits
+        # Per edit, where it starts and ends in the original and in the normalized text.
+        self._original: List[Tuple[int, int]] = []
+        self._normalized: List[Tuple[int, int]] = []
+        shift = 0
+        for start, end, replacement in edits:
+            self._original.append((start, end))
+            self._normalized.append((start + shift, start + shift + len(replacement)))
+            shift += len(replacement) - (end - start)
+
+    @staticmethod
+    def _map(pos: int, source: List[Tuple[int, int]], target: List[Tuple[int, int]]) -> int:
+        i = bisect_right(source, (pos, float("inf"))) - 1
+        if i < 0:
+            return pos
+        (start, end), (target_start, target_end) = source[i], target[i]
+        if pos < end:
+            return target_start
+        return target_end + pos - end
+
+    def to_normalized(self, pos: int) -> int:
+        """The offset in the normalized text of an offset in the original text."""
+        return self._map(pos, self._original, self._normalized)
+
+    def to_original(self, pos: int) -> int:
+        """The offset in the original text of an offset in the normalized text."""
+        return self._map(pos, self._normalized, self._original)
@@ -1,39 +1,60 @@
-import re
-from typing import Dict
-from .base_handler import SerbianBaseHandler, safe_replacement
+from typing import List
+
+from app.core.config import settings
+from app.normalizers.base import EditFinder, Rule
+from app.normalizers.gazetteer import WORD_RUN, DictGazetteer, Gazetteer, MappedGazetteer, fold, prepare
+from app.normalizers.spans import Edit, is_free
+from .base_handler import SerbianBaseHandler
 
 
 class BrandHandler(SerbianBaseHandler):
-    """Normalizes brand names for Serbian pronunciation."""
+    """
+    Normalizes brand names for Serbian pronunciation.
 
-    pattern = re.compile("")
+    Brands are matched case-insensitively on word boundaries, longest name first,
+    through a gazetteer index. By default it is built from `brands.json`; set
+    `BRAND_GAZETTEER_PATH` to memory-map a prebuilt index instead, which keeps
+    large lexicons out of each worker's heap.
+    """
 
     def __init__(self) -> None:
-        data = self._load_json_data("brands.json")
-        self._brands_map: Dict[str, str] = data.get("brands", {})
-
-        if self._brands_map:
-            # Sort by length (longest first) to avoid partial matches
-            sorted_brands = sorted(self._brands_map.keys(), key=len, reverse=True)
-            # Escape special regex characters and create word boundary pattern
-            brand_pattern = "|".join(re.escape(brand) for brand in sorted_brands)
-            self.pattern = re.compile(
-                rf"\b(?P<brand>{brand_pattern})\b",
-                re.IGNORECASE
-            )
+        if settings.BRAND_GAZETTEER_PATH:
+            self._gazetteer: Gazetteer = MappedGazetteer.open(settings.BRAND_GAZETTEER_PATH)
         else:
-            self.pattern = re.compile(r"(?!x)")
-
-    @safe_replacement
-    def _replace(self, brand: str) -> str:
-        # Look up the brand (case-insensitive)
-        normalized_brand = None
-        for original_brand, pronunciation in self._brands_map.items():
-            if original_brand.lower() == brand.lower():
-                normalized_brand = pronunciation
-                break
-
-        if normalized_brand is None:
-            raise ValueError(f"Unsupported brand: {brand}")
-
-        return normalized_brand
+            prepared = self._derived(
+                "brands.gazetteer",
+                lambda: prepare(self._load_json_data("brands.json").get("brands", {}))
+            )
+            self._gazetteer = DictGazetteer.from_prepared(prepared)
+
+    def apply(self, text: str) -> str:
+        text, count = self._gazetteer.subn(text)
+        self.matches += count
+        return text
+
+    def rules(self) -> list[Rule]:
+        """Brands are matched by the gazetteer, not by a regex, so they run as their own pass."""
+        return []
+
+    def edit_passes(self) -> list[EditFinder]:
+        """The gazetteer's matches in each region are the edits."""
+        return [self._brand_edits]
+
+    def _brand_edits(self, masked: str, claimed: List[Edit]) -> List[Edit]:
+        starts = [edit.start for edit in claimed]
+        edits = [
+            Edit(start, end, value) for start, end, value in self._gazetteer.finditer(masked)
+            if is_free(claimed, starts, start, end)
+        ]
+        self.matches += len(edits)
+        return edits
+
+    def open_tail(self, text: str) -> int:
+        """Holds back the last words that begin a brand name, up to one less than the longest name has."""
+        words = self._gazetteer.max_words - 1
+        if words < 1:
+            return len(text)
+        for run in list(WORD_RUN.finditer(fold(text)))[-words:]:
+            if self._gazetteer.starts_key(run.group()):
+                return run.start()
+        return len(text)
@@ -1,15 +1,25 @@
 import re
-from num2words import num2words
+from app.normalizers.number_words import number_to_words
+from app.normalizers.base import HAS_DIGIT
+from app.normalizers.tables import FIRST_YEAR, LAST_YEAR, IntTable
 from .base_handler import SerbianBaseHandler, safe_replacement
 
 
 class DateHandler(SerbianBaseHandler):
     """Normalizes dates in DD.MM.YYYY. format."""
+    trigger = HAS_DIGIT
+    opener = HAS_DIGIT
+    reach = 0
     pattern = re.compile(r"\b(\d{1,2})\.(\d{1,2})\.(\d{4})\.?\b")
 
     def __init__(self):
-        self._months_gen = self._load_json_data("months.json")
-        self._ordinals_gen = self._load_json_data("ordinals.json")
+        self._months_gen = self._derived(
+            "date.months", lambda: IntTable.from_mapping(self._load_json_data("months.json"))
+        )
+        self._ordinals_gen = self._derived(
+            "date.ordinals", lambda: IntTable.from_mapping(self._load_json_data("ordinals.json"))
+        )
+        self._years = self._derived("date.years", lambda: IntTable.build(FIRST_YEAR, LAST_YEAR + 1, self._to_year))
 
     @safe_replacement
     def _replace(self, day_str: str, month_str: str, year_str: str) -> str:
@@ -18,17 +28,16 @@ class DateHandler(SerbianBaseHandler):
         if not (1 <= m <= 12 and 1 <= d <= 31):
             raise ValueError(f"Invalid date: D={d}, M={m}")
 
-        day_text = self._ordinals_gen.get(str(d))
-        month_text = self._months_gen.get(str(m))
+        day_text = self._ordinals_gen.get(d)
+        month_text = self._months_gen.get(m)
 
         if day_text is None or month_text is None:
             raise ValueError(f"Day '{d}' or month '{m}' out of range for lookup.")
 
-        year_text = self._to_year(y)
+        year_text = self._years.get(y)
+        if year_text is None:
+            year_text = self._to_year(y)
         return f"{day_text} {month_text} {year_text}."
 
     def _to_year(self, y: int) -> str:
-        text = num2words(y, lang="sr", to="year")
-        if text.startswith("jedna hiljada"):
-            return text.replace("jedna hiljada", "hiljadu", 1)
-        return text
\ No newline at end of file
+        return number_to_words(y, "sr", "year")
\ No newline at end of file
@@ -1,12 +1,16 @@
 import re
 from typing import Dict
-from num2words import num2words
+from app.normalizers.regex_trie import trie_pattern
+from app.normalizers.base import HAS_DIGIT
 from .base_handler import SerbianBaseHandler, safe_replacement
 
 
 class MeasurementHandler(SerbianBaseHandler):
     """Normalizes measurement units into Serbian spoken form."""
 
+    trigger = HAS_DIGIT
+    opener = HAS_DIGIT
+    reach = 1
     pattern = re.compile("")
 
     def __init__(self) -> None:
@@ -14,8 +18,8 @@ class MeasurementHandler(SerbianBaseHandler):
         self._units_map: Dict[str, str] = data.get("units", {})
 
         if self._units_map:
-            sorted_units = sorted(self._units_map.keys(), key=len, reverse=True)
-            unit_pattern = "|".join(re.escape(unit) for unit in sorted_units)
+            # Prefix-factored, so compound units like "km/h" are still tried before "km"
+            unit_pattern = self._derived("measurements.unit_pattern", lambda: trie_pattern(self._units_map))
 
             # Jednostavan pattern koji hvata sve
             self.pattern = re.compile(
@@ -52,9 +56,3 @@ class MeasurementHandler(SerbianBaseHandler):
             else:
                 return normalized_unit
         return normalized_unit
-
-    def _to_cardinal(self, n: int) -> str:
-        text = num2words(n, lang="sr", to="cardinal")
-        if text.startswith("jedna hiljada"):
-            return text.replace("jedna hiljada", "hiljadu", 1)
-        return text
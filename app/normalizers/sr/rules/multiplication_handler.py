@@ -1,5 +1,5 @@
 import re
-from num2words import num2words
+from app.normalizers.base import HAS_DIGIT
 from .base_handler import SerbianBaseHandler, safe_replacement
 
 
@@ -13,6 +13,8 @@ class MultiplicationHandler(SerbianBaseHandler):
         9*9 -> devet puta devet
         9 x 785 -> NOT matched (has spaces)
     """
+    trigger = HAS_DIGIT
+    opener = HAS_DIGIT
     # Match: number + (x or × or *) + number, with NO spaces
     pattern = re.compile(r"\b(\d+)\s*[x×*]\s*(\d+)\b", re.IGNORECASE)
 
@@ -25,10 +27,3 @@ class MultiplicationHandler(SerbianBaseHandler):
         second_text = self._to_cardinal(second_num)
 
         return f"{first_text} puta {second_text}"
-
-    def _to_cardinal(self, n: int) -> str:
-        """Convert number to Serbian cardinal with proper 'hiljadu' handling."""
-        text = num2words(n, lang="sr", to="cardinal")
-        if text.startswith("jedna hiljada"):
-            return text.replace("jedna hiljada", "hiljadu", 1)
-        return text
\ No newline at end of file
@@ -1,7 +1,6 @@
 import re
 
-from num2words import num2words
-
+from app.normalizers.base import HAS_DIGIT
 from .base_handler import SerbianBaseHandler, safe_replacement
 
 
@@ -12,6 +11,9 @@ class NumberHandler(SerbianBaseHandler):
     Handles both Serbian format (1.000,50 or 1.000 for thousands) and decimals (50,50)
     """
 
+    trigger = HAS_DIGIT
+    opener = HAS_DIGIT
+    reach = 0
     # FIXED: Match numbers with BOTH period (.) and comma (,) as separators
     pattern = re.compile(r"\b(\d+(?:[.,]\d+)*)\b")
 
@@ -29,10 +31,3 @@ class NumberHandler(SerbianBaseHandler):
             return f"{whole_text} zarez {dec_text}"
         else:
             return self._to_cardinal(whole_val)
-
-    def _to_cardinal(self, n: int) -> str:
-        text = num2words(n, lang="sr", to="cardinal")
-        # Fix for "jedna hiljada" → "hiljadu" (accusative case)
-        if text.startswith("jedna hiljada"):
-            return text.replace("jedna hiljada", "hiljadu", 1)
-        return text
\ No newline at end of file
@@ -1,7 +1,25 @@
 import re
-from num2words import num2words
+from app.normalizers.number_words import number_to_words
+from app.normalizers.base import HAS_DIGIT, Rule
+from app.normalizers.tables import FIRST_YEAR, LAST_YEAR, IntTable
 from .base_handler import SerbianBaseHandler
 
+# Ordinal word parts indexed by digit (ones) or by tens digit.
+TENS_NAMES = ("", "", "dvadeset", "trideset", "četrdeset", "pedeset",
+              "šezdeset", "sedamdeset", "osamdeset", "devedeset")
+ONES_FEMININE = ("", "prva", "druga", "treća", "četvrta", "peta", "šesta", "sedma", "osma", "deveta")
+TENS_FEMININE = ("", "deseta", "dvadeseta", "trideseta", "četrdeseta", "pedeseta",
+                 "šezdeseta", "sedamdeseta", "osamdeseta", "devedeseta")
+ONES_NEUTER = ("", "prvo", "drugo", "treće", "četvrto", "peto", "šesto", "sedmo", "osmo", "deveto")
+TENS_NEUTER = ("", "deseto", "dvadeseto", "trideseto", "četrdeseto", "pedeseto",
+               "šezdeseto", "sedamdeseto", "osamdeseto", "devedeseto")
+ONES_GENITIVE = ("", "prve", "druge", "treće", "četvrte", "pete", "šeste", "sedme", "osme", "devete")
+TEENS_GENITIVE = ("", "jedanaeste", "dvanaeste", "trinaeste", "četrnaeste", "petnaeste",
+                  "šesnaeste", "sedamnaeste", "osamnaeste", "devetnaeste")
+TENS_GENITIVE = ("", "desete", "dvadesete", "tridesete", "četrdesete", "pedesete",
+                 "šezdesete", "sedamdesete", "osamdesete", "devedesete")
+
+
 class YearHandler(SerbianBaseHandler):
     """
     Normalizes years. It handles multiple cases:
@@ -9,70 +27,73 @@ class YearHandler(SerbianBaseHandler):
     2. "2021. godište" -> "dve hiljade dvadeset prvo godište"
     3. "2021." -> "dve hiljade dvadeset prva."
     4. "2021" -> "dve hiljade dvadeset jedan"
+
+    The patterns match exactly the years FIRST_YEAR..LAST_YEAR; all four forms
+    of each are built once, so a replacement is a table lookup.
     """
 
+    trigger = HAS_DIGIT
+    opener = HAS_DIGIT
+    reach = 1
+    genitive_pattern = re.compile(r"\b(19\d{2}|20\d{2}|2100)\.\s*godine\b")
+    neuter_pattern = re.compile(r"\b(19\d{2}|20\d{2}|2100)\.\s*(godište|izdanje|kolo)\b")
+    feminine_pattern = re.compile(r"\b(19\d{2}|20\d{2}|2100)\.(?!\s*(godine|godište|izdanje|kolo))")
+    nominative_pattern = re.compile(r"\b(19\d{2}|20\d{2}|2100)(?!\.)(?!\d)\b")
+
     def __init__(self):
-        self._ordinals_neuter = self._load_json_data("ordinals_neuter.json")
-        self._ordinals_feminine = self._load_json_data("ordinals_feminine.json")
-
-    def handle(self, text: str) -> str:
-        text = re.sub(
-            r"\b(19\d{2}|20\d{2}|2100)\.\s*godine\b",
-            lambda m: self._replace_genitive(m.group(1)),
-            text
-        )
-        text = re.sub(
-            r"\b(19\d{2}|20\d{2}|2100)\.\s*(godište|izdanje|kolo)\b",
-            lambda m: self._replace_neuter(m.group(1), m.group(2)),
-            text
+        self._ordinals_neuter = self._derived(
+            "year.ordinals_neuter", lambda: IntTable.from_mapping(self._load_json_data("ordinals_neuter.json"))
         )
-        text = re.sub(
-            r"\b(19\d{2}|20\d{2}|2100)\.(?!\s*(godine|godište|izdanje|kolo))",
-            lambda m: self._replace_feminine(m.group(1)),
-            text
+        self._ordinals_feminine = self._derived(
+            "year.ordinals_feminine", lambda: IntTable.from_mapping(self._load_json_data("ordinals_feminine.json"))
         )
-        text = re.sub(
-            r"\b(19\d{2}|20\d{2}|2100)(?!\.)(?!\d)\b",
-            lambda m: self._replace_nominative(m.group(1)),
-            text
+
+        # A form that cannot be built is None and leaves the year as written.
+        stop = LAST_YEAR + 1
+        self._genitive = self._derived("year.genitive", lambda: IntTable.build(FIRST_YEAR, stop, self._to_year_genitive))
+        self._neuter = self._derived("year.neuter", lambda: IntTable.build(FIRST_YEAR, stop, self._to_year_neuter))
+        self._feminine = self._derived("year.feminine", lambda: IntTable.build(FIRST_YEAR, stop, self._to_year_feminine))
+        self._nominative = self._derived(
+            "year.nominative", lambda: IntTable.build(FIRST_YEAR, stop, lambda y: number_to_words(y, "sr", "year"))
         )
-        if self._next_handler:
-            return self._next_handler.handle(text)
+
+    def apply(self, text: str) -> str:
+        for pattern, replace in self.rules():
+            text = self._sub(pattern, replace, text)
         return text
 
+    def rules(self) -> list[Rule]:
+        """The four year forms, from the most to the least specific context."""
+        return [
+            (self.genitive_pattern, lambda m: self._replace_genitive(m.group(1))),
+            (self.neuter_pattern, lambda m: self._replace_neuter(m.group(1), m.group(2))),
+            (self.feminine_pattern, lambda m: self._replace_feminine(m.group(1))),
+            (self.nominative_pattern, lambda m: self._replace_nominative(m.group(1))),
+        ]
+
     def _replace_genitive(self, year_str: str) -> str:
-        try:
-            year = int(year_str)
-            year_text_genitive = self._to_year_genitive(year)
-            return f"{year_text_genitive} godine"
-        except Exception as e:
+        year_text = self._genitive.get(int(year_str))
+        if year_text is None:
             return f"{year_str}. godine"
+        return f"{year_text} godine"
 
     def _replace_neuter(self, year_str: str, noun: str) -> str:
-        try:
-            year = int(year_str)
-            year_text = self._to_year_neuter(year)
-            return f"{year_text} {noun}"
-        except Exception as e:
+        year_text = self._neuter.get(int(year_str))
+        if year_text is None:
             return f"{year_str}. {noun}"
+        return f"{year_text} {noun}"
 
     def _replace_feminine(self, year_str: str) -> str:
-        try:
-            year = int(year_str)
-            year_text = self._to_year_feminine(year)
-            return f"{year_text}."
-        except Exception as e:
+        year_text = self._feminine.get(int(year_str))
+        if year_text is None:
             return f"{year_str}."
+        return f"{year_text}."
 
     def _replace_nominative(self, year_str: str) -> str:
-        try:
-            year = int(year_str)
-            year_text = num2words(year, lang="sr", to="year")
-            if year_text.startswith("jedna hiljada"):
-                year_text = year_text.replace("jedna hiljada", "hiljadu", 1)
-            return year_text
-        except Exception as e:
+        year_text = self._nominative.get(int(year_str))
+        if year_text is None:
             return year_str
+        return year_text
 
     def _to_year_feminine(self, y: int) -> str:
         if y >= 2000:
@@ -90,7 +111,7 @@ class YearHandler(SerbianBaseHandler):
             else:
                 result += f" {self._get_ordinal_feminine_suffix(remainder)}"
         else:
-            return num2words(y, lang='sr', to='ordinal')
+            return number_to_words(y, "sr", "ordinal")
 
         return result
 
@@ -110,7 +131,7 @@ class YearHandler(SerbianBaseHandler):
             else:
                 result += f" {self._get_ordinal_neuter_suffix(remainder)}"
         else:
-            return num2words(y, lang='sr', to='ordinal')
+            return number_to_words(y, "sr", "ordinal")
 
         return result
 
@@ -133,93 +154,41 @@ class YearHandler(SerbianBaseHandler):
                 result += f" {self._get_ordinal_genitive_suffix(remainder)}"
             return result
 
-        return num2words(y, lang='sr', to='ordinal')
+        return number_to_words(y, "sr", "ordinal")
 
     def _get_ordinal_feminine_suffix(self, n: int) -> str:
-        if n <= 31 and str(n) in self._ordinals_feminine:
-            return self._ordinals_feminine[str(n)]
-
-        tens = n // 10
-        ones = n % 10
-
-        ones_feminine = {
-            1: "prva", 2: "druga", 3: "treća", 4: "četvrta",
-            5: "peta", 6: "šesta", 7: "sedma", 8: "osma", 9: "deveta"
-        }
-        tens_names = {
-            2: "dvadeset", 3: "trideset", 4: "četrdeset", 5: "pedeset",
-            6: "šezdeset", 7: "sedamdeset", 8: "osamdeset", 9: "devedeset"
-        }
-        tens_feminine = {
-            1: "deseta", 2: "dvadeseta", 3: "trideseta", 4: "četrdeseta",
-            5: "pedeseta", 6: "šezdeseta", 7: "sedamdeseta",
-            8: "osamdeseta", 9: "devedeseta"
-        }
+        if n <= 31:
+            ordinal = self._ordinals_feminine.get(n)
+            if ordinal is not None:
+                return ordinal
 
+        tens, ones = divmod(n, 10)
         if ones == 0:
-            return tens_feminine[tens]
-        else:
-            return f"{tens_names[tens]} {ones_feminine[ones]}"
+            return TENS_FEMININE[tens]
+        return f"{TENS_NAMES[tens]} {ONES_FEMININE[ones]}"
 
     def _get_ordinal_neuter_suffix(self, n: int) -> str:
-        if n <= 31 and str(n) in self._ordinals_neuter:
-            return self._ordinals_neuter[str(n)]
-
-        tens = n // 10
-        ones = n % 10
-
-        ones_neuter = {
-            1: "prvo", 2: "drugo", 3: "treće", 4: "četvrto",
-            5: "peto", 6: "šesto", 7: "sedmo", 8: "osmo", 9: "deveto"
-        }
-        tens_names = {
-            2: "dvadeset", 3: "trideset", 4: "četrdeset", 5: "pedeset",
-            6: "šezdeset", 7: "sedamdeset", 8: "osamdeset", 9: "devedeset"
-        }
-        tens_neuter = {
-            1: "deseto", 2: "dvadeseto", 3: "trideseto", 4: "četrdeseto",
-            5: "pedeseto", 6: "šezdeseto", 7: "sedamdeseto",
-            8: "osamdeseto", 9: "devedeseto"
-        }
+        if n <= 31:
+            ordinal = self._ordinals_neuter.get(n)
+            if ordinal is not None:
+                return ordinal
 
+        tens, ones = divmod(n, 10)
         if ones == 0:
-            return tens_neuter[tens]
-        else:
-            return f"{tens_names[tens]} {ones_neuter[ones]}"
+            return TENS_NEUTER[tens]
+        return f"{TENS_NAMES[tens]} {ONES_NEUTER[ones]}"
 
     def _get_ordinal_genitive_suffix(self, n: int) -> str:
-        tens = n // 10
-        ones = n % 10
-
-        ones_genitive = {
-            1: "prve", 2: "druge", 3: "treće", 4: "četvrte",
-            5: "pete", 6: "šeste", 7: "sedme", 8: "osme", 9: "devete"
-        }
-        teens_genitive = {
-            11: "jedanaeste", 12: "dvanaeste", 13: "trinaeste",
-            14: "četrnaeste", 15: "petnaeste", 16: "šesnaeste",
-            17: "sedamnaeste", 18: "osamnaeste", 19: "devetnaeste"
-        }
-        tens_names = {
-            2: "dvadeset", 3: "trideset", 4: "četrdeset", 5: "pedeset",
-            6: "šezdeset", 7: "sedamdeset", 8: "osamdeset", 9: "devedeset"
-        }
-        tens_genitive = {
-            1: "desete", 2: "dvadesete", 3: "tridesete", 4: "četrdesete",
-            5: "pedesete", 6: "šezdesete", 7: "sedamdesete",
-            8: "osamdesete", 9: "devedesete"
-        }
-
+        tens, ones = divmod(n, 10)
         if 1 <= n <= 9:
-            return ones_genitive[n]
+            return ONES_GENITIVE[n]
         if n == 10:
-            return tens_genitive[1]
+            return TENS_GENITIVE[1]
         if 11 <= n <= 19:
-            return teens_genitive[n]
+            return TEENS_GENITIVE[ones]
         if 20 <= n <= 99:
             if ones == 0:
-                return tens_genitive[tens]
-            else:
-                return f"{tens_names[tens]} {ones_genitive[ones]}"
+                return TENS_GENITIVE[tens]
+            return f"{TENS_NAMES[tens]} {ONES_GENITIVE[ones]}"
 
-        return num2words(n, lang='sr', to='ordinal')
\ No newline at end of file
+        return number_to_words(n, "sr", "ordinal")
@@ -0,0 +1,91 @@
+"""
+Serbian number speller composing words from precomputed tables of every
+three-digit group, with the group's scale word already inflected.
+
+It spells exactly what num2words' `lang_SR` does, with the "jedna hiljada" →
+"hiljadu" fixup built in (see `benchmarks/spellers.py`), at a fraction of the
+cost per number.
+"""
+from typing import Callable, Dict, List, Tuple
+
+# Numbers spelled here are below this in absolute value; num2words spells the rest.
+LIMIT = 10 ** 21
+
+ONES = ("", "jedan", "dva", "tri", "četiri", "pet", "šest", "sedam", "osam", "devet")
+ONES_FEMININE = ("", "jedna", "dve", "tri", "četiri", "pet", "šest", "sedam", "osam", "devet")
+TEENS = ("deset", "jedanaest", "dvanaest", "trinaest", "četrnaest",
+         "petnaest", "šesnaest", "sedamnaest", "osamnaest", "devetnaest")
+TENS = ("", "", "dvadeset", "trideset", "četrdeset", "pedeset", "šezdeset", "sedamdeset", "osamdeset", "devedeset")
+HUNDREDS = ("", "sto", "dvesta", "trista", "četristo", "petsto", "šesto", "sedamsto", "osamsto", "devetsto")
+
+# Forms of each scale word after a group ending in 1, in 2-4, and otherwise;
+# "hiljada" is feminine, so its group is spelled with the feminine ones.
+SCALES: Tuple[Tuple[str, str, str], ...] = (
+    ("", "", ""),
+    ("hiljada", "hiljade", "hiljada"),
+    ("milion", "miliona", "miliona"),
+    ("bilion", "biliona", "biliona"),
+    ("trilion", "triliona", "triliona"),
+    ("kvadrilion", "kvadriliona", "kvadriliona"),
+    ("kvintilion", "kvintiliona", "kvintiliona"),
+)
+
+
+def _form(n: int) -> int:
+    if 10 <= n % 100 <= 20:
+        return 2
+    if n % 10 == 1:
+        return 0
+    if 1 < n % 10 < 5:
+        return 1
+    return 2
+
+
+def _group(n: int, ones: Tuple[str, ...]) -> str:
+    hundreds, rest = divmod(n, 100)
+    tens, unit = divmod(rest, 10)
+    words = [HUNDREDS[hundreds], TEENS[unit] if tens == 1 else TENS[tens], "" if tens == 1 else ones[unit]]
+    return " ".join(word for word in words if word)
+
+
+def _scaled_groups() -> List[Tuple[str, ...]]:
+    """For each scale, every non-zero group spelled with its scale word ("" for zero)."""
+    tables = []
+    for scale, forms in enumerate(SCALES):
+        ones = ONES_FEMININE if scale == 1 else ONES
+        tables.append(("",) + tuple(
+            f"{_group(n, ones)} {forms[_form(n)]}".rstrip() for n in range(1, 1000)
+        ))
+    return tables
+
+
+GROUPS = _scaled_groups()
+
+
+def cardinal(n: int) -> str:
+    if n < 0:
+        return "minus " + _words(-n)
+    if 1000 <= n < 2000:
+        # "hiljadu" (accusative), not "jedna hiljada"
+        return ("hiljadu " + GROUPS[0][n - 1000]).rstrip()
+    return _words(n)
+
+
+def _words(n: int) -> str:
+    if n < 1000:
+        return GROUPS[0][n] if n else "nula"
+    words = []
+    scale = 0
+    while n:
+        n, group = divmod(n, 1000)
+        if group:
+            words.append(GROUPS[scale][group])
+        scale += 1
+    words.reverse()
+    return " ".join(words)
+
+
+SPELLERS: Dict[str, Callable[[int], str]] = {
+    "cardinal": cardinal,
+    "year": cardinal,
+}
@@ -0,0 +1,53 @@
+from typing import Callable, List, Mapping, Optional, Sequence
+
+# Years whose spoken forms handlers precompute; others are converted on demand.
+FIRST_YEAR, LAST_YEAR = 1900, 2100
+
+
+class IntTable:
+    """
+    Strings indexed by a dense range of ints, e.g. every day of the month or
+    every year a handler recognizes. A lookup is a bounds check and a list
+    index, instead of formatting the int and hashing the string key.
+    """
+    __slots__ = ("start", "_values")
+
+    def __init__(self, start: int, values: Sequence[Optional[str]]):
+        self.start = start
+        self._values: List[Optional[str]] = list(values)
+
+    @classmethod
+    def from_mapping(cls, data: Mapping[str, str]) -> "IntTable":
+        """
+        Builds a table from a JSON-style mapping with int keys written as strings.
+        Gaps between the smallest and largest key are None.
+        """
+        entries = {int(key): value for key, value in data.items()}
+        if not entries:
+            return cls(0, [])
+        start, stop = min(entries), max(entries) + 1
+        return cls(start, [entries.get(n) for n in range(start, stop)])
+
+    @classmethod
+    def build(cls, start: int, stop: int, convert: Callable[[int], str]) -> "IntTable":
+        """
+        Precomputes `convert(n)` for every n in [start, stop). Values for which
+        `convert` raises are None, so callers fall back as they would have.
+        """
+        values: List[Optional[str]] = []
+        for n in range(start, stop):
+            try:
+                values.append(convert(n))
+            except Exception:
+                values.append(None)
+        return cls(start, values)
+
+    def get(self, n: int) -> Optional[str]:
+        """Returns the string for n, or None if n is outside the table or has no entry."""
+        i = n - self.start
+        if 0 <= i < len(self._values):
+            return self._values[i]
+        return None
+
+    def __len__(self) -> int:
+        return len(self._values)
@@ -0,0 +1,30 @@
+from typing import Optional
+
+from pydantic import BaseModel, Field
+
+
+class SharedCacheStatsResponse(BaseModel):
+    hits: int = Field(..., description="In-process misses answered from the shared cache.")
+    misses: int = Field(..., description="Lookups the shared cache could not answer either.")
+    stores: int = Field(..., description="Results this process stored in the shared cache.")
+    evictions: int = Field(..., description="Entries this process replaced in a full bucket.")
+    oversized: int = Field(..., description="Results too long for a slot, kept in-process only.")
+    torn_reads: int = Field(..., description="Slots read while another process was writing them, treated as misses.")
+    slots: int = Field(..., description="Slots in the shared table.")
+    slot_bytes: int = Field(..., description="Size of each slot, header included.")
+    path: Optional[str] = Field(None, description="The mapped file, or null for anonymous shared memory.")
+
+
+class ResultCacheStatsResponse(BaseModel):
+    enabled: bool = Field(..., description="Whether the result cache is in use.")
+    hits: int = Field(..., description="Lookups answered from the cache.")
+    misses: int = Field(..., description="Lookups that had to be normalized.")
+    hit_rate: float = Field(..., description="Hits divided by all lookups.")
+    evictions: int = Field(..., description="Entries dropped to stay within the byte budget.")
+    expirations: int = Field(..., description="Entries dropped because their TTL ran out.")
+    entries: int = Field(..., description="Entries currently cached.")
+    bytes: int = Field(..., description="Estimated memory used by the cached entries.")
+    max_bytes: int = Field(..., description="The configured byte budget.")
+    shared: Optional[SharedCacheStatsResponse] = Field(
+        None, description="This process's use of the cache shared by the server processes, if one is attached."
+    )
@@ -0,0 +1,12 @@
+from typing import Dict, Optional
+
+from pydantic import BaseModel, Field
+
+
+class ReadinessResponse(BaseModel):
+    status: str = Field(..., examples=["ready"], description="'ready', 'warming_up' or 'failed'.")
+    warmup_ms: Dict[str, float] = Field(
+        default_factory=dict,
+        description="Milliseconds spent warming each language; empty until ready."
+    )
+    error: Optional[str] = Field(None, description="Why warmup failed, if it did.")
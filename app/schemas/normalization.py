@@ -1,4 +1,9 @@
+from typing import List, Optional, Union
+
 from pydantic import BaseModel, Field
+from typing_extensions import Annotated, NotRequired, TypedDict
+
+from app.core.config import settings
 
 
 class NormalizationRequest(BaseModel):
@@ -10,9 +15,101 @@ class NormalizationRequest(BaseModel):
     )
 
 
+class HandlerTiming(BaseModel):
+    handler: str = Field(..., description="The handler's class name.")
+    skipped: bool = Field(..., description="Whether the handler's trigger did not occur, so it did not run.")
+    duration_ms: float = Field(..., description="Time the handler took.")
+    matches: int = Field(..., description="Replacements the handler made.")
+    growth: int = Field(..., description="Characters the handler added to the text; negative if it shortened it.")
+    conversions: int = Field(
+        ...,
+        description="Numbers the handler had to spell out because the number-words cache did not hold them."
+    )
+
+
+class NormalizationDebug(BaseModel):
+    duration_ms: float = Field(..., description="Time the whole chain took.")
+    handlers: List[HandlerTiming] = Field(..., description="What each handler did, in chain order.")
+
+
 class NormalizationResponse(BaseModel):
     normalized_text: str = Field(
         ...,
         examples=["Tekst za normalizaciju, napisan dvadeset petog decembra dve hiljade dvadeset treće. godine, košta hiljadu dvesta trideset četiri evra i pedeset šest centi."],
         description="The resulting normalized string."
-    )
\ No newline at end of file
+    )
+    debug: Optional[NormalizationDebug] = Field(
+        None,
+        description="Per-handler timings; only present when requested with `trace=true`."
+    )
+
+
+# The bulk paths validate into plain dicts: much cheaper than a model instance
+# per item, with the same schema and error messages.
+class BatchNormalizationItem(TypedDict):
+    text: Annotated[str, Field(
+        min_length=1,
+        examples=["Cena je 1.500 RSD."],
+        description="The input string to be normalized."
+    )]
+    lang: NotRequired[Annotated[Optional[str], Field(
+        pattern="^[a-z]{2}$",
+        examples=["en"],
+        description="Language code for this item; defaults to the language in the path."
+    )]]
+
+
+class BatchNormalizationRequest(TypedDict):
+    items: Annotated[List[BatchNormalizationItem], Field(
+        min_length=1,
+        max_length=settings.BATCH_MAX_ITEMS,
+        description="The items to be normalized."
+    )]
+
+
+class BatchNormalizationResult(BaseModel):
+    lang: str = Field(..., description="The language the item was normalized with.")
+    normalized_text: Optional[str] = Field(
+        None,
+        description="The resulting normalized string, or null if the item failed."
+    )
+    error: Optional[str] = Field(
+        None,
+        description="Why the item could not be normalized, or null on success."
+    )
+
+
+class BatchNormalizationResponse(BaseModel):
+    results: List[BatchNormalizationResult] = Field(
+        ...,
+        description="One result per input item, in input order."
+    )
+
+
+class StreamNormalizationRecord(TypedDict):
+    text: Annotated[str, Field(min_length=1, description="The input string to be normalized.")]
+    lang: NotRequired[Annotated[Optional[str], Field(
+        pattern="^[a-z]{2}$",
+        description="Language code for this record; defaults to the language in the path."
+    )]]
+    id: NotRequired[Annotated[Optional[Union[str, int]], Field(
+        description="Optional identifier echoed back in the output record."
+    )]]
+
+
+class NormalizationFragment(BaseModel):
+    text: str = Field("", description="The next piece of text, appended to what was sent before.")
+    final: bool = Field(
+        False,
+        description="Whether the text ends here; everything held back is normalized and the next "
+                    "fragment starts a new text."
+    )
+
+
+class NormalizedFragment(BaseModel):
+    normalized_text: Optional[str] = Field(
+        None,
+        description="The normalized text that became stable, continuing the previous fragments."
+    )
+    final: Optional[bool] = Field(None, description="Set on the reply to a final fragment.")
+    error: Optional[str] = Field(None, description="Why the fragment was rejected.")
@@ -0,0 +1,202 @@
+"""
+Preforking server: `python -m app.server`.
+
+The master process registers, builds and warms every strategy, binds the
+listening socket, freezes its heap with `gc.freeze()` and forks
+`SERVER_WORKERS` workers. Each worker runs uvicorn on the inherited socket and
+starts out sharing the master's language data, compiled regexes and number
+words copy-on-write, so N workers need far less memory than N separate
+servers that each load everything. Frozen objects are left out of garbage
+collection, which would otherwise write to every one of them and copy the
+pages they live on into each worker.
+
+Workers normalize on a thread executor: they are the parallelism already, and
+a process pool per worker would load the strategies again in every pool
+worker. Behind their own result caches, the workers share one that the master
+maps (see `app/core/shared_cache.py`). A worker that dies is replaced by a
+fresh fork of the master; SIGTERM or SIGINT stops the workers gracefully and
+then the master.
+"""
+import argparse
+import gc
+import logging
+import os
+import signal
+import socket
+import sys
+import time
+from typing import Dict, List, Optional, Tuple
+
+from app.core.config import settings
+
+logger = logging.getLogger("app.server")
+
+# A worker that exits sooner than this after its fork is restarted only after
+# the same delay, so a worker that cannot start does not fork in a tight loop.
+MIN_WORKER_UPTIME = 1.0
+
+
+def preload() -> Dict[str, float]:
+    """
+    Registers, builds and warms every strategy in this process.
+
+    Returns:
+        The milliseconds spent per language.
+    """
+    # Imported here so that `--help` does not load the application.
+    from app.normalizers.factory import BUILTIN_STRATEGIES, normalizer_factory
+    from app.normalizers.ruleset import ruleset_version
+
+    for lang_code, strategy in BUILTIN_STRATEGIES.items():
+        normalizer_factory.register(lang_code, strategy)
+    normalizer_factory.register_entry_points()
+    timings: Dict[str, float] = {}
+    for lang_code in normalizer_factory.registrations():
+        start = time.perf_counter()
+        ruleset_version(lang_code)
+        normalizer_factory.get_strategy(lang_code).warm_up()
+        timings[lang_code] = (time.perf_counter() - start) * 1000
+    return timings
+
+
+def bind(host: str, port: int, backlog: int = 2048) -> socket.socket:
+    """Opens the listening socket all workers accept on."""
+    family = socket.AF_INET6 if ":" in host else socket.AF_INET
+    sock = socket.socket(family, socket.SOCK_STREAM)
+    sock.setsockopt(socket.SOL_SOCKET, socket.SO_REUSEADDR, 1)
+    sock.bind((host, port))
+    sock.listen(backlog)
+    sock.set_inheritable(True)
+    return sock
+
+
+def worker_cpus(workers: int) -> List[Optional[int]]:
+    """
+    The core each worker is pinned to with SERVER_CPU_AFFINITY, round-robin
+    over the cores this process may run on, or None per worker without it.
+    """
+    if not settings.SERVER_CPU_AFFINITY:
+        return [None] * workers
+    if not hasattr(os, "sched_setaffinity"):
+        logger.warning("SERVER_CPU_AFFINITY is not supported on this platform and is ignored.")
+        return [None] * workers
+    cpus = sorted(os.sched_getaffinity(0))
+    return [cpus[index % len(cpus)] for index in range(workers)]
+
+
+def _run_worker(sock: socket.socket, cpu: Optional[int]) -> None:
+    """Serves the application on the inherited socket until uvicorn shuts down."""
+    import uvicorn
+
+    from app.main import app
+
+    for signum in (signal.SIGTERM, signal.SIGINT):
+        signal.signal(signum, signal.SIG_DFL)
+    if cpu is not None:
+        os.sched_setaffinity(0, {cpu})
+    # Objects created from here on are collected as usual; the frozen ones are
+    # never scanned.
+    gc.enable()
+    uvicorn.Server(uvicorn.Config(app, lifespan="on")).run(sockets=[sock])
+
+
+class Master:
+    """Forks the workers and replaces any that die until it is told to stop."""
+
+    def __init__(self, sock: socket.socket, cpus: List[Optional[int]]):
+        self.sock = sock
+        self.cpus = cpus
+        self.stopping = False
+        # Worker pid -> (worker index, fork time).
+        self.workers: Dict[int, Tuple[int, float]] = {}
+
+    def spawn(self, index: int) -> None:
+        pid = os.fork()
+        if pid == 0:
+            code = 0
+            try:
+                _run_worker(self.sock, self.cpus[index])
+            except BaseException:
+                logger.exception(f"Worker {index} failed.")
+                code = 1
+            finally:
+                # Never return into the master's code, nor run its exit handlers.
+                os._exit(code)
+        self.workers[pid] = (index, time.monotonic())
+        logger.info(f"Started worker {index} (pid {pid}{'' if self.cpus[index] is None else f', cpu {self.cpus[index]}'}).")
+
+    def stop(self, signum: int, frame: object = None) -> None:
+        if not self.stopping:
+            logger.info(f"Received {signal.Signals(signum).name}; stopping {len(self.workers)} workers.")
+        self.stopping = True
+        for pid in self.workers:
+            try:
+                os.kill(pid, signal.SIGTERM)
+            except ProcessLookupError:
+                pass
+
+    def run(self) -> None:
+        for signum in (signal.SIGTERM, signal.SIGINT):
+            signal.signal(signum, self.stop)
+        for index in range(len(self.cpus)):
+            self.spawn(index)
+        while self.workers:
+            try:
+                pid, status = os.wait()
+            except ChildProcessError:
+                break
+            index, started = self.workers.pop(pid)
+            if self.stopping:
+                continue
+            logger.warning(f"Worker {index} (pid {pid}) exited with status {os.waitstatus_to_exitcode(status)}; restarting it.")
+            uptime = time.monotonic() - started
+            if uptime < MIN_WORKER_UPTIME:
+                time.sleep(MIN_WORKER_UPTIME - uptime)
+            if not self.stopping:
+                self.spawn(index)
+        logger.info("All workers stopped.")
+
+
+def serve(host: str, port: int, workers: int) -> None:
+    """Preloads the strategies, then forks `workers` workers serving on host:port."""
+    # Objects created while preloading stay where they are allocated instead
+    # of being moved through the collector's generations; see gc.freeze().
+    gc.disable()
+    # With the process backend, every worker would start a pool that loads
+    # the strategies again.
+    if settings.EXECUTOR_BACKEND == "process":
+        settings.EXECUTOR_BACKEND = "thread"
+    timings = preload()
+    if settings.SHARED_CACHE_MAX_BYTES > 0:
+        from app.core.cache import result_cache
+        from app.core.shared_cache import SharedResultCache
+
+        # Mapped before the fork, so all workers share it even without a file.
+        result_cache.shared = SharedResultCache()
+    logger.info("Preloaded " + ", ".join(f"{lang_code} in {ms:.0f} ms" for lang_code, ms in timings.items()) + ".")
+    # The application and its dependencies are shared too.
+    import app.main  # noqa: F401
+
+    sock = bind(host, port)
+    logger.info(f"Listening on {host}:{port} with {workers} workers.")
+    gc.collect()
+    gc.freeze()
+    Master(sock, worker_cpus(workers)).run()
+    sock.close()
+
+
+def main(argv: Optional[List[str]] = None) -> None:
+    parser = argparse.ArgumentParser(description="Serve the API from preforked workers that share the loaded strategies.")
+    parser.add_argument("--host", default=settings.SERVER_HOST, help="Address to listen on.")
+    parser.add_argument("--port", type=int, default=settings.SERVER_PORT, help="Port to listen on.")
+    parser.add_argument("--workers", type=int, default=settings.SERVER_WORKERS,
+                        help="Worker processes; 0 means one per CPU core.")
+    args = parser.parse_args(argv)
+    if not hasattr(os, "fork"):
+        parser.exit(2, "error: the preforking server needs os.fork(); run uvicorn app.main:app instead.\n")
+    logging.basicConfig(level=logging.INFO, format="%(asctime)s [%(process)d] %(levelname)s %(message)s", stream=sys.stderr)
+    serve(args.host, args.port, args.workers or os.cpu_count() or 1)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,88 @@
+"""
+Benchmark corpora per language, grouped by token density and text length.
+
+Density is how much of the text the handlers have to rewrite:
+
+- `dense`: only the example sentences from `app/test.py`, full of prices, units and dates.
+- `sparse`: one example sentence among every four plain ones.
+- `plain`: prose without anything to normalize, where handlers should be skipped.
+
+Length is the size of each text: `short` (one sentence), `medium` (~1 KB)
+and `long` (~10 KB). Corpora are built from a fixed seed, so every run sees
+the same texts.
+"""
+import random
+from typing import Dict, List
+
+from app.test import ENGLISH_EXAMPLES, GERMAN_EXAMPLES, SERBIAN_EXAMPLES
+
+EXAMPLES: Dict[str, List[str]] = {
+    "sr": SERBIAN_EXAMPLES,
+    "en": ENGLISH_EXAMPLES,
+    "de": GERMAN_EXAMPLES,
+}
+
+# Sentences with no numbers, symbols or Roman numeral letters in them.
+PLAIN: Dict[str, List[str]] = {
+    "sr": [
+        "Jutros je padala kiša pa smo ostali kod kuće.",
+        "Komšija je doneo sveže povrće sa pijace.",
+        "Posle ručka smo šetali pored reke do mosta.",
+        "Deca su se igrala u parku dok je sunce zalazilo.",
+        "Knjiga koju čitam je duža nego što sam mislila.",
+        "Sutra idemo kod bake na selo da beremo jabuke.",
+    ],
+    "en": [
+        "The morning was quiet and the streets were still wet from the rain.",
+        "She walked to the market and bought fresh bread for the family.",
+        "After lunch they sat by the river and talked about the summer.",
+        "Our neighbour has been repairing his old bicycle all week.",
+        "The children played in the garden until it was dark.",
+        "We finally found the book that had been missing for months.",
+    ],
+    "de": [
+        "Am Morgen war es ruhig und die Straßen waren noch nass vom Regen.",
+        "Sie ging zum Markt und kaufte frisches Brot für die Familie.",
+        "Nach dem Essen saßen sie am Fluss und sprachen über den Sommer.",
+        "Unser Nachbar repariert schon die ganze Woche sein altes Fahrrad.",
+        "Die Kinder spielten im Garten, bis es dunkel wurde.",
+        "Endlich fanden wir das Buch, das seit Monaten verschwunden war.",
+    ],
+}
+
+DENSITIES = ("dense", "sparse", "plain")
+# Target characters per text, and how many texts a corpus holds.
+LENGTHS = {"short": (0, 20), "medium": (1_000, 10), "long": (10_000, 3)}
+
+
+def _sentences(lang: str, density: str, rng: random.Random):
+    while True:
+        if density == "dense" or (density == "sparse" and rng.random() < 0.2):
+            yield rng.choice(EXAMPLES[lang])
+        else:
+            yield rng.choice(PLAIN[lang])
+
+
+def build_corpus(lang: str, density: str, length: str, seed: int = 0) -> List[str]:
+    """Returns the texts of one corpus; a target of 0 characters means single sentences."""
+    target, count = LENGTHS[length]
+    rng = random.Random(f"{seed}-{lang}-{density}-{length}")
+    sentences = _sentences(lang, density, rng)
+    texts = []
+    for _ in range(count):
+        parts = [next(sentences)]
+        size = len(parts[0])
+        while size < target:
+            parts.append(next(sentences))
+            size += len(parts[-1]) + 1
+        texts.append(" ".join(parts))
+    return texts
+
+
+def corpora(lang: str) -> Dict[str, List[str]]:
+    """All corpora of a language, keyed by `<density>-<length>`."""
+    return {
+        f"{density}-{length}": build_corpus(lang, density, length)
+        for density in DENSITIES
+        for length in LENGTHS
+    }
@@ -0,0 +1,133 @@
+"""
+Checks the import-time budget of the service, so startup cost does not creep
+back up:
+
+    python -m benchmarks.import_time                          # exits with status 1 if over budget
+    python -m benchmarks.import_time -o baseline.json         # save the timings
+    python -m benchmarks.import_time --baseline baseline.json --threshold 0.25
+
+Each target is imported in a fresh interpreter under `python -X importtime`.
+Its cost is the self time of the modules this project controls (`app.*`) plus
+`num2words`, so the fixed cost of FastAPI and pydantic does not hide a
+regression. Each target is measured `--repeat` times and the best run counts.
+Import times vary by tens of percent between runs on one machine, so the
+fixed budgets are generous ceilings that only catch gross regressions, such as
+the whole `num2words` package coming back; for finer checks, compare against a
+baseline taken on the same machine.
+
+What a target must not import (the server entry point imports no strategy
+and no number speller, and a strategy imports no other language's) is
+deterministic and checked by `tests/test_import_isolation.py` as well.
+"""
+import argparse
+import json
+import re
+import subprocess
+import sys
+from typing import Dict, List, NamedTuple, Optional, Tuple
+
+
+class Target(NamedTuple):
+    # Code run in the fresh interpreter.
+    code: str
+    # Own import time allowed, in milliseconds.
+    budget_ms: float
+    # Module name prefixes that must not be loaded afterwards.
+    forbidden: Tuple[str, ...]
+
+
+def _strategy(lang: str, class_name: str, others: Tuple[str, ...]) -> Target:
+    # Building the strategy and spelling a number loads its number speller too.
+    code = (
+        f"from app.normalizers.{lang}.strategy import {class_name}\n"
+        f"{class_name}().normalize('2024')\n"
+    )
+    forbidden = tuple(f"app.normalizers.{other}." for other in others)
+    forbidden += tuple(f"{package}.lang_{other.upper()}" for other in others for package in NUM2WORDS_PACKAGES)
+    return Target(code, 100.0, forbidden)
+
+
+# num2words, and the private name its converter modules load under (see
+# `app/normalizers/number_words.py`).
+NUM2WORDS_PACKAGES = ("num2words", "_app_num2words")
+
+TARGETS: Dict[str, Target] = {
+    "app.main": Target("import app.main\n", 180.0, NUM2WORDS_PACKAGES + ("app.normalizers.sr.", "app.normalizers.en.",
+                                                                         "app.normalizers.de.")),
+    "sr": _strategy("sr", "SerbianNormalizerStrategy", ("en", "de")),
+    "en": _strategy("en", "EnglishNormalizerStrategy", ("sr", "de")),
+    "de": _strategy("de", "GermanNormalizerStrategy", ("sr", "en")),
+}
+
+_LINE = re.compile(r"import time:\s+(\d+) \|\s+\d+ \| *(\S+)")
+# Top-level packages whose import time counts against the budget.
+OWN_PACKAGES = ("app",) + NUM2WORDS_PACKAGES
+
+
+def _run(target: Target, *options: str) -> subprocess.CompletedProcess:
+    """Runs the target in a fresh interpreter, printing the forbidden modules it loaded."""
+    check = (
+        "import sys\n"
+        f"print('\\n'.join(m for m in sys.modules if m.startswith({target.forbidden!r})))\n"
+    )
+    return subprocess.run(
+        [sys.executable, *options, "-c", target.code + check],
+        capture_output=True, text=True, check=True,
+    )
+
+
+def forbidden_imports(target: Target) -> List[str]:
+    """Returns the forbidden modules the target loaded."""
+    return _run(target).stdout.split()
+
+
+def measure(target: Target) -> Tuple[float, List[str]]:
+    """Returns the target's own import time in milliseconds and the forbidden modules it loaded."""
+    result = _run(target, "-X", "importtime")
+    own_us = 0
+    for line in result.stderr.splitlines():
+        match = _LINE.match(line)
+        if match and match.group(2).split(".")[0] in OWN_PACKAGES:
+            own_us += int(match.group(1))
+    return own_us / 1000, result.stdout.split()
+
+
+def main(argv: Optional[List[str]] = None) -> None:
+    parser = argparse.ArgumentParser(description="Check the import-time budget.")
+    parser.add_argument("--repeat", type=int, default=5, help="Runs per target; the best counts.")
+    parser.add_argument("-o", "--output", help="Write the timings as JSON to this file.")
+    parser.add_argument("--baseline", help="Timings saved with -o; budgets become relative to them.")
+    parser.add_argument("--threshold", type=float, default=0.25,
+                        help="Allowed slowdown over the baseline, as a fraction.")
+    args = parser.parse_args(argv)
+    baseline: Dict[str, float] = {}
+    if args.baseline:
+        with open(args.baseline) as f:
+            baseline = json.load(f)
+
+    failures = []
+    timings: Dict[str, float] = {}
+    print(f"{'target':<12}{'own import ms':>15}{'budget ms':>12}")
+    for name, target in TARGETS.items():
+        runs = [measure(target) for _ in range(args.repeat)]
+        best = timings[name] = min(ms for ms, _ in runs)
+        loaded = runs[0][1]
+        budget = baseline[name] * (1 + args.threshold) if name in baseline else target.budget_ms
+        print(f"{name:<12}{best:>15.1f}{budget:>12.0f}")
+        if best > budget:
+            failures.append(f"{name}: {best:.1f} ms of own imports exceeds the {budget:.0f} ms budget")
+        if loaded:
+            failures.append(f"{name}: imports {', '.join(loaded)}")
+
+    if args.output:
+        with open(args.output, "w") as f:
+            json.dump(timings, f, indent=2)
+
+    for failure in failures:
+        print(failure)
+    if failures:
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,76 @@
+"""
+Compares the flat, length-sorted unit alternation with the prefix-factored
+pattern from `app.normalizers.regex_trie` as the unit list grows.
+
+    python -m benchmarks.regex_trie
+
+Both patterns are checked to find exactly the same matches before timing.
+"""
+import json
+import random
+import re
+import timeit
+from pathlib import Path
+
+from app.normalizers.regex_trie import trie_pattern
+
+DATA_PATH = Path(__file__).parent.parent / "app" / "normalizers"
+NUMBER = r"(\d{1,3}(?:[.,]\d{3})*(?:[.,]\d{1,2})?|\d+(?:[.,]\d{1,2})?)"
+SI_PREFIXES = ["", "k", "M", "G", "T", "m", "µ", "n", "c", "d", "h", "da"]
+
+
+def flat_pattern(units):
+    return "|".join(re.escape(unit) for unit in sorted(units, key=len, reverse=True))
+
+
+def compile_units(unit_source):
+    return re.compile(rf"{NUMBER}\s*({unit_source})(?=\s|$|[^\w])")
+
+
+def grown_units(base, size, rng):
+    """The real units, then SI-prefixed and compound variants until `size` is reached."""
+    units = list(dict.fromkeys(base))
+    seen = set(units)
+    while len(units) < size:
+        unit = rng.choice(SI_PREFIXES) + rng.choice(base)
+        if rng.random() < 0.3:
+            unit += "/" + rng.choice(base)
+        if unit not in seen:
+            seen.add(unit)
+            units.append(unit)
+    return units
+
+
+def sample_text(units, rng, tokens=400):
+    words = ["cena", "je", "bila", "oko", "the", "price", "und", "dann", "m2", "kmh"]
+    parts = []
+    for _ in range(tokens):
+        if rng.random() < 0.4:
+            parts.append(f"{rng.randint(1, 9999)}{rng.choice(['', ' '])}{rng.choice(units)}")
+        elif rng.random() < 0.5:
+            parts.append(str(rng.randint(1, 99999)))
+        else:
+            parts.append(rng.choice(words))
+    return " ".join(parts)
+
+
+def main():
+    rng = random.Random(0)
+    print(f"{'lang':<5}{'units':>7}{'flat µs':>12}{'trie µs':>12}{'speedup':>10}")
+    for lang in ("sr", "en", "de"):
+        with open(DATA_PATH / lang / "data" / "measurements.json", encoding="utf-8") as f:
+            base = list(json.load(f)["units"])
+        for size in (len(base), 250, 1000, 5000):
+            units = grown_units(base, size, rng)
+            text = sample_text(units, rng)
+            flat = compile_units(flat_pattern(units))
+            trie = compile_units(trie_pattern(units))
+            assert flat.findall(text) == trie.findall(text), f"patterns disagree for {lang}/{size}"
+            runs = 20
+            flat_time = timeit.timeit(lambda: flat.findall(text), number=runs) / runs * 1e6
+            trie_time = timeit.timeit(lambda: trie.findall(text), number=runs) / runs * 1e6
+            print(f"{lang:<5}{len(units):>7}{flat_time:>12.0f}{trie_time:>12.0f}{flat_time / trie_time:>9.1f}x")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,122 @@
+"""
+Compares the memory of the preforking server (`app/server.py`) with as many
+separate uvicorn servers (Linux only):
+
+    python -m benchmarks.server_memory --workers 4
+
+Both run with the thread executor and serve `--requests` requests per process
+before they are measured. Per process it reports RSS, PSS (shared pages split
+among the processes sharing them) and USS (pages only that process uses) from
+/proc/<pid>/smaps_rollup; the PSS total is what the servers cost together.
+"""
+import argparse
+import json
+import os
+import signal
+import subprocess
+import sys
+import time
+import urllib.error
+import urllib.request
+from typing import Dict, List, Optional
+
+from app.test import ENGLISH_EXAMPLES, GERMAN_EXAMPLES, SERBIAN_EXAMPLES
+
+EXAMPLES = {"sr": SERBIAN_EXAMPLES, "en": ENGLISH_EXAMPLES, "de": GERMAN_EXAMPLES}
+
+
+def memory_kb(pid: int) -> Dict[str, int]:
+    """RSS, PSS and USS of a process, in KiB."""
+    fields: Dict[str, int] = {}
+    with open(f"/proc/{pid}/smaps_rollup") as f:
+        for line in f:
+            parts = line.split()
+            if len(parts) == 3 and parts[2] == "kB":
+                fields[parts[0].rstrip(":")] = int(parts[1])
+    return {
+        "rss": fields["Rss"],
+        "pss": fields["Pss"],
+        "uss": fields["Private_Clean"] + fields["Private_Dirty"],
+    }
+
+
+def children(pid: int) -> List[int]:
+    with open(f"/proc/{pid}/task/{pid}/children") as f:
+        return [int(child) for child in f.read().split()]
+
+
+def wait_ready(port: int, timeout: float = 120.0) -> None:
+    deadline = time.monotonic() + timeout
+    while time.monotonic() < deadline:
+        try:
+            with urllib.request.urlopen(f"http://127.0.0.1:{port}/ready", timeout=1) as response:
+                if response.status == 200:
+                    return
+        except (urllib.error.URLError, ConnectionError, OSError):
+            pass
+        time.sleep(0.2)
+    raise TimeoutError(f"No server became ready on port {port}.")
+
+
+def load(port: int, requests: int) -> None:
+    for i in range(requests):
+        lang = list(EXAMPLES)[i % len(EXAMPLES)]
+        texts = EXAMPLES[lang]
+        body = json.dumps({"text": texts[i // len(EXAMPLES) % len(texts)]}).encode()
+        request = urllib.request.Request(f"http://127.0.0.1:{port}/api/v1/{lang}/normalize", data=body,
+                                         headers={"Content-Type": "application/json"})
+        urllib.request.urlopen(request).read()
+
+
+def report(name: str, pids: List[int]) -> None:
+    rows = [memory_kb(pid) for pid in pids]
+    print(f"{name}:")
+    for pid, row in zip(pids, rows):
+        print(f"  pid {pid:<8}{row['rss'] / 1024:>10.1f}{row['pss'] / 1024:>10.1f}{row['uss'] / 1024:>10.1f}")
+    totals = {key: sum(row[key] for row in rows) / 1024 for key in ("rss", "pss", "uss")}
+    print(f"  {'total':<12}{totals['rss']:>10.1f}{totals['pss']:>10.1f}{totals['uss']:>10.1f}")
+
+
+def stop(processes: List[subprocess.Popen]) -> None:
+    for process in processes:
+        process.send_signal(signal.SIGTERM)
+    for process in processes:
+        process.wait(timeout=30)
+
+
+def main(argv: Optional[List[str]] = None) -> None:
+    parser = argparse.ArgumentParser(description="Compare the memory of preforked and separate server processes.")
+    parser.add_argument("--workers", type=int, default=4)
+    parser.add_argument("--port", type=int, default=18000, help="First port to listen on.")
+    parser.add_argument("--requests", type=int, default=50, help="Requests per process before measuring.")
+    args = parser.parse_args(argv)
+    env = dict(os.environ, EXECUTOR_BACKEND="thread")
+    quiet = {"stdout": subprocess.DEVNULL, "stderr": subprocess.DEVNULL, "env": env}
+
+    print(f"{'MiB':<14}{'RSS':>10}{'PSS':>10}{'USS':>10}")
+    master = subprocess.Popen([sys.executable, "-m", "app.server", "--host", "127.0.0.1",
+                               "--port", str(args.port), "--workers", str(args.workers)], **quiet)
+    try:
+        wait_ready(args.port)
+        # Workers share the socket; enough requests reach each of them.
+        load(args.port, args.requests * args.workers)
+        time.sleep(1)
+        report(f"preforked ({args.workers} workers + master)", [master.pid] + children(master.pid))
+    finally:
+        stop([master])
+
+    ports = [args.port + 1 + i for i in range(args.workers)]
+    servers = [subprocess.Popen([sys.executable, "-m", "uvicorn", "app.main:app", "--host", "127.0.0.1",
+                                 "--port", str(port)], **quiet) for port in ports]
+    try:
+        for port in ports:
+            wait_ready(port)
+            load(port, args.requests)
+        time.sleep(1)
+        report(f"separate ({args.workers} servers)", [server.pid for server in servers])
+    finally:
+        stop(servers)
+
+
+if __name__ == "__main__":
+    main()
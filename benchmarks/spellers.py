@@ -0,0 +1,66 @@
+"""
+Times the native number spellers (`app/normalizers/<lang>/speller.py`) against
+num2words with the fixups:
+
+    python -m benchmarks.spellers
+    python -m benchmarks.spellers --dense 1000000 --sampled 1000000
+
+The numbers are every int below `--dense`, some negatives, and `--sampled`
+random ints of every magnitude up to the speller's limit, for each language
+and mode a speller covers. Timings are per number, without the shared cache.
+`tests/test_spellers.py` checks that both spell the same.
+"""
+import argparse
+import importlib
+import random
+import time
+from typing import Callable, List, Optional
+
+from app.normalizers.number_words import _num2words
+
+LANGS = ("sr", "en", "de")
+
+
+def _sample(rng: random.Random, limit: int) -> int:
+    """A random int below `limit` of random length whose three-digit groups are often 0 or 1."""
+    n = 0
+    for _ in range(rng.randrange(1, len(str(limit)) // 3 + 1)):
+        n = n * 1000 + rng.choice((0, 1, rng.randrange(1000), rng.randrange(1000)))
+    return n % limit
+
+
+def numbers(limit: int, dense: int, sampled: int, seed: int) -> List[int]:
+    rng = random.Random(seed)
+    values = list(range(min(dense, limit)))
+    values += [-n for n in range(1, min(dense, limit), 97)]
+    values += [_sample(rng, limit) * rng.choice((1, 1, 1, -1)) for _ in range(sampled)]
+    return values
+
+
+def per_number_us(convert: Callable[[int], str], values: List[int]) -> float:
+    started = time.perf_counter()
+    for n in values:
+        convert(n)
+    return (time.perf_counter() - started) / len(values) * 1e6
+
+
+def main(argv: Optional[List[str]] = None) -> None:
+    parser = argparse.ArgumentParser(description="Time the native number spellers against num2words.")
+    parser.add_argument("--dense", type=int, default=200_000, help="Time every int below this.")
+    parser.add_argument("--sampled", type=int, default=100_000, help="Random ints of every magnitude to time.")
+    parser.add_argument("--seed", type=int, default=0)
+    args = parser.parse_args(argv)
+
+    print(f"{'lang':<6}{'mode':<10}{'numbers':>10}{'num2words us':>14}{'native us':>11}{'speedup':>9}")
+    for lang in LANGS:
+        speller = importlib.import_module(f"app.normalizers.{lang}.speller")
+        values = numbers(speller.LIMIT, args.dense, args.sampled, args.seed)
+        for mode, spell in speller.SPELLERS.items():
+            timed = values[::max(len(values) // 100_000, 1)]
+            reference = per_number_us(lambda n: _num2words(lang, mode, n), timed)
+            native = per_number_us(spell, timed)
+            print(f"{lang:<6}{mode:<10}{len(values):>10}{reference:>14.2f}{native:>11.2f}{reference / native:>8.1f}x")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,172 @@
+"""
+Times every handler in isolation and every full strategy, per language, on
+the corpora from `benchmarks.corpora`, and compares runs against a baseline.
+
+    python -m benchmarks.suite run --output baseline.json    # e.g. on main
+    python -m benchmarks.suite run --output current.json     # on your branch
+    python -m benchmarks.suite compare baseline.json current.json --threshold 0.1
+
+A handler is timed as the chain runs it (`apply_triggered`) on the raw
+corpus, and a strategy once per engine. Each case is the best of `--repeat`
+rounds; a round passes over the whole corpus as many times as it takes to
+last at least MIN_ROUND_SECONDS, after one warmup pass. `compare` exits
+with status 1 if any case got slower than the threshold allows.
+"""
+import argparse
+import importlib
+import json
+import logging
+import platform
+import statistics
+import sys
+import time
+from datetime import datetime, timezone
+from typing import Any, Callable, Dict, List, Optional
+
+from app.normalizers.base import NormalizerStrategy
+from benchmarks.corpora import corpora
+
+LANGUAGES = ("sr", "en", "de")
+ENGINES = ("chain", "single_pass", "spans")
+MIN_ROUND_SECONDS = 0.05
+
+STRATEGIES = {
+    "sr": "app.normalizers.sr.strategy.SerbianNormalizerStrategy",
+    "en": "app.normalizers.en.strategy.EnglishNormalizerStrategy",
+    "de": "app.normalizers.de.strategy.GermanNormalizerStrategy",
+}
+
+
+def _strategy_class(lang: str):
+    module_name, class_name = STRATEGIES[lang].rsplit(".", 1)
+    return getattr(importlib.import_module(module_name), class_name)
+
+
+def _time_passes(fn: Callable[[str], str], texts: List[str], passes: int) -> float:
+    start = time.perf_counter()
+    for _ in range(passes):
+        for text in texts:
+            fn(text)
+    return time.perf_counter() - start
+
+
+def time_case(fn: Callable[[str], str], texts: List[str], repeat: int) -> Dict[str, Any]:
+    """Returns the best and median time of one pass of fn over all texts."""
+    passes = 1
+    while _time_passes(fn, texts, passes) < MIN_ROUND_SECONDS:
+        passes *= 2
+    rounds = [_time_passes(fn, texts, passes) / passes for _ in range(repeat)]
+    best = min(rounds)
+    chars = sum(len(text) for text in texts)
+    return {
+        "texts": len(texts),
+        "chars": chars,
+        "best_s": best,
+        "median_s": statistics.median(rounds),
+        "us_per_kchar": best / chars * 1e9,
+    }
+
+
+def run(languages: List[str], repeat: int, only: Optional[str] = None) -> Dict[str, Any]:
+    """Times all cases and returns the results document; `only` filters cases by substring."""
+    results: Dict[str, Dict[str, Any]] = {}
+    # Handlers log every match they cannot convert, which would swamp the output.
+    logging.disable(logging.WARNING)
+    for lang in languages:
+        strategy_class = _strategy_class(lang)
+        targets: Dict[str, Callable[[str], str]] = {}
+        for engine in ENGINES:
+            strategy: NormalizerStrategy = strategy_class(engine=engine)
+            targets[f"strategy[{engine}]"] = strategy.normalize
+        for handler in strategy._chain_head.iter_chain():
+            targets[type(handler).__name__] = handler.apply_triggered
+
+        for corpus_name, texts in corpora(lang).items():
+            for target, fn in targets.items():
+                case = f"{lang}/{target}/{corpus_name}"
+                if only and only not in case:
+                    continue
+                results[case] = time_case(fn, texts, repeat)
+                print(f"{case:<60}{results[case]['us_per_kchar']:>12.1f} µs/kchar", file=sys.stderr)
+
+    return {
+        "meta": {
+            "created": datetime.now(timezone.utc).isoformat(timespec="seconds"),
+            "python": platform.python_version(),
+            "platform": platform.platform(),
+            "repeat": repeat,
+        },
+        "results": results,
+    }
+
+
+def compare(baseline: Dict[str, Any], current: Dict[str, Any], threshold: float) -> List[str]:
+    """
+    Prints each shared case's change in best time and returns the cases that
+    got slower by more than `threshold` (a fraction, e.g. 0.1 for 10%).
+    """
+    for key in ("python", "platform"):
+        if baseline["meta"].get(key) != current["meta"].get(key):
+            print(f"warning: {key} differs ({baseline['meta'].get(key)} vs {current['meta'].get(key)}); "
+                  f"timings may not be comparable.")
+
+    old, new = baseline["results"], current["results"]
+    regressions = []
+    rows = []
+    for case in sorted(old.keys() & new.keys()):
+        ratio = new[case]["best_s"] / old[case]["best_s"]
+        if ratio > 1 + threshold:
+            status = "SLOWER"
+            regressions.append(case)
+        elif ratio < 1 - threshold:
+            status = "faster"
+        else:
+            status = ""
+        rows.append((ratio, case, status))
+
+    print(f"{'case':<60}{'baseline µs':>14}{'current µs':>14}{'change':>10}")
+    for ratio, case, status in sorted(rows, reverse=True):
+        print(f"{case:<60}{old[case]['best_s'] * 1e6:>14.0f}{new[case]['best_s'] * 1e6:>14.0f}"
+              f"{(ratio - 1) * 100:>+9.1f}% {status}")
+    for case in sorted(old.keys() - new.keys()):
+        print(f"{case:<60} missing from the current run")
+    for case in sorted(new.keys() - old.keys()):
+        print(f"{case:<60} new, no baseline")
+
+    print(f"\n{len(regressions)} of {len(rows)} cases slower by more than {threshold:.0%}.")
+    return regressions
+
+
+def main(argv: Optional[List[str]] = None) -> None:
+    parser = argparse.ArgumentParser(description="Handler and strategy benchmarks.")
+    commands = parser.add_subparsers(dest="command", required=True)
+
+    run_parser = commands.add_parser("run", help="Time all cases and write the results as JSON.")
+    run_parser.add_argument("--output", "-o", default="benchmark.json", help="Where to write the results.")
+    run_parser.add_argument("--lang", action="append", choices=LANGUAGES, help="Limit to a language (repeatable).")
+    run_parser.add_argument("--repeat", type=int, default=5, help="Timed rounds per case.")
+    run_parser.add_argument("--only", help="Only run cases whose name contains this string.")
+
+    compare_parser = commands.add_parser("compare", help="Compare a run against a baseline.")
+    compare_parser.add_argument("baseline")
+    compare_parser.add_argument("current")
+    compare_parser.add_argument("--threshold", type=float, default=0.1,
+                                help="Allowed slowdown as a fraction (default 0.1).")
+    args = parser.parse_args(argv)
+
+    if args.command == "run":
+        document = run(args.lang or list(LANGUAGES), args.repeat, args.only)
+        with open(args.output, "w", encoding="utf-8") as f:
+            json.dump(document, f, indent=2, ensure_ascii=False)
+        print(f"Wrote {len(document['results'])} cases to {args.output}.")
+    else:
+        with open(args.baseline, encoding="utf-8") as f:
+            baseline = json.load(f)
+        with open(args.current, encoding="utf-8") as f:
+            current = json.load(f)
+        if compare(baseline, current, args.threshold):
+            sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
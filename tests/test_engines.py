@@ -0,0 +1,26 @@
+import importlib
+
+import pytest
+
+from benchmarks.corpora import corpora
+from benchmarks.suite import LANGUAGES, STRATEGIES
+
+
+def _strategy(lang, engine):
+    module_name, class_name = STRATEGIES[lang].rsplit(".", 1)
+    return getattr(importlib.import_module(module_name), class_name)(engine=engine)
+
+
+@pytest.mark.parametrize("lang", LANGUAGES)
+def test_single_pass_matches_chain(lang):
+    """The single-pass engine gives the chain's output and runs and skips the same handlers."""
+    chain, single_pass = _strategy(lang, "chain"), _strategy(lang, "single_pass")
+    texts = [text for corpus in corpora(lang).values() for text in corpus]
+    mismatches = [
+        (text, expected, result)
+        for text in texts
+        if (result := single_pass.normalize(text)) != (expected := chain.normalize(text))
+    ]
+    assert mismatches[:3] == []
+    runs = {name: stats[:2] for name, stats in chain.handler_stats().items()}
+    assert {name: stats[:2] for name, stats in single_pass.handler_stats().items()} == runs
@@ -0,0 +1,9 @@
+import pytest
+
+from benchmarks.import_time import TARGETS, forbidden_imports
+
+
+@pytest.mark.parametrize("name", sorted(TARGETS))
+def test_imports_nothing_forbidden(name):
+    """The server imports no strategy or num2words; a strategy imports no other language's modules."""
+    assert forbidden_imports(TARGETS[name]) == []
@@ -0,0 +1,41 @@
+import fcntl
+import multiprocessing
+import os
+import time
+
+import pytest
+
+from app.core.shared_cache import SharedResultCache
+
+OLD = b"old rulesets".ljust(16, b"\0")
+NEW = b"new rulesets".ljust(16, b"\0")
+GEOMETRY = {"max_bytes": 64 * 1024, "slot_bytes": 256, "ttl": 0}
+
+
+def _put(path, text):
+    cache = SharedResultCache(path, fingerprint=NEW, **GEOMETRY)
+    cache.put(SharedResultCache.key("sr", "v", text), text.upper())
+    cache.close()
+
+
+@pytest.mark.skipif(not hasattr(os, "fork"), reason="needs fork")
+def test_processes_replacing_a_stale_file_end_up_sharing_one(tmp_path):
+    """Two processes that start against a file of old rulesets both write to the file that replaces it."""
+    path = str(tmp_path / "cache")
+    SharedResultCache(path, fingerprint=OLD, **GEOMETRY).close()
+    # Both workers open the stale file and wait for its lock, as after a deploy.
+    fd = os.open(path, os.O_RDWR)
+    fcntl.flock(fd, fcntl.LOCK_EX)
+    context = multiprocessing.get_context("fork")
+    workers = [context.Process(target=_put, args=(path, text)) for text in ("prvi", "drugi")]
+    for worker in workers:
+        worker.start()
+    time.sleep(0.5)
+    os.close(fd)
+    for worker in workers:
+        worker.join(timeout=30)
+        assert worker.exitcode == 0
+
+    cache = SharedResultCache(path, fingerprint=NEW, **GEOMETRY)
+    assert [cache.get(SharedResultCache.key("sr", "v", text)) for text in ("prvi", "drugi")] == ["PRVI", "DRUGI"]
+    assert not any(name.endswith(".tmp") for name in os.listdir(tmp_path))
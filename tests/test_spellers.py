@@ -0,0 +1,29 @@
+import importlib
+
+import pytest
+
+from app.normalizers.number_words import _num2words
+from benchmarks.spellers import LANGS, numbers
+
+# Every int below DENSE, and SAMPLED seeded random ints of every magnitude up to the speller's limit.
+DENSE = 10_000
+SAMPLED = 5_000
+
+CASES = [
+    (lang, mode)
+    for lang in LANGS
+    for mode in importlib.import_module(f"app.normalizers.{lang}.speller").SPELLERS
+]
+
+
+@pytest.mark.parametrize("lang, mode", CASES)
+def test_speller_matches_num2words(lang, mode):
+    """The native speller spells exactly what num2words with the fixups spells."""
+    speller = importlib.import_module(f"app.normalizers.{lang}.speller")
+    spell = speller.SPELLERS[mode]
+    mismatches = [
+        (n, spell(n), expected)
+        for n in numbers(speller.LIMIT, DENSE, SAMPLED, seed=0)
+        if spell(n) != (expected := _num2words(lang, mode, n))
+    ]
+    assert mismatches[:10] == []